@@ -0,0 +1,385 @@
+#!/usr/bin/env python3
+"""Code rights.
+
+Copyright IBM Corp 2026.
+catalog_crawler.py - keep an index of every cataloged data set, like the
+output of dlsall.sh, in a local SQLite database and look data sets up in it.
+
+A refresh runs IDCAMS LISTCAT for the master catalog and the user catalogs
+at the same time and parses every SYSPRINT as it is read. The entries go
+to the database in batches of BATCH_SIZE while the listing is parsed, so
+neither the listing nor the entries of a catalog are held in memory. Each
+entry becomes a (dsn, type, volser, catalog) row. With --incremental the
+record statistics of every catalog are taken first, in one IDCAMS run, and
+only catalogs whose statistics moved since the last refresh are listed
+again.
+
+Lookups use the index on the data set name: a pattern is searched from
+its part before the first wildcard, so HLQ.** or HLQ.*.LOAD take well
+under a millisecond. The wildcards are those of dls: % for one character,
+* for any characters within a qualifier and ** for any qualifiers.
+
+Usage: catalog_crawler.py --refresh [--incremental] [CATALOG...]
+       catalog_crawler.py PATTERN...
+"""
+import argparse
+import io
+import os
+import re
+import sys
+import time
+from contextlib import contextmanager
+from typing import NamedTuple, Optional
+
+import listcat
+
+CATALOG_INDEX = os.path.expanduser("~/.catalog_index.db")
+# Entries handed from a LISTCAT to the database at a time
+BATCH_SIZE = 1000
+# Batches of a catalog waiting for the database before its LISTCAT pauses
+_QUEUED_BATCHES = 4
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS catalogs (
+    name TEXT PRIMARY KEY, change_token TEXT, refreshed REAL, entries INTEGER);
+CREATE TABLE IF NOT EXISTS entries (
+    dsn TEXT, type TEXT, volser TEXT, catalog TEXT,
+    PRIMARY KEY (dsn, catalog)) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS entries_catalog ON entries (catalog);
+"""
+
+# The LISTCAT statistics that move whenever a record of the catalog changes
+_CHANGE_STATS = ("REC-TOTAL", "REC-UPDATED", "REC-INSERTED", "REC-DELETED")
+
+
+class CatalogEntry(NamedTuple):
+    """A data set (or other entry) in a catalog"""
+    dsn: str
+    entry_type: str
+    volser: Optional[str]
+    catalog: str
+
+
+def parse_listcat(lines, catalog):
+    """Yield a CatalogEntry for every entry in a LISTCAT listing
+
+    The volume of a cluster is that of its first DATA component, so a
+    cluster is yielded after its components.
+
+    Args:
+        lines (iterable): the lines of the IDCAMS SYSPRINT
+        catalog (str): the catalog that was listed
+    """
+    cluster = None
+    for entry in listcat.parse(lines, attributes=False):
+        if entry.entry_type not in listcat.COMPONENT_TYPES and cluster is not None:
+            yield cluster
+            cluster = None
+        found = CatalogEntry(entry.name, entry.entry_type, entry.volser, catalog)
+        if entry.entry_type in ("CLUSTER", "AIX"):
+            cluster = found
+            continue
+        if cluster is not None and cluster.volser is None and entry.entry_type == "DATA":
+            cluster = cluster._replace(volser=entry.volser)
+        yield found
+    if cluster is not None:
+        yield cluster
+
+
+@contextmanager
+def idcams(statements):
+    """Run IDCAMS authorized and yield its SYSPRINT lines and return code
+
+    Args:
+        statements (list): the IDCAMS commands, one per line
+
+    Yields:
+        tuple: (file of the SYSPRINT lines, return code); the lines are
+        empty if IDCAMS wrote no SYSPRINT, e.g. when it could not start
+    """
+    import tempfile
+    from zoautil_py import mvscmd
+    from zoautil_py.types import DDStatement, FileDefinition
+
+    directory = tempfile.mkdtemp(prefix="catalog_crawler.")
+    sysin = os.path.join(directory, "sysin")
+    sysprint = os.path.join(directory, "sysprint")
+    try:
+        with open(sysin, "w", encoding="cp1047") as file:
+            file.write("".join(f" {statement}\n" for statement in statements))
+        result = mvscmd.execute_authorized(
+            "IDCAMS",
+            dds=[DDStatement("SYSIN", FileDefinition(sysin)),
+                 DDStatement("SYSPRINT", FileDefinition(sysprint))],
+        ).to_dict()
+        if not os.path.exists(sysprint):
+            yield io.StringIO(), result["rc"]
+            return
+        with open(sysprint, encoding="cp1047", errors="replace") as listing:
+            yield listing, result["rc"]
+    finally:
+        for path in (sysin, sysprint):
+            if os.path.exists(path):
+                os.remove(path)
+        os.rmdir(directory)
+
+
+def list_catalogs():
+    """Return the master catalog and the user catalogs connected to it"""
+    master = None
+    catalogs = []
+    with idcams(["LISTCAT USERCATALOG"]) as (listing, _):
+        for line in listing:
+            found = listcat.LISTING_FROM.search(line)
+            if found:
+                master = found.group(1)
+                break
+        listing.seek(0)
+        catalogs = [entry.name for entry in listcat.parse(listing, attributes=False)
+                    if entry.entry_type == "USERCATALOG"]
+    return master, catalogs
+
+
+def change_tokens(catalogs):
+    """Return the LISTCAT record statistics of every catalog as a string
+
+    All catalogs are listed in one IDCAMS run. A catalog that LISTCAT
+    reports no statistics for gets None, so it is always listed again.
+    """
+    stats = {catalog: [] for catalog in catalogs}
+    with idcams([f"LISTCAT ENTRIES('{catalog}') ALL" for catalog in catalogs]) as (listing, _):
+        for entry in listcat.parse(listing):
+            # the statistics are those of the DATA component of the catalog
+            catalog = entry.cluster or entry.name
+            if catalog in stats:
+                stats[catalog] += [f"{key}={entry.attributes[key]}"
+                                   for key in _CHANGE_STATS if key in entry.attributes]
+    return {catalog: " ".join(values) or None for catalog, values in stats.items()}
+
+
+def list_catalog(catalog):
+    """Yield the IDCAMS return code of a LISTCAT of a catalog, then its entries
+
+    No entries are yielded if the return code is above 4.
+    """
+    with idcams([f"LISTCAT CATALOG('{catalog}') VOLUME"]) as (listing, rc):
+        yield rc
+        if rc <= 4:
+            for entry in parse_listcat(listing, catalog):
+                if entry.entry_type not in listcat.COMPONENT_TYPES:
+                    yield entry
+
+
+def _queue_catalog(catalog, batches, stopped):
+    """Put what list_catalog yields on batches, the entries a list at a time
+
+    None is put after the last batch, or an exception if the listing
+    failed. The listing stops early when stopped is set, e.g. because
+    storing an earlier catalog failed.
+    """
+    import queue
+
+    def put(item):
+        while not stopped.is_set():
+            try:
+                batches.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    try:
+        listing = list_catalog(catalog)
+        if not put(next(listing)):
+            return
+        batch = []
+        for entry in listing:
+            batch.append(entry)
+            if len(batch) >= BATCH_SIZE:
+                if not put(batch):
+                    return
+                batch = []
+        if not batch or put(batch):
+            put(None)
+    except Exception as error:
+        put(error)
+
+
+def _queued_entries(batches):
+    """Yield the entries _queue_catalog puts on batches after the rc"""
+    while True:
+        item = batches.get()
+        if isinstance(item, Exception):
+            raise item
+        if item is None:
+            return
+        yield from item
+
+
+def _pattern_regex(pattern):
+    """Return the regex for a dls pattern, and the part before its first wildcard"""
+    prefix = re.split(r"[*%]", pattern, maxsplit=1)[0]
+    regex = ""
+    for token in re.findall(r"\*\*|\*|%|[^*%]+", pattern):
+        regex += {"**": ".*", "*": "[^.]*", "%": "[^.]"}.get(token) or re.escape(token)
+    return prefix, re.compile(regex + "$")
+
+
+class CatalogIndex:
+    """The SQLite database with the entries of every catalog"""
+
+    def __init__(self, path=CATALOG_INDEX):
+        import sqlite3
+
+        self.connection = sqlite3.connect(path)
+        # the index can be rebuilt from the catalogs, so trade durability for speed
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.executescript(_SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        self.connection.close()
+
+    def change_tokens(self):
+        """Return catalog -> change token of its last refresh"""
+        return dict(self.connection.execute("SELECT name, change_token FROM catalogs"))
+
+    def replace(self, catalog, entries, change_token=None):
+        """Replace the entries of a catalog in one transaction
+
+        Args:
+            catalog (str): the catalog
+            entries (iterable): its CatalogEntry tuples, e.g. a generator;
+                if it raises, the catalog keeps its old entries
+            change_token (str): see change_tokens
+
+        Returns:
+            int: the number of entries stored
+        """
+        count = 0
+
+        def counted():
+            nonlocal count
+            for entry in entries:
+                count += 1
+                yield entry
+
+        with self.connection:
+            self.connection.execute("DELETE FROM entries WHERE catalog = ?", (catalog,))
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?)", counted())
+            self.connection.execute(
+                "INSERT OR REPLACE INTO catalogs VALUES (?, ?, ?, ?)",
+                (catalog, change_token, time.time(), count))
+        return count
+
+    def lookup(self, pattern):
+        """Return the CatalogEntry of every data set that matches a dls pattern"""
+        prefix, regex = _pattern_regex(pattern.upper())
+        if prefix:
+            # every name that starts with prefix sorts between it and the
+            # prefix with its last character incremented
+            upper = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+            rows = self.connection.execute(
+                "SELECT dsn, type, volser, catalog FROM entries"
+                " WHERE dsn >= ? AND dsn < ? ORDER BY dsn", (prefix, upper))
+        else:
+            rows = self.connection.execute(
+                "SELECT dsn, type, volser, catalog FROM entries ORDER BY dsn")
+        return [CatalogEntry(*row) for row in rows if regex.match(row[0])]
+
+
+def refresh(index, catalogs=None, workers=8, incremental=False):
+    """List catalogs concurrently and store their entries in the index
+
+    Args:
+        index (CatalogIndex): where to store the entries
+        catalogs (list): the catalogs, default the master and all user catalogs
+        workers (int): the number of LISTCATs run at the same time
+        incremental (bool): only list catalogs whose statistics changed
+
+    Returns:
+        dict: catalog -> (number of entries, IDCAMS return code) for every
+        catalog that was listed, 0 entries if the return code is above 4
+    """
+    import queue
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+
+    if not catalogs:
+        master, user_catalogs = list_catalogs()
+        catalogs = [catalog for catalog in [master] + user_catalogs if catalog]
+    tokens = change_tokens(catalogs)
+    if incremental:
+        known = index.change_tokens()
+        catalogs = [catalog for catalog in catalogs
+                    if tokens[catalog] is None or known.get(catalog) != tokens[catalog]]
+
+    # the LISTCATs run in worker threads and hand their entries over in
+    # batches, while this thread stores one catalog after the other, since
+    # the SQLite connection cannot be shared between threads
+    listed = {}
+    stopped = threading.Event()
+    queues = {catalog: queue.Queue(_QUEUED_BATCHES) for catalog in catalogs}
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for catalog in catalogs:
+            executor.submit(_queue_catalog, catalog, queues[catalog], stopped)
+        try:
+            for catalog in catalogs:
+                rc = queues[catalog].get()
+                if isinstance(rc, Exception):
+                    raise rc
+                count = 0
+                if rc <= 4:
+                    count = index.replace(catalog, _queued_entries(queues[catalog]),
+                                          tokens[catalog])
+                listed[catalog] = (count, rc)
+        finally:
+            stopped.set()
+    return listed
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Index the entries of all catalogs and look up data sets in the index."
+    )
+    parser.add_argument("names", nargs="*", metavar="PATTERN",
+                        help="data set patterns to look up, or the catalogs to refresh")
+    parser.add_argument("-r", "--refresh", action="store_true",
+                        help="list the catalogs (default all) and update the index")
+    parser.add_argument("-i", "--incremental", action="store_true",
+                        help="with --refresh, only list catalogs that changed")
+    parser.add_argument("-w", "--workers", type=int, default=8,
+                        help="number of catalogs listed at the same time")
+    parser.add_argument("-d", "--database", default=CATALOG_INDEX,
+                        help=f"the index, default {CATALOG_INDEX}")
+    args = parser.parse_args()
+
+    rc = 0
+    with CatalogIndex(args.database) as index:
+        if args.refresh:
+            listed = refresh(index, [name.upper() for name in args.names],
+                             max(1, args.workers), args.incremental)
+            for catalog, (count, listcat_rc) in listed.items():
+                print(f"{catalog}: {count} entries" if listcat_rc <= 4
+                      else f"{catalog}: LISTCAT failed with rc {listcat_rc}")
+                rc = max(rc, listcat_rc)
+            if not listed:
+                print("No catalog changed")
+        else:
+            if not args.names:
+                parser.error("give a pattern to look up, or --refresh")
+            for pattern in args.names:
+                for entry in index.lookup(pattern):
+                    print(f"{entry.dsn} {entry.entry_type} {entry.volser or '-'} {entry.catalog}")
+    sys.exit(rc)
+
+
+if __name__ == "__main__":
+    main()
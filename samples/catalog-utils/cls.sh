@@ -41,5 +41,4 @@ if [ $# -ne 0 ]; then
 fi
 
 master=$(./pmc)
-catalogs=$(pcatalog "$master" | awk '/CATALOG/ { print $2; }')
-echo "$catalogs"
+pcatalog -n -t USERCATALOG "$master"
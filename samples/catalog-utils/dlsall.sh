@@ -47,7 +47,7 @@ if [ $# -ne 0 ]; then
 fi
 
 master=$(pmc)
-catalogs=$(pcatalog "$master" | awk '/CATALOG/ { print $2; }')
+catalogs=$(pcatalog -n -t USERCATALOG "$master")
 if [ $debug = 1 ]; then
 	echo "Master Catalog: $master"
 fi
@@ -55,5 +55,5 @@ for catalog in ${catalogs}; do
 	if [ $debug = 1 ]; then
 		echo "Catalog: $catalog"
 	fi
-	pcatalog "$catalog" | awk '/ALIAS/ { next } /CATALOG/ { next } // { print $1 " " $2; }'
+	pcatalog -x ALIAS,USERCATALOG "$catalog"
 done
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""Code rights.
+
+Copyright IBM Corp 2026.
+listcat.py - parse the SYSPRINT of IDCAMS LISTCAT into one record per
+catalog entry, for pcatalog.sh, cls.sh, dlsall.sh and catalog_crawler.py.
+
+The listing is read line by line and every entry is yielded as soon as the
+next one starts, so memory does not grow with the size of the listing. An
+entry starts at its header line, e.g.
+
+    0NONVSAM ------- SYS1.PARMLIB
+    0   DATA ------- USER.KSDS.DATA
+    0GDG BASE ------ USER.GDG
+
+and is recognized by the entry type in that position only, so a data set
+or attribute that happens to contain CATALOG or ALIAS is not mistaken for
+an entry. The KEY-----VALUE pairs under the header become the attributes
+of the entry (the first value of a key wins), the volume serials of all
+VOLSER pairs its volumes, and the pairs under ASSOCIATIONS its
+associations. The flags without a value, e.g. RECOVERY or INDEXED under
+ATTRIBUTES, are attributes with the value True.
+
+Usage: listcat.py [-t TYPES] [-x TYPES] [-f FIELDS | -n] [SYSPRINT]
+       echo " LISTCAT CATALOG('CATALOG.UCAT1') VOLUME" |
+           mvscmdauth --pgm=IDCAMS --sysprint=* --sysin=stdin | listcat.py -n -t NONVSAM
+"""
+import argparse
+import re
+import sys
+from typing import NamedTuple, Optional
+
+ENTRY_TYPES = ("NONVSAM", "CLUSTER", "DATA", "INDEX", "AIX", "PATH", "ALIAS",
+               "USERCATALOG", "GDG", "PAGESPACE")
+# The entries that belong to the cluster or alternate index before them
+COMPONENT_TYPES = ("DATA", "INDEX")
+FIELDS = ("type", "name", "volser", "catalog", "cluster")
+
+# 0NONVSAM ------- SYS1.PARMLIB, indented for the components of a cluster
+_ENTRY_HEADER = re.compile(
+    r"[01 ]?\s*0?(NONVSAM|CLUSTER|DATA|INDEX|AIX|PATH|ALIAS|USERCATALOG|GDG BASE"
+    r"|PAGESPACE) -+ (\S+)"
+)
+LISTING_FROM = re.compile(r"LISTING FROM CATALOG -+ (\S+)")
+# KEY-----VALUE, also KEY ---VALUE and IN-CAT --- VALUE
+_ATTRIBUTE = re.compile(r"([A-Z][A-Z0-9/&()-]*?) ?-{2,} ?(\S+)")
+_SECTIONS = frozenset(("HISTORY", "SMSDATA", "RLSDATA", "ENCRYPTIONDATA", "VOLUMES",
+                       "VOLUME", "ASSOCIATIONS", "ATTRIBUTES", "STATISTICS", "ALLOCATION",
+                       "PROTECTION"))
+# The totals at the end of every LISTCAT, which look like attributes
+_SUMMARY = "THE NUMBER OF ENTRIES PROCESSED WAS"
+
+
+class ListcatEntry(NamedTuple):
+    """An entry of a LISTCAT listing
+
+    Attributes:
+        entry_type (str): one of ENTRY_TYPES
+        name (str): the name of the entry
+        catalog (str): the catalog it is listed from, None if not printed
+        cluster (str): for DATA and INDEX, the cluster or AIX they belong to
+        volumes (tuple): the volume serials, in the order they are listed
+        attributes (dict): KEY -> value, or True for a flag
+        associations (tuple): the (type, name) of every association
+    """
+    entry_type: str
+    name: str
+    catalog: Optional[str] = None
+    cluster: Optional[str] = None
+    volumes: tuple = ()
+    attributes: dict = {}
+    associations: tuple = ()
+
+    @property
+    def volser(self):
+        """The first volume serial, or None"""
+        return self.volumes[0] if self.volumes else None
+
+    def field(self, name):
+        """Return a field of FIELDS or an attribute, None if there is none"""
+        if name == "type":
+            return self.entry_type
+        if name in FIELDS:
+            return getattr(self, name)
+        return self.attributes.get(name.upper())
+
+
+def parse(lines, attributes=True):
+    """Yield a ListcatEntry for every entry in a LISTCAT listing
+
+    Args:
+        lines (iterable): the lines of the IDCAMS SYSPRINT, e.g. an open file
+        attributes (bool): parse attributes and associations too; without
+            them only the volumes are taken, which is several times faster
+
+    Yields:
+        ListcatEntry: the entries in the order they are listed
+    """
+    header_match = _ENTRY_HEADER.match
+    attribute_pairs = _ATTRIBUTE.findall
+    catalog = None
+    cluster = None
+    # the entry being read: its header fields, volumes, attributes and associations
+    entry = None
+    volumes = []
+    values = {}
+    associations = []
+    section = None
+
+    for line in lines:
+        header = header_match(line)
+        if header is not None:
+            if entry is not None:
+                yield ListcatEntry(*entry, tuple(volumes), values, tuple(associations))
+            entry_type, name = header.groups()
+            if entry_type == "GDG BASE":
+                entry_type = "GDG"
+            if entry_type in COMPONENT_TYPES:
+                entry = (entry_type, name, catalog, cluster)
+            else:
+                cluster = name if entry_type in ("CLUSTER", "AIX") else None
+                entry = (entry_type, name, catalog, None)
+            volumes = []
+            values = {}
+            associations = []
+            section = None
+            continue
+        if "FROM CATALOG" in line:
+            # printed at the top of every page
+            listing = LISTING_FROM.search(line)
+            if listing is not None:
+                catalog = listing.group(1)
+                if entry is not None and entry[2] is None:
+                    entry = entry[:2] + (catalog,) + entry[3:]
+            continue
+        if entry is None:
+            continue
+        if _SUMMARY in line:
+            yield ListcatEntry(*entry, tuple(volumes), values, tuple(associations))
+            entry = None
+            cluster = None
+            continue
+        if not attributes:
+            if "VOLSER" in line:
+                volumes += [value for key, value in attribute_pairs(line) if key == "VOLSER"]
+            continue
+
+        if line[:1] == "1":
+            # the page header, e.g. 1IDCAMS  SYSTEM SERVICES  TIME: 10:21:04
+            continue
+        pairs = attribute_pairs(line)
+        if not pairs:
+            words = line.split()
+            if len(words) == 1 and words[0] in _SECTIONS:
+                section = words[0]
+                continue
+        if section == "ATTRIBUTES":
+            for word in _ATTRIBUTE.sub(" ", line).split():
+                values.setdefault(word, True)
+        for key, value in pairs:
+            if key == "VOLSER":
+                volumes.append(value)
+            elif section == "ASSOCIATIONS" and key != "ASSOCIATIONS":
+                associations.append((key, value))
+            elif key not in values:
+                values[key] = value
+            if key in _SECTIONS:
+                # e.g. ASSOCIATIONS--------(NULL)
+                section = key
+    if entry is not None:
+        yield ListcatEntry(*entry, tuple(volumes), values, tuple(associations))
+
+
+def _types(text):
+    """Return the set of entry types in a comma separated list"""
+    types = {name.strip().upper() for name in text.split(",") if name.strip()}
+    unknown = types - set(ENTRY_TYPES)
+    if unknown:
+        raise argparse.ArgumentTypeError(
+            f"unknown entry types {', '.join(sorted(unknown))}; use {', '.join(ENTRY_TYPES)}")
+    return types
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Print the entries of an IDCAMS LISTCAT listing, one per line."
+    )
+    parser.add_argument("sysprint", nargs="?", default="-",
+                        help="the IDCAMS SYSPRINT, default standard input")
+    parser.add_argument("-t", "--types", type=_types,
+                        help="only print entries of these types, e.g. NONVSAM,GDG")
+    parser.add_argument("-x", "--exclude", type=_types, default=set(),
+                        help="do not print entries of these types, e.g. ALIAS,USERCATALOG")
+    parser.add_argument("-f", "--fields", default="type,name",
+                        help=f"the fields to print: {', '.join(FIELDS)} or any attribute, "
+                        "e.g. type,name,volser,CREATION (default type,name)")
+    parser.add_argument("-n", "--names", action="store_true",
+                        help="only print the names, like -f name")
+    args = parser.parse_args()
+
+    fields = ["name"] if args.names else [name.strip() for name in args.fields.split(",")]
+    # the volumes are enough for the fields of FIELDS
+    with_attributes = any(name not in FIELDS for name in fields)
+    listing = sys.stdin if args.sysprint == "-" else open(args.sysprint, errors="replace")
+    try:
+        with listing:
+            for entry in parse(listing, with_attributes):
+                if entry.entry_type in args.exclude or \
+                        (args.types and entry.entry_type not in args.types):
+                    continue
+                values = (entry.field(name) for name in fields)
+                print(" ".join("-" if value is None else str(value) for value in values))
+    except BrokenPipeError:
+        # e.g. piped into head
+        sys.stderr.close()
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
@@ -23,15 +23,29 @@
 syntax() {
 	echo "pcatalog: print a catalog of all entries" >&2
 	echo "Syntax: " >&2
-	echo ' pcatalog [-?h] <catalog dataset>' >&2
+	echo ' pcatalog [-?hn] [-t <types>] [-x <types>] <catalog dataset>' >&2
 	echo 'Options are:' >&2
 	echo ' -? : syntax' >&2
+	echo ' -n : only print the entry names' >&2
+	echo ' -t : only print entries of these types, e.g. NONVSAM,GDG' >&2
+	echo ' -x : do not print entries of these types, e.g. ALIAS,USERCATALOG' >&2
 	echo '  Example: pcatalog `pmc` <-- print the master catalog' >&2
 }
 
-while getopts ":h" opt; do
+mydir=$(dirname "$0")
+options=''
+while getopts ":hnt:x:" opt; do
   case ${opt} in
-    \? | h )
+    n )
+      options="${options} -n"
+      ;;
+    t )
+      options="${options} -t ${OPTARG}"
+      ;;
+    x )
+      options="${options} -x ${OPTARG}"
+      ;;
+    \? | h | : )
       syntax
       exit 4
       ;;
@@ -40,7 +54,7 @@ done
 
 shift $(( OPTIND - 1 ))
 if [ $# -ne 1 ]; then
-	echo 'Syntax: pcatalog <catalog>'
+	echo 'Syntax: pcatalog [-n] [-t <types>] [-x <types>] <catalog>'
 	exit 16
 fi
 
@@ -48,6 +62,6 @@ catalog=$(echo "$1" | tr '[:lower:]' '[:upper:]')
 
 input=" LISTCAT CATALOG('$catalog') VOLUME"
 
-output=$(echo "$input" | mvscmdauth --pgm=IDCAMS --sysprint=* --sysin=stdin)
-echo "$output" | dsfilter
-exit 0
+# listcat.py reads the listing as IDCAMS writes it and prints one line per entry
+# shellcheck disable=SC2086
+echo "$input" | mvscmdauth --pgm=IDCAMS --sysprint=* --sysin=stdin | python3 "${mydir}/listcat.py" ${options}
@@ -14,9 +14,16 @@
 #     ./console.sh MQ01
 #      !MQ01> START QMGR
 #
+# If ZOAUD_SOCKET names the socket of a running zoaud.py, the commands are
+# issued through it instead of starting opercmd for every command.
+#
 # Copyright IBM Corp. 2021
 #
 
+. "$(dirname "$0")/zoau_session.sh"
+zoau_session_start
+trap zoau_session_end EXIT
+
 if [ -z "$1" ]
 then
     prefix="opercmd"
@@ -28,5 +35,5 @@ fi
 while true
 do
     read -p "$prefix:> "
-    opercmd "${ssid} $REPLY"
+    zoau_call opercmd "${ssid} $REPLY"
 done
\ No newline at end of file
@@ -3,9 +3,231 @@
 
 Copyright IBM Corp 2023.
 create_sysin.py - standard routine for creating a sysin file that can be used
-as input to an MVS program
+as input to an MVS program. sysin_file provides the input through a pipe
+instead, so nothing has to be written to disk. encode_cards and write_cards
+build fixed 80 column card images for large decks.
 """
+import itertools
+import os
 import sys
+import threading
+from contextlib import contextmanager
+
+# Makes the names of pipes and files unique within this process
+_sequence = itertools.count()
+# Input lines fill at most columns 1-72 of a card, 73-80 are for sequence numbers
+CARD_COLUMNS = 72
+
+
+class CardImageError(Exception):
+    """Input lines that do not fit the card image rules
+
+    The violations attribute holds a (line number, line, reason) tuple for
+    every line that failed, so all of them can be fixed in one go.
+    """
+
+    def __init__(self, violations):
+        self.violations = violations
+        details = "\n".join(
+            f"line {number}: {reason}: {line}" for number, line, reason in violations
+        )
+        super().__init__(f"{len(violations)} input line(s) are not valid cards\n{details}")
+
+
+def _check_encoding(inputdata, codepage):
+    """Return a violation for every line that cannot be encoded in codepage"""
+    violations = []
+    for number, listitem in enumerate(inputdata, start=1):
+        try:
+            listitem.encode(codepage)
+        except UnicodeEncodeError as error:
+            violations.append(
+                (number, listitem, f"{listitem[error.start]!r} is not in {codepage}")
+            )
+    return violations
+
+
+def _check_length(inputdata):
+    """Raise a CardImageError for every line longer than CARD_COLUMNS"""
+    violations = [
+        (number, listitem,
+         f"Input lines must be {CARD_COLUMNS} chars or fewer, length: {len(listitem)}")
+        for number, listitem in enumerate(inputdata, start=1)
+        if len(listitem) > CARD_COLUMNS
+    ]
+    if violations:
+        raise CardImageError(violations)
+
+
+def _encode_input(inputdata, codepage):
+    """Turn the input lines into the bytes of a sysin file
+
+    Args:
+         inputdata: the data (as a list of strings) that will be in the file
+         codepage:  the code page to encode the data in
+
+    Returns:
+         the encoded bytes
+    """
+    if len(inputdata) == 0:
+        return " ".encode(codepage)
+    _check_length(inputdata)
+    return "".join(f"{listitem}\n" for listitem in inputdata).encode(codepage)
+
+
+def _continue_cards(listitem, continuation):
+    """Split a long line into a card and continuation cards
+
+    The first card holds columns 1-71 with the continuation character in
+    column 72. Continuation cards start in column 16.
+    """
+    cards = [listitem[:71] + continuation]
+    rest = listitem[71:]
+    while rest:
+        piece, rest = rest[:56], rest[56:]
+        cards.append((" " * 15 + piece).ljust(71) + (continuation if rest else " "))
+    return cards
+
+
+def encode_cards(inputdata, codepage="cp1047", sequence=False, sequence_start=10,
+                 sequence_step=10, continuation=None, newline=True):
+    """Encode input lines as fixed 80 column card images in one go
+
+    Every line is checked first and all problems are reported together in
+    a CardImageError. The cards are then padded to 80 columns, numbered,
+    joined and encoded with a single encode call.
+    Args:
+         inputdata:      the data (as a list of strings), one card per line
+         codepage:       the code page to encode the data in
+         sequence:       put sequence numbers in columns 73-80
+         sequence_start: the first sequence number
+         sequence_step:  the increment between sequence numbers
+         continuation:   a character to put in column 72 when a line does
+                         not fit in columns 1-71; the rest continues in
+                         column 16 of the next card. Without it, lines
+                         longer than 72 columns are errors, with or without
+                         sequence numbers.
+         newline:        end every card with a newline, as a z/OS UNIX
+                         text file needs; False gives plain 80 byte records
+
+    Returns:
+         the encoded bytes
+    """
+    if continuation is None:
+        _check_length(inputdata)
+        cards = inputdata
+    else:
+        cards = []
+        for listitem in inputdata:
+            if len(listitem) > CARD_COLUMNS - 1:
+                cards.extend(_continue_cards(listitem, continuation))
+            else:
+                cards.append(listitem)
+
+    if sequence:
+        last = sequence_start + sequence_step * (len(cards) - 1)
+        if last > 99999999:
+            raise CardImageError(
+                [(len(cards), "", f"Sequence number {last} does not fit in 8 columns")]
+            )
+        cards = [
+            "%-72s%08d" % card_and_number
+            for card_and_number in zip(cards, range(sequence_start, last + 1, sequence_step))
+        ]
+    else:
+        cards = [card.ljust(80) for card in cards]
+
+    end = "\n" if newline else ""
+    text = end.join(cards) + end
+    try:
+        return text.encode(codepage)
+    except UnicodeEncodeError:
+        raise CardImageError(_check_encoding(inputdata, codepage)) from None
+
+
+def _feed_pipe(pipename, data):
+    """Write data to a named pipe, waiting for a reader to open it"""
+    try:
+        with open(pipename, "wb") as pipe:
+            pipe.write(data)
+    except OSError:
+        # the reader went away, there is nobody left to tell
+        pass
+
+
+@contextmanager
+def sysin_file(inputdata, codepage="cp1047", use_pipe=True, directory=None,
+               prefix="sysin"):
+    """Provide input for a DD (SYSIN, SYSTSIN, ...) as a file name
+
+    By default the data is handed over through a named pipe. A thread
+    writes it as soon as the program opens the DD, so the data never
+    lands on disk. If pipes are not available, or use_pipe is False
+    (for programs that read their input more than once), a uniquely named
+    temporary file is used instead. Either way the pipe or file is removed
+    when the with block ends.
+    Args:
+         inputdata: the data (as a list of strings) for the DD
+         codepage:  the code page to encode the data in
+         use_pipe:  False forces a temporary file
+         directory: where to create the pipe or file, defaults to the
+                    temporary directory
+         prefix:    start of the pipe or file name
+
+    Yields:
+         the path name to put in a FileDefinition
+    """
+    import tempfile
+
+    data = _encode_input(inputdata, codepage)
+    if directory is None:
+        directory = tempfile.gettempdir()
+    pathname = os.path.join(
+        directory, f"{prefix}.{os.getpid()}.{next(_sequence)}"
+    )
+
+    writer = None
+    if use_pipe:
+        try:
+            os.mkfifo(pathname, 0o600)
+            writer = threading.Thread(target=_feed_pipe, args=(pathname, data),
+                                      daemon=True)
+            writer.start()
+        except (AttributeError, OSError):
+            writer = None
+
+    if writer is None:
+        fd, pathname = tempfile.mkstemp(prefix=f"{prefix}.", dir=directory)
+        with os.fdopen(fd, "wb") as sysin:
+            sysin.write(data)
+
+    try:
+        yield pathname
+    finally:
+        if writer is not None and writer.is_alive():
+            # The program never opened the DD. Open the read end so the
+            # writer can finish.
+            try:
+                reader = os.open(pathname, os.O_RDONLY | os.O_NONBLOCK)
+                writer.join(1)
+                os.close(reader)
+            except OSError:
+                pass
+        os.remove(pathname)
+
+
+def write_cards(inputdata, filename, codepage="cp1047", **card_options):
+    """Write input lines to a file as 80 column card images
+
+    The cards are built by encode_cards (see there for card_options) and
+    written with a single write.
+    Args:
+         inputdata: the data (as a list of strings) that will be in the file
+         filename:  the file that will hold the cards
+    """
+    data = encode_cards(inputdata, codepage, **card_options)
+    with open(filename, "wb") as sysin:
+        sysin.write(data)
 
 
 def create_sysin(inputdata, filename, codepage="cp1047"):
@@ -21,18 +243,9 @@ def create_sysin(inputdata, filename, codepage="cp1047"):
     """
     # Take the input data and put it into a file.
     # (make sure it's EBCDIC and less than 72 bytes)
-    if len(inputdata) > 0:
-        with open(filename, "w", encoding=codepage) as sysin:
-            for listitem in inputdata:
-                if len(listitem) > 72:
-                    raise Exception(
-                        f"Input lines must be 72 chars or fewer\n"
-                        f"{listitem} length: {len(listitem)}"
-                    )
-                sysin.write(f"{listitem}\n")
-    else:
-        with open(filename, "w", encoding=codepage) as sysin:
-            sysin.write(" ")
+    data = _encode_input(inputdata, codepage)
+    with open(filename, "wb") as sysin:
+        sysin.write(data)
 
 
 def main():
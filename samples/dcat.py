@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""Code rights.
+
+Copyright IBM Corp 2026.
+dcat.py - cat sequential data sets or PDS members, with wildcards in the
+data set and member names, like dcat.sh. The wildcards are expanded once,
+several members are read at the same time, and the output still comes in
+the order of the expanded names. Every member is read line by line by a
+cat process of its own, which reads ahead only until its pipe is full, so
+memory stays bounded however many members match and however large they are.
+
+Usage: dcat.py [-w WORKERS] [--header] [--prefix] [-g REGEX [-i]] PATTERN...
+       dcat.py 'USER.*.JCL(AB*)'
+"""
+import argparse
+import re
+import sys
+from collections import deque
+
+# Characters copied at a time when lines are neither filtered nor prefixed
+_CHUNK_SIZE = 64 * 1024
+
+
+def expand(pattern):
+    """Expand a data set pattern, with an optional member pattern
+
+    Args:
+        pattern (str): e.g. USER.*.JCL or USER.*.JCL(AB*)
+
+    Yields:
+        str: the names of the matching data sets or members
+    """
+    from zoautil_py import datasets
+
+    dataset_pattern, _, member_pattern = pattern.rstrip(")").partition("(")
+    for dataset in datasets.list_dataset_names(dataset_pattern):
+        if member_pattern:
+            for member in datasets.list_members(f"{dataset}({member_pattern})"):
+                yield f"{dataset}({member})"
+        else:
+            yield dataset
+
+
+class MemberStream:
+    """A data set or member that cat reads in a process of its own
+
+    cat is started when the stream is created, so streams that are
+    created ahead read their data set at the same time. cat blocks once
+    its pipe is full, so a stream never holds more than a pipe buffer.
+    """
+
+    def __init__(self, name):
+        import subprocess
+        import tempfile
+
+        self.name = name
+        # stderr goes to a file, a full stderr pipe would block cat while
+        # only stdout is read
+        self._errors = tempfile.TemporaryFile("w+", errors="replace")
+        self._process = subprocess.Popen(["cat", f"//'{name}'"], stdout=subprocess.PIPE,
+                                         stderr=self._errors, text=True, errors="replace")
+
+    def lines(self):
+        """Yield the lines, without their newline
+
+        Raises:
+            OSError: with the message of cat, after the last line, if it
+                cannot read the data set
+        """
+        for line in self._process.stdout:
+            yield line[:-1] if line.endswith("\n") else line
+        self._check()
+
+    def chunks(self, size=_CHUNK_SIZE):
+        """Yield the text in chunks of up to size characters, see lines"""
+        chunk = self._process.stdout.read(size)
+        while chunk:
+            yield chunk
+            chunk = self._process.stdout.read(size)
+        self._check()
+
+    def _check(self):
+        """Raise OSError with the message of cat if it failed"""
+        if self._process.wait() != 0:
+            self._errors.seek(0)
+            raise OSError(f"cat of {self.name} ended with rc {self._process.returncode}: "
+                          f"{self._errors.read().strip()}")
+
+    def close(self):
+        """Stop cat if it still runs and release the pipe and the error file"""
+        self._process.stdout.close()
+        if self._process.poll() is None:
+            self._process.terminate()
+        self._process.wait()
+        self._errors.close()
+
+
+def iter_dcat(names, workers=8, opener=MemberStream):
+    """Open the named data sets ahead and yield them in order
+
+    At most workers streams are open at a time: the one being read and
+    the ones after it. A stream is closed when the next one is asked for.
+
+    Args:
+        names (iterable): data set or member names, e.g. from expand()
+        workers (int): the number of members read at the same time
+        opener (function): opens one name, see MemberStream
+
+    Yields:
+        MemberStream: a stream per name, in the order of names
+    """
+    window = deque()
+    try:
+        for name in names:
+            window.append(opener(name))
+            if len(window) >= workers:
+                stream = window.popleft()
+                try:
+                    yield stream
+                finally:
+                    stream.close()
+        while window:
+            stream = window.popleft()
+            try:
+                yield stream
+            finally:
+                stream.close()
+    finally:
+        for stream in window:
+            stream.close()
+
+
+def _copy_text(stream, out, title):
+    """Write the text of stream as it comes, after title
+
+    Returns True if any text was written.
+    """
+    written = False
+    ending = "\n"
+    for chunk in stream.chunks():
+        if not written:
+            out.write(title)
+            written = True
+        out.write(chunk)
+        ending = chunk[-1]
+    if ending != "\n":
+        out.write("\n")
+    return written
+
+
+def _copy_lines(stream, out, title, matcher, line_prefix):
+    """Write the lines of stream that matcher accepts, after title
+
+    Every line starts with line_prefix. Returns True if a line was written.
+    """
+    written = False
+    for line in stream.lines():
+        if matcher is not None and not matcher(line):
+            continue
+        if not written:
+            out.write(title)
+            written = True
+        out.write(f"{line_prefix}{line}\n")
+    return written
+
+
+def dcat(patterns, out=sys.stdout, workers=8, grep=None, ignore_case=False,
+         header=False, prefix=False):
+    """Write the contents of all data sets and members that match patterns
+
+    Args:
+        patterns (list): data set patterns, see expand
+        out (file): where to write the contents
+        workers (int): the number of members read at the same time
+        grep (str): optional, only write lines that match this regex
+        ignore_case (bool): match grep without regard to case
+        header (bool): write a "==> name <==" line before each member
+        prefix (bool): start every line with the name and a colon
+
+    Returns:
+        int: 0, or 1 if a data set or member could not be read
+    """
+    matcher = None
+    if grep is not None:
+        matcher = re.compile(grep, re.IGNORECASE if ignore_case else 0).search
+
+    names = (name for pattern in patterns for name in expand(pattern))
+    rc = 0
+    for stream in iter_dcat(names, workers):
+        title = f"==> {stream.name} <==\n" if header else ""
+        try:
+            if matcher is None and not prefix:
+                written = _copy_text(stream, out, title)
+            else:
+                written = _copy_lines(stream, out, title, matcher,
+                                      f"{stream.name}:" if prefix else "")
+        except OSError as error:
+            sys.stderr.write(f"{error}\n")
+            rc = 1
+            continue
+        if not written and matcher is None:
+            # an empty data set still gets its header
+            out.write(title)
+    return rc
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Cat sequential data sets or PDS members; wildcards are allowed "
+        "in data set and member names."
+    )
+    parser.add_argument("patterns", nargs="+", metavar="PATTERN",
+                        help="data set pattern, optionally with a (member pattern)")
+    parser.add_argument("-w", "--workers", type=int, default=8,
+                        help="number of members to read at the same time")
+    parser.add_argument("-g", "--grep", metavar="REGEX",
+                        help="only print lines that match REGEX")
+    parser.add_argument("-i", "--ignore-case", action="store_true",
+                        help="ignore case when matching --grep")
+    parser.add_argument("--header", action="store_true",
+                        help="print a header line before every data set or member")
+    parser.add_argument("--prefix", action="store_true",
+                        help="start every line with the data set or member name")
+    args = parser.parse_args()
+
+    try:
+        rc = dcat(args.patterns, sys.stdout, max(1, args.workers), args.grep,
+                  args.ignore_case, args.header, args.prefix)
+    except BrokenPipeError:
+        # e.g. piped into head
+        sys.stderr.close()
+        rc = 0
+    sys.exit(rc)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,20 +1,25 @@
 #!/bin/sh
 #
 # cat sequential datasets or PDS members (supports wildcards in dataset and member)
+# If ZOAUD_SOCKET names the socket of a running zoaud.py, the data sets and
+# members are listed through it instead of starting mls for every data set.
 #
 # Copyright IBM Corp. 2021
 #
 
 #set -x
+. "$(dirname "$0")/zoau_session.sh"
 file=$1
 datasetPattern=${file%(*}
 memberPattern=`echo "${file}" | tr '()' '\t\t' | awk '{ print $2; }'`
-datasets=`dls ${datasetPattern}`
+zoau_session_start
+trap zoau_session_end EXIT
+datasets=`zoau_call dls ${datasetPattern}`
 for dataset in ${datasets}; do
 	if [ "${memberPattern}" = '' ]; then
 		cat "//'${dataset}'"
 	else
-            	members=`mls "${dataset}(${memberPattern})"`
+            	members=`zoau_call mls "${dataset}(${memberPattern})"`
 		for member in ${members}; do
                         cat "//'${dataset}(${member})'"
 		done
@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""Code rights.
+
+Copyright IBM Corp 2026.
+dmerge.py - merge any number of sorted data sets into one, like dmerge.sh.
+
+For data sets one SORT MERGE control deck is generated with a SORTINnn DD
+per input, so DFSORT reads all of them in a single run. z/OS UNIX files
+(any name with a /) are merged in this process instead, by a streaming
+k-way merge over the mapped files (see records.py) that holds one record
+per input in memory. That also lets the merge run off z/OS, e.g. on unloads that were copied elsewhere.
+
+Keys are given like dmerge.sh does: -K start,length,type,direction with
+the types CH, ZD, PD and BI and the directions A and D. As in dmerge.sh,
+start counts from 1 at the first data byte, also for variable records:
+the 4 byte RDW is added for them, so -K1,9 becomes 5,9 in the SORT deck.
+Records with equal keys keep the order of the inputs (OPTION EQUALS).
+
+Usage: dmerge.py [-K KEY]... INPUT... OUTPUT
+       dmerge.py -K1,9,CH,A -K10,8,CH,D ibmuser.orig ibmuser.new ibmuser.out(merge)
+       dmerge.py --recfm VB --lrecl 84 -K1,9 /u/extract/*.vb /u/merged.vb
+"""
+import argparse
+import heapq
+import os
+import sys
+from contextlib import ExitStack
+from typing import NamedTuple
+
+from create_sysin import sysin_file
+import records
+
+KEY_TYPES = ("CH", "ZD", "PD", "BI")
+# SORTIN01 to SORTIN99
+MAX_SORTIN = 99
+# The record formats of local files; TEXT is one record per line
+LOCAL_RECFMS = ("FB", "VB", "TEXT")
+
+# Large writes to the merged file
+_BUFFER_SIZE = 1024 * 1024
+
+# Reverses the order of bytes, for descending CH and BI keys
+_INVERT = bytes(range(255, -1, -1))
+
+
+class DmergeError(Exception):
+    """Inputs that cannot be merged, e.g. of different record formats"""
+
+
+class MergeKey(NamedTuple):
+    """A key field, as in the FIELDS of a SORT MERGE statement"""
+    start: int
+    length: int
+    key_type: str
+    direction: str
+
+    def control(self):
+        """Return the key as SORT writes it, e.g. 1,9,CH,A"""
+        return f"{self.start},{self.length},{self.key_type},{self.direction}"
+
+
+def parse_key(text, lrecl, variable=False):
+    """Parse a -K option
+
+    Args:
+        text (str): start,length,type,direction; all but start are optional
+        lrecl (int): the record length, the default length runs up to it
+        variable (bool): the records are variable; start counts from the
+            first data byte and 4 is added for the RDW
+
+    Returns:
+        MergeKey: the key, its start counting from 1 at the RDW as in SORT
+
+    Raises:
+        ValueError: if the key is not valid
+    """
+    fields = text.replace(" ", "").split(",")
+    if len(fields) > 4:
+        raise ValueError(f"key {text} has more than 4 fields")
+    fields += [""] * (4 - len(fields))
+    start = int(fields[0] or 1) + (4 if variable else 0)
+    length = int(fields[1]) if fields[1] else lrecl - start + 1
+    key_type = (fields[2] or "CH").upper()
+    direction = (fields[3] or "A").upper()
+    if key_type not in KEY_TYPES:
+        raise ValueError(f"key {text}: type must be one of {', '.join(KEY_TYPES)}")
+    if direction not in ("A", "D"):
+        raise ValueError(f"key {text}: direction must be A or D")
+    if start < 1 or length < 1 or start + length - 1 > lrecl:
+        raise ValueError(f"key {text} does not fit in a record of length {lrecl}")
+    return MergeKey(start, length, key_type, direction)
+
+
+def merge_control(keys):
+    """Return the lines of the SORT control deck that merges on keys"""
+    fields = ",\n  ".join(key.control() for key in keys)
+    return [" OPTION EQUALS"] + f" MERGE FIELDS=({fields})".split("\n")
+
+
+def dataset_attributes(name):
+    """Return (organization, record format, record length) of a data set
+
+    Args:
+        name (str): the data set, a member name is ignored
+
+    Raises:
+        DmergeError: if the data set does not exist
+    """
+    from zoautil_py import datasets
+
+    dataset = name.partition("(")[0]
+    found = datasets.list_datasets(dataset)
+    if not found:
+        raise DmergeError(
+            f"Dataset {dataset} does not exist. Allocate the dataset before attempting merge."
+        )
+    return found[0].organization, found[0].record_format, int(found[0].record_length)
+
+
+def dmerge(inputs, output, key_options=None):
+    """Merge sorted data sets with one run of SORT
+
+    Args:
+        inputs (list): the sorted data sets (or members), at most 99
+        output (str): the data set (or member) to write, it has to exist
+        key_options (list): -K options, see parse_key; default the whole record
+
+    Returns:
+        dict: the result of mvscmd, with the SORT messages in stdout_response
+
+    Raises:
+        DmergeError: if the data sets cannot be merged
+        ValueError: if a key is not valid
+    """
+    import tempfile
+    from zoautil_py import mvscmd
+    from zoautil_py.types import DatasetDefinition, DDStatement, FileDefinition
+
+    if len(inputs) > MAX_SORTIN:
+        raise DmergeError(f"SORT can merge at most {MAX_SORTIN} data sets")
+    attributes = {name: dataset_attributes(name) for name in inputs + [output]}
+    if len({attribute[1:] for attribute in attributes.values()}) > 1:
+        raise DmergeError("Datasets must all have the same record format and logical record length")
+    for name, (organization, _, _) in attributes.items():
+        if organization not in ("PS", "PO"):
+            raise DmergeError(f"Dataset {name} must be either PS (sequential) or PO (PDS or PDSE)")
+    _, recfm, lrecl = attributes[output]
+    keys = [parse_key(option, lrecl, recfm.startswith("V")) for option in key_options or ["1"]]
+
+    sysout = os.path.join(tempfile.gettempdir(), f"dmerge.{os.getpid()}.sysout")
+    try:
+        with sysin_file(merge_control(keys)) as sysin:
+            dds = [DDStatement("SYSIN", FileDefinition(sysin)),
+                   DDStatement("SYSOUT", FileDefinition(sysout))]
+            dds += [DDStatement(f"SORTIN{number:02d}", DatasetDefinition(name))
+                    for number, name in enumerate(inputs, start=1)]
+            dds.append(DDStatement("SORTOUT", DatasetDefinition(output)))
+            result = mvscmd.execute("SORT", pgm_args="MSGPRT=CRITICAL,LIST", dds=dds).to_dict()
+        if os.path.exists(sysout):
+            with open(sysout, encoding="cp1047", errors="replace") as messages:
+                result["stdout_response"] = messages.read()
+    finally:
+        if os.path.exists(sysout):
+            os.remove(sysout)
+    return result
+
+
+def _text_records(file):
+    """Yield the lines of a text file as records, each with a newline"""
+    for line in file:
+        yield line if line.endswith(b"\n") else line + b"\n"
+
+
+def _key_part(key):
+    """Return a function that extracts one key from a record, see key_function"""
+    field = slice(key.start - 1, key.start - 1 + key.length)
+    descending = key.direction == "D"
+    if key.key_type in ("ZD", "PD"):
+        decode = records.DECODERS[key.key_type]
+        if descending:
+            return lambda record: -decode(record[field])
+        return lambda record: decode(record[field])
+    if descending:
+        return lambda record: record[field].translate(_INVERT)
+    return lambda record: record[field]
+
+
+def key_function(keys):
+    """Return a function that turns a record into a value ordered by keys
+
+    CH and BI keys compare their bytes (inverted for D), ZD and PD keys
+    their numeric value (negated for D). When all keys compare bytes they
+    are concatenated into one bytes object, which is the fastest to compare.
+    """
+    parts = [_key_part(key) for key in keys]
+    if len(parts) == 1:
+        return parts[0]
+    if all(key.key_type in ("CH", "BI") for key in keys):
+        return lambda record: b"".join([part(record) for part in parts])
+    return lambda record: tuple([part(record) for part in parts])
+
+
+def merge_records(record_iterators, keys):
+    """Merge sorted record iterators into one sorted stream
+
+    Only the next record of every input is held in memory. Records with
+    equal keys come out in the order of the inputs.
+    """
+    return heapq.merge(*record_iterators, key=key_function(keys))
+
+
+def merge_files(inputs, output, key_options=None, recfm="FB", lrecl=80):
+    """Merge sorted local files into output
+
+    Args:
+        inputs (list): paths of the sorted files
+        output (str): path of the merged file
+        key_options (list): -K options, see parse_key; default the whole record
+        recfm (str): one of LOCAL_RECFMS
+        lrecl (int): the record length (the maximum for VB, including the RDW)
+
+    Returns:
+        int: the number of records written
+    """
+    if recfm not in LOCAL_RECFMS:
+        raise DmergeError(f"record format must be one of {', '.join(LOCAL_RECFMS)}")
+    keys = [parse_key(option, lrecl, recfm == "VB") for option in key_options or ["1"]]
+    count = 0
+    with ExitStack() as stack:
+        if recfm == "TEXT":
+            inputs = [_text_records(stack.enter_context(open(path, "rb")))
+                      for path in inputs]
+        else:
+            inputs = [stack.enter_context(records.RecordFile(path, recfm, lrecl)).record_bytes()
+                      for path in inputs]
+        with open(output, "wb", buffering=_BUFFER_SIZE) as merged:
+            write = merged.write
+            for record in merge_records(inputs, keys):
+                write(record)
+                count += 1
+    return count
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Merge sorted data sets (with SORT) or z/OS UNIX files into one."
+    )
+    parser.add_argument("-K", dest="keys", action="append", metavar="KEY",
+                        help="a key field start,[length],[type],[direction]; "
+                        "start counts from the first data byte (after the RDW of VB "
+                        "records); default 1 to the end of the record, CH, A")
+    parser.add_argument("--recfm", choices=LOCAL_RECFMS, default="FB",
+                        help="record format of local files, default FB")
+    parser.add_argument("--lrecl", type=int, default=80,
+                        help="record length of local files, default 80")
+    parser.add_argument("inputs", nargs="+", metavar="INPUT", help="the sorted inputs")
+    parser.add_argument("output", metavar="OUTPUT", help="the merged output")
+    args = parser.parse_args()
+
+    try:
+        if "/" in args.output or any("/" in name for name in args.inputs):
+            merge_files(args.inputs, args.output, args.keys, args.recfm, args.lrecl)
+            rc = 0
+        else:
+            result = dmerge(args.inputs, args.output, args.keys)
+            rc = result["rc"]
+            if rc != 0:
+                sys.stderr.write(result["stdout_response"])
+    except (DmergeError, ValueError, OSError) as error:
+        sys.stderr.write(f"{error}\n")
+        rc = 4
+    sys.exit(rc)
+
+
+if __name__ == "__main__":
+    main()
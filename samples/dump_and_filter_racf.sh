@@ -2,10 +2,22 @@
 #
 # Dump and Filter RACF database for two record types:
 # http://tech.mikefulton.ca/IRRDBU00RecordTypes
+# irrdbu00.py prints the SORT statements for other filters (--control),
+# and filters unloads copied to z/OS UNIX files without SORT.
 #
 # Copyright IBM Corp. 2021
 #
 
+if [ "$#" -lt 2 ] || [ "$#" -gt 3 ]; then
+    echo "usage:
+        $0 <IRRDBU00 output data set> <output data set> [<SORT messages file>]"
+    exit 1
+fi
+
+tempds=$1
+output=$2
+err=${3:-stdout}
+
 mvscmd --pgm=sort --sortin=${tempds} --sysout=${err} --sortout=${output} --sysin=stdin <<zz
  SORT    FIELDS=COPY
  INCLUDE COND=(5,4,CH,EQ,C'0207',OR,
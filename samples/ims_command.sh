@@ -26,6 +26,9 @@
 # ENVIRONMENT VARIABLES:
 #   TMPHLQ - (Optional) High-Level Qualifier for temporary datasets
 #            If not set, the script will use the default TSO high level qualifier
+#   ZOAUD_SOCKET - (Optional) The socket of a running zoaud.py. If it is set,
+#            mvstmp, dtouch and drm run in the daemon (see zoau_session.sh)
+#            instead of starting a process for every IMS command
 #
 # USAGE:
 #   ./ims_command.sh
@@ -62,6 +65,9 @@
 # VERSION: 1.0
 #*******************************************************************************
 
+. "$(dirname "$0")/zoau_session.sh"
+zoau_session_start
+
 # Trap signals to ensure cleanup on script exit or interruption
 # Signals: EXIT(0), HUP(1), INT(2), QUIT(3), ABRT(6), KILL(9), ALRM(14), TERM(15)
 trap cleanup 0 1 2 3 6 9 14 15
@@ -84,9 +90,11 @@ trap cleanup 0 1 2 3 6 9 14 15
 # NOTES:
 #   - Output is redirected to /dev/null to suppress messages
 #   - Errors are ignored (2>&1) to prevent script failure if dataset doesn't exist
+#   - Ends the zoaud session, if there is one
 #*******************************************************************************
 function cleanup {
-    drm "${jcltmp}" > /dev/null 2>&1
+    zoau_call drm "${jcltmp}" > /dev/null 2>&1
+    zoau_session_end
 }
 
 #*******************************************************************************
@@ -157,10 +165,10 @@ function issue_cmd {
     fi
 
     # Generate unique temporary dataset name using the HLQ
-    jcltmp=`mvstmp ${hlq}`
+    jcltmp=`zoau_call mvstmp ${hlq}`
 
     # Create a sequential dataset to hold the IMS command
-    dtouch -tSEQ "${jcltmp}"
+    zoau_call dtouch -tSEQ "${jcltmp}"
 
     # Write the IMS command (passed as $1) to the temporary dataset
     decho "$1" "${jcltmp}"
@@ -172,7 +180,7 @@ function issue_cmd {
            --sysprint=* --sysin="${jcltmp}"
 
     # Clean up: Remove the temporary dataset
-    drm "${jcltmp}" > /dev/null 2>&1
+    zoau_call drm "${jcltmp}" > /dev/null 2>&1
 }
 
 #*******************************************************************************
@@ -0,0 +1,548 @@
+#!/usr/bin/env python3
+"""Code rights.
+
+Copyright IBM Corp 2026.
+irrdbu00.py - filter the records of a RACF database unload (the output of
+IRRDBU00) with filters like
+
+    type=0207 or grcert_class_name=DIGTRING
+    usbd_name^=SYS and usbd_create_date=2020-01-01..2020-12-31
+
+For an unload data set the filter is compiled into SORT INCLUDE control
+statements and SORT copies the matching records to another data set. An
+unload file (any name with a /, a VB data set copied with its RDWs) is
+filtered in this process, and the matching records are written to a CSV
+file per record type, or to Parquet files if pyarrow is installed.
+
+A filter is made of conditions joined with and, or and parentheses:
+    field=value         the field is value (padded with blanks)
+    field!=value        the field is not value
+    field^=value        the field starts with value
+    field>=value        also >, <= and <, compared as characters like SORT does
+    field=low..high     the field is between low and high
+Values can be quoted with ' or ". The field type is the record type; other
+fields are named as in the IRRDBU00 record layouts, e.g. GRCERT_CLASS_NAME
+(case does not matter), and a condition on one is only true for records of
+its type. --schema lists the record types and fields that are known. A
+record that ends before a field does not match a condition on it, as with
+OPTION VLSHRT.
+
+Usage: irrdbu00.py [-w FILTER] [--format csv|parquet] UNLOAD-FILE [DIRECTORY]
+       irrdbu00.py [-w FILTER] UNLOAD-DATASET OUTPUT-DATASET
+       irrdbu00.py [-w FILTER] --control
+       irrdbu00.py --schema
+"""
+import argparse
+import csv
+import os
+import re
+import sys
+from typing import NamedTuple
+
+from create_sysin import sysin_file
+from records import Field, RecordFile, decode_ch
+
+# The filter of dump_and_filter_racf.sh
+DEFAULT_FILTER = "type=0207 or grcert_class_name=DIGTRING"
+# The record type, in SORT positions (after the RDW)
+TYPE_FIELD = Field("type", 5, 4)
+# Parquet files are written in row groups of this many records
+PARQUET_BATCH = 100000
+# DFSORT control statements end in column 71
+_LAST_COLUMN = 71
+
+
+class RecordType(NamedTuple):
+    """The layout of an IRRDBU00 record type"""
+    name: str
+    description: str
+    fields: list
+
+
+def _record_type(record_type, name, description, *layout):
+    """Return a RecordType from (field, first column, last column) tuples
+
+    The columns are those of the record layouts in the RACF documentation,
+    which do not count the RDW; the fields get SORT positions, which do.
+    """
+    fields = [Field(f"{name}_{field}".lower(), first + 4, last - first + 1)
+              for field, first, last in layout]
+    return record_type, RecordType(name, description, fields)
+
+
+RECORD_TYPES = dict([
+    _record_type("0100", "GPBD", "group basic data",
+                 ("RECORD_TYPE", 1, 4), ("NAME", 6, 13), ("SUPGRP_ID", 15, 22),
+                 ("CREATE_DATE", 24, 33), ("OWNER_ID", 35, 42), ("UACC", 44, 51),
+                 ("NOTERMUACC", 53, 56), ("INSTALL_DATA", 58, 312), ("MODEL", 314, 357),
+                 ("UNIVERSAL", 359, 362)),
+    _record_type("0101", "GPSGRP", "group subgroups",
+                 ("RECORD_TYPE", 1, 4), ("NAME", 6, 13), ("SUBGRP_ID", 15, 22)),
+    _record_type("0102", "GPMEM", "group members",
+                 ("RECORD_TYPE", 1, 4), ("NAME", 6, 13), ("MEMBER_ID", 15, 22),
+                 ("AUTH", 24, 31)),
+    _record_type("0200", "USBD", "user basic data",
+                 ("RECORD_TYPE", 1, 4), ("NAME", 6, 13), ("CREATE_DATE", 15, 24),
+                 ("OWNER_ID", 26, 33), ("ADSP", 35, 38), ("SPECIAL", 40, 43),
+                 ("OPER", 45, 48), ("REVOKE", 50, 53), ("GRPACC", 55, 58),
+                 ("PWD_INTERVAL", 60, 62), ("PWD_DATE", 64, 73), ("PROGRAMMER", 75, 94),
+                 ("DEFGRP_ID", 96, 103), ("LASTJOB_TIME", 105, 112),
+                 ("LASTJOB_DATE", 114, 123), ("INSTALL_DATA", 125, 379),
+                 ("UAUDIT", 381, 384), ("AUDITOR", 386, 389), ("NOPWD", 391, 394),
+                 ("OIDCARD", 396, 399), ("PWD_GEN", 401, 403), ("REVOKE_CNT", 405, 407),
+                 ("MODEL", 409, 452), ("SECLEVEL", 454, 456), ("REVOKE_DATE", 458, 467),
+                 ("RESUME_DATE", 469, 478)),
+    _record_type("0203", "USGCON", "user group connections",
+                 ("RECORD_TYPE", 1, 4), ("NAME", 6, 13), ("GRP_ID", 15, 22)),
+    _record_type("0205", "USCON", "user connect data",
+                 ("RECORD_TYPE", 1, 4), ("NAME", 6, 13), ("GRP_ID", 15, 22),
+                 ("CONNECT_DATE", 24, 33), ("OWNER_ID", 35, 42), ("LASTCON_TIME", 44, 51),
+                 ("LASTCON_DATE", 53, 62), ("UACC", 64, 71), ("INIT_CNT", 73, 77),
+                 ("GRP_ADSP", 79, 82), ("GRP_SPECIAL", 84, 87), ("GRP_OPER", 89, 92),
+                 ("REVOKE", 94, 97), ("GRP_ACC", 99, 102), ("NOTERMUACC", 104, 107),
+                 ("GRP_AUDIT", 109, 112), ("REVOKE_DATE", 114, 123),
+                 ("RESUME_DATE", 125, 134)),
+    _record_type("0207", "USCERT", "user certificate name",
+                 ("RECORD_TYPE", 1, 4), ("NAME", 6, 13), ("CERT_NAME", 15, 260),
+                 ("CERTLABL", 262, 293)),
+    _record_type("0400", "DSBD", "data set basic data",
+                 ("RECORD_TYPE", 1, 4), ("NAME", 6, 49), ("VOL", 51, 56),
+                 ("GENERIC", 58, 61), ("CREATE_DATE", 63, 72), ("OWNER_ID", 74, 81),
+                 ("LASTREF_DATE", 83, 92), ("LASTCHG_DATE", 94, 103),
+                 ("ALTER_CNT", 105, 109), ("CONTROL_CNT", 111, 115),
+                 ("UPDATE_CNT", 117, 121), ("READ_CNT", 123, 127), ("UACC", 129, 136)),
+    _record_type("0404", "DSACC", "data set access",
+                 ("RECORD_TYPE", 1, 4), ("NAME", 6, 49), ("VOL", 51, 56),
+                 ("AUTH_ID", 58, 65), ("ACCESS", 67, 74), ("ACCESS_CNT", 76, 80)),
+    _record_type("0500", "GRBD", "general resource basic data",
+                 ("RECORD_TYPE", 1, 4), ("NAME", 6, 251), ("CLASS_NAME", 253, 260),
+                 ("GENERIC", 262, 265), ("CLASS", 267, 269), ("CREATE_DATE", 271, 280),
+                 ("OWNER_ID", 282, 289), ("LASTREF_DATE", 291, 300),
+                 ("LASTCHG_DATE", 302, 311), ("ALTER_CNT", 313, 317),
+                 ("CONTROL_CNT", 319, 323), ("UPDATE_CNT", 325, 329),
+                 ("READ_CNT", 331, 335), ("UACC", 337, 344)),
+    _record_type("0505", "GRACC", "general resource access",
+                 ("RECORD_TYPE", 1, 4), ("NAME", 6, 251), ("CLASS_NAME", 253, 260),
+                 ("AUTH_ID", 262, 269), ("ACCESS", 271, 278), ("ACCESS_CNT", 280, 284)),
+    _record_type("0560", "GRCERT", "general resource certificate",
+                 ("RECORD_TYPE", 1, 4), ("NAME", 6, 251), ("CLASS_NAME", 253, 260),
+                 ("START_DATE", 262, 271), ("START_TIME", 273, 280),
+                 ("END_DATE", 282, 291), ("END_TIME", 293, 300), ("KEY_TYPE", 302, 309),
+                 ("KEY_SIZE", 311, 320), ("LAST_SERIAL", 322, 337),
+                 ("RING_SEQN", 339, 348), ("GEN_REQ", 350, 353)),
+])
+
+# field name -> (record type, Field)
+FIELDS = {field.name: (record_type, field)
+          for record_type, layout in RECORD_TYPES.items() for field in layout.fields}
+
+_TOKEN = re.compile(
+    r"\s*(?:(?P<paren>[()])"
+    r"|(?P<field>\w+)\s*(?P<op>!=|\^=|>=|<=|=|>|<)\s*"
+    r"(?P<value>'(?:[^']|'')*'|\"[^\"]*\"|[^\s()]+)"
+    r"|(?P<word>\w+))"
+)
+# operator -> SORT comparison
+_SORT_OPERATORS = {"=": "EQ", "!=": "NE", ">=": "GE", "<=": "LE", ">": "GT", "<": "LT"}
+
+
+class FilterError(ValueError):
+    """A filter that cannot be parsed"""
+
+
+class Condition(NamedTuple):
+    """One comparison of a filter
+
+    record_type is the type the field belongs to, None for the type field.
+    op is one of the operators, "prefix" for ^= or "range" for low..high.
+    """
+    record_type: object
+    field: Field
+    op: str
+    values: tuple
+
+
+def _condition(field_name, op, value):
+    """Return the Condition for field_name op value"""
+    field_name = field_name.lower()
+    if field_name == "type":
+        record_type, field = None, TYPE_FIELD
+    elif field_name in FIELDS:
+        record_type, field = FIELDS[field_name]
+    else:
+        raise FilterError(f"unknown field {field_name}, see --schema")
+    if value[:1] in ("'", '"'):
+        values = (value[1:-1].replace("''", "'") if value[0] == "'" else value[1:-1],)
+    elif op == "=" and ".." in value:
+        values = tuple(value.split("..", 1))
+        op = "range"
+    else:
+        values = (value,)
+    if op == "^=":
+        op = "prefix"
+    for text in values:
+        if len(text) > field.length:
+            raise FilterError(f"{text} is longer than {field_name} ({field.length})")
+    return Condition(record_type, field, op, values)
+
+
+def parse_filter(text):
+    """Parse a filter into a tree
+
+    Returns:
+        ("or", [trees]), ("and", [trees]) or a Condition
+
+    Raises:
+        FilterError: if the filter is not valid
+    """
+    tokens = []
+    position = 0
+    text = text.strip()
+    while position < len(text):
+        match = _TOKEN.match(text, position)
+        if not match or match.end() == position:
+            raise FilterError(f"cannot parse the filter at: {text[position:]}")
+        position = match.end()
+        if match["paren"]:
+            tokens.append(match["paren"])
+        elif match["field"]:
+            tokens.append(_condition(match["field"], match["op"], match["value"]))
+        elif match["word"].lower() in ("and", "or"):
+            tokens.append(match["word"].lower())
+        else:
+            raise FilterError(f"expected a condition, and or or at: {match['word']}")
+    tokens.append(None)
+
+    def expression(index, operator="or"):
+        operand = term if operator == "or" else factor
+        node, index = operand(index)
+        nodes = [node]
+        while tokens[index] == operator:
+            node, index = operand(index + 1)
+            nodes.append(node)
+        return (nodes[0] if len(nodes) == 1 else (operator, nodes)), index
+
+    def term(index):
+        return expression(index, "and")
+
+    def factor(index):
+        token = tokens[index]
+        if isinstance(token, Condition):
+            return token, index + 1
+        if token == "(":
+            node, index = expression(index + 1)
+            if tokens[index] != ")":
+                raise FilterError("a ( is not closed")
+            return node, index + 1
+        raise FilterError(f"expected a condition, found {token or 'the end'}")
+
+    tree, index = expression(0)
+    if tokens[index] is not None:
+        raise FilterError(f"unexpected {tokens[index]}")
+    return tree
+
+
+def _sort_constant(text):
+    return "C'" + text.replace("'", "''") + "'"
+
+
+def _sort_comparisons(condition):
+    """Return the SORT comparisons of a condition, to be ANDed"""
+    field = condition.field
+    position = f"{field.start},{field.length},CH"
+    if condition.op == "prefix":
+        compared = [f"{field.start},{len(condition.values[0])},CH,EQ,"
+                    + _sort_constant(condition.values[0])]
+    elif condition.op == "range":
+        low, high = condition.values
+        compared = [f"{position},GE,{_sort_constant(low)}",
+                    f"{position},LE,{_sort_constant(high)}"]
+    else:
+        compared = [f"{position},{_SORT_OPERATORS[condition.op]},"
+                    + _sort_constant(condition.values[0])]
+    if condition.record_type is not None:
+        compared.insert(0, f"5,4,CH,EQ,{_sort_constant(condition.record_type)}")
+    return compared
+
+
+def _sort_condition(tree, top=True):
+    """Return the logical expression of INCLUDE COND for a filter tree"""
+    if isinstance(tree, Condition):
+        parts = _sort_comparisons(tree)
+        joined = ",AND,".join(parts)
+        return joined if top or len(parts) == 1 else f"({joined})"
+    operator, nodes = tree
+    joined = f",{operator.upper()},".join(_sort_condition(node, False) for node in nodes)
+    return joined if top else f"({joined})"
+
+
+def _wrap(statement, continuation):
+    """Break a control statement so no line passes column 71
+
+    Lines are only broken after a comparison or an AND or OR.
+    """
+    pieces = re.findall(r"(?:C'(?:[^']|'')*'|[^,'])*,?", statement)
+    atoms = [""]
+    for piece in filter(None, pieces):
+        atoms[-1] += piece
+        if "C'" in piece or piece in ("AND,", "OR,"):
+            atoms.append("")
+    lines = []
+    line = ""
+    for atom in filter(None, atoms):
+        if line.strip() and len(line) + len(atom) > _LAST_COLUMN:
+            lines.append(line)
+            line = continuation
+        line += atom
+    lines.append(line)
+    if any(len(line) > _LAST_COLUMN for line in lines):
+        raise FilterError("a value is too long for a SORT control statement")
+    return lines
+
+
+def sort_control(filter_text=DEFAULT_FILTER):
+    """Return the SORT control statements that copy the matching records"""
+    condition = _sort_condition(parse_filter(filter_text))
+    return ([" SORT    FIELDS=COPY"]
+            + _wrap(f" INCLUDE COND=({condition})", " " * 14)
+            + [" OPTION  VLSHRT"])
+
+
+def _local_condition(condition, codepage):
+    """Return a function that tells if a record (bytes) meets a condition"""
+    field = condition.field
+    begin, end = field.start - 1, field.end
+    values = [value.encode(codepage) for value in condition.values]
+    if condition.op == "prefix":
+        prefix = values[0]
+        prefix_end = begin + len(prefix)
+        test = lambda record: record[begin:prefix_end] == prefix  # noqa: E731
+    else:
+        padding = " ".encode(codepage)
+        values = [value.ljust(field.length, padding) for value in values]
+        if condition.op == "=":
+            value = values[0]
+            test = lambda record: record[begin:end] == value  # noqa: E731
+        elif condition.op == "range":
+            low, high = values
+            test = lambda record: (  # noqa: E731
+                len(record) >= end and low <= record[begin:end] <= high)
+        else:
+            value = values[0]
+            compare = {"!=": bytes.__ne__, ">=": bytes.__ge__, "<=": bytes.__le__,
+                       ">": bytes.__gt__, "<": bytes.__lt__}[condition.op]
+            test = lambda record: (  # noqa: E731
+                len(record) >= end and compare(record[begin:end], value))
+    if condition.record_type is None:
+        return test
+    record_type = condition.record_type.encode(codepage)
+    return lambda record: record[4:8] == record_type and test(record)
+
+
+def compile_filter(filter_text=DEFAULT_FILTER, codepage="cp1047"):
+    """Return a function that tells if a record (bytes, with its RDW) matches
+
+    The values are encoded once, so records are compared without decoding.
+    """
+    def build(tree):
+        if isinstance(tree, Condition):
+            return _local_condition(tree, codepage)
+        operator, nodes = tree
+        tests = [build(node) for node in nodes]
+        combined = tests[0]
+        for test in tests[1:]:
+            if operator == "and":
+                combined = (lambda first, second: lambda record:
+                            first(record) and second(record))(combined, test)
+            else:
+                combined = (lambda first, second: lambda record:
+                            first(record) or second(record))(combined, test)
+        return combined
+
+    return build(parse_filter(filter_text))
+
+
+def filter_unload(path, filter_text=DEFAULT_FILTER, codepage="cp1047"):
+    """Yield the records of an unload file that match a filter, as bytes"""
+    matches = compile_filter(filter_text, codepage)
+    with RecordFile(path, "VB") as unload:
+        yield from filter(matches, unload.record_bytes())
+
+
+def _columns(record_type):
+    """Return the column names and fields of a record type, unknown types too"""
+    if record_type in RECORD_TYPES:
+        fields = RECORD_TYPES[record_type].fields
+    else:
+        fields = [Field("record_type", 5, 4), Field("data", 10, 1 << 16)]
+    return [field.name for field in fields], fields
+
+
+def _row(record, fields, codepage):
+    """Return the values of fields in a record, "" for those it does not reach"""
+    return [decode_ch(record[field.start - 1:field.end], codepage).rstrip()
+            for field in fields]
+
+
+def _output_name(directory, record_type, extension):
+    name = RECORD_TYPES[record_type].name.lower() if record_type in RECORD_TYPES else "other"
+    return os.path.join(directory, f"{record_type}_{name}.{extension}")
+
+
+def write_csv(records, directory, codepage="cp1047"):
+    """Write records to a CSV file per record type in directory
+
+    Returns:
+        dict: record type -> number of records written
+    """
+    writers = {}
+    counts = {}
+    try:
+        for record in records:
+            record_type = record[4:8].decode(codepage)
+            if record_type not in writers:
+                names, fields = _columns(record_type)
+                file = open(_output_name(directory, record_type, "csv"), "w", newline="")
+                writer = csv.writer(file)
+                writer.writerow(names)
+                writers[record_type] = (file, writer.writerow, fields)
+                counts[record_type] = 0
+            _, writerow, fields = writers[record_type]
+            writerow(_row(record, fields, codepage))
+            counts[record_type] += 1
+    finally:
+        for file, _, _ in writers.values():
+            file.close()
+    return counts
+
+
+def write_parquet(records, directory, codepage="cp1047"):
+    """Write records to a Parquet file per record type in directory
+
+    Records are collected in batches of PARQUET_BATCH per record type, so
+    memory does not grow with the size of the unload.
+
+    Returns:
+        dict: record type -> number of records written
+
+    Raises:
+        ImportError: if pyarrow is not installed
+    """
+    import pyarrow
+    import pyarrow.parquet
+
+    writers = {}
+    batches = {}
+    counts = {}
+
+    def flush(record_type):
+        names, _ = _columns(record_type)
+        table = pyarrow.table(dict(zip(names, zip(*batches[record_type]))),
+                              schema=pyarrow.schema([(name, pyarrow.string()) for name in names]))
+        if record_type not in writers:
+            writers[record_type] = pyarrow.parquet.ParquetWriter(
+                _output_name(directory, record_type, "parquet"), table.schema)
+        writers[record_type].write_table(table)
+        batches[record_type] = []
+
+    try:
+        for record in records:
+            record_type = record[4:8].decode(codepage)
+            if record_type not in batches:
+                batches[record_type] = []
+                counts[record_type] = 0
+            batches[record_type].append(_row(record, _columns(record_type)[1], codepage))
+            counts[record_type] += 1
+            if len(batches[record_type]) >= PARQUET_BATCH:
+                flush(record_type)
+        for record_type, batch in batches.items():
+            if batch:
+                flush(record_type)
+    finally:
+        for writer in writers.values():
+            writer.close()
+    return counts
+
+
+def sort_unload(unload, output, filter_text=DEFAULT_FILTER):
+    """Copy the records of an unload data set that match a filter with SORT
+
+    Returns:
+        dict: the result of mvscmd, with the SORT messages in stdout_response
+    """
+    import tempfile
+    from zoautil_py import mvscmd
+    from zoautil_py.types import DatasetDefinition, DDStatement, FileDefinition
+
+    sysout = os.path.join(tempfile.gettempdir(), f"irrdbu00.{os.getpid()}.sysout")
+    try:
+        with sysin_file(sort_control(filter_text)) as sysin:
+            dds = [DDStatement("SYSIN", FileDefinition(sysin)),
+                   DDStatement("SYSOUT", FileDefinition(sysout)),
+                   DDStatement("SORTIN", DatasetDefinition(unload)),
+                   DDStatement("SORTOUT", DatasetDefinition(output))]
+            result = mvscmd.execute("SORT", dds=dds).to_dict()
+        if os.path.exists(sysout):
+            with open(sysout, encoding="cp1047", errors="replace") as messages:
+                result["stdout_response"] = messages.read()
+    finally:
+        if os.path.exists(sysout):
+            os.remove(sysout)
+    return result
+
+
+def _print_schema():
+    for record_type, layout in RECORD_TYPES.items():
+        print(f"{record_type} {layout.name}: {layout.description}")
+        for field in layout.fields:
+            print(f"    {field.name:24s} {field.start},{field.length},CH")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Filter the records of an IRRDBU00 RACF database unload."
+    )
+    parser.add_argument("unload", nargs="?",
+                        help="the unload data set, or a file (a name with a /)")
+    parser.add_argument("output", nargs="?",
+                        help="the output data set, or the directory for the files "
+                        "(default the current directory)")
+    parser.add_argument("-w", "--where", default=DEFAULT_FILTER,
+                        help=f"the filter, default: {DEFAULT_FILTER}")
+    parser.add_argument("--format", choices=("csv", "parquet"), default="csv",
+                        help="the format of the files written for an unload file")
+    parser.add_argument("--control", action="store_true",
+                        help="print the SORT control statements and exit")
+    parser.add_argument("--schema", action="store_true",
+                        help="print the known record types and fields and exit")
+    args = parser.parse_args()
+
+    if args.schema:
+        _print_schema()
+        sys.exit(0)
+    try:
+        if args.control:
+            print("\n".join(sort_control(args.where)))
+            sys.exit(0)
+        if args.unload is None:
+            parser.error("the unload is required")
+        if "/" in args.unload:
+            write = write_parquet if args.format == "parquet" else write_csv
+            counts = write(filter_unload(args.unload, args.where), args.output or ".")
+            for record_type, count in sorted(counts.items()):
+                print(f"{record_type}: {count} records")
+            sys.exit(0)
+        if args.output is None:
+            parser.error("the output data set is required")
+        result = sort_unload(args.unload, args.output, args.where)
+    except FilterError as error:
+        sys.exit(f"{error}")
+    except ImportError as error:
+        sys.exit(f"Writing Parquet files needs pyarrow: {error}")
+    if result["rc"] != 0:
+        sys.stderr.write(result["stdout_response"])
+    sys.exit(result["rc"])
+
+
+if __name__ == "__main__":
+    main()
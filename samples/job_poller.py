@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""Code rights.
+
+Copyright IBM Corp 2026.
+job_poller.py - wait for submitted jobs without polling at a fixed rate.
+The interval between status queries starts short and grows exponentially
+(with jitter) up to a maximum, so short jobs are noticed quickly and long
+jobs do not flood JES with queries. All outstanding jobs are refreshed
+with one query per job owner per tick instead of one query per job, and
+that query only asks for the job names being waited for.
+"""
+import os
+import random
+import time
+
+# Job status values that mean the job has not finished yet
+ACTIVE_STATUSES = ("AC",)
+
+
+def backoff_intervals(initial=0.5, maximum=10.0, factor=2.0, jitter=0.1):
+    """Generate the sleep times between status queries
+
+    Args:
+        initial (float): first interval in seconds
+        maximum (float): the interval never grows beyond this
+        factor (float): growth factor applied after every interval
+        jitter (float): fraction of random variation applied to each interval
+
+    Yields:
+        float: seconds to sleep before the next query
+    """
+    interval = initial
+    while True:
+        yield interval * random.uniform(1 - jitter, 1 + jitter)
+        interval = min(interval * factor, maximum)
+
+
+def _name_pattern(names):
+    """Return the job name pattern that matches all of names and few others"""
+    if len(set(names)) == 1:
+        return names[0]
+    return os.path.commonprefix(names) + "*"
+
+
+class JobPoller:
+    """Poll a set of jobs until they leave the active state.
+
+    The poller keeps count of the status queries it issues, both in total
+    and per job, so the cost of waiting for each completion can be reported.
+    """
+
+    def __init__(self, initial=0.5, maximum=10.0, factor=2.0, jitter=0.1,
+                 deadline=None):
+        """
+        Args:
+            initial, maximum, factor, jitter: see backoff_intervals
+            deadline (float): seconds to wait in total, None waits forever
+        """
+        self.initial = initial
+        self.maximum = maximum
+        self.factor = factor
+        self.jitter = jitter
+        self.deadline = deadline
+        self.total_queries = 0
+        self.queries = {}  # job id -> number of status queries it took
+        self._started = time.monotonic()
+        self.reset()
+
+    def reset(self):
+        """Go back to the initial interval, e.g. after submitting new jobs"""
+        self._intervals = backoff_intervals(
+            self.initial, self.maximum, self.factor, self.jitter
+        )
+
+    def summary(self):
+        """Return a line with the status queries in total and per job"""
+        if not self.queries:
+            return f"{self.total_queries} status queries"
+        counts = sorted(self.queries.values())
+        return (f"{self.total_queries} status queries, {counts[0]} to {counts[-1]} "
+                f"per job (mean {sum(counts) / len(counts):.1f})")
+
+    def expired(self):
+        """Return True if the deadline has passed"""
+        if self.deadline is None:
+            return False
+        return time.monotonic() - self._started >= self.deadline
+
+    def sleep(self):
+        """Sleep for the next interval, never past the deadline"""
+        interval = next(self._intervals)
+        if self.deadline is not None:
+            remaining = self.deadline - (time.monotonic() - self._started)
+            interval = max(0, min(interval, remaining))
+        time.sleep(interval)
+
+    def poll(self, job_list):
+        """Refresh the status and rc of every job in job_list
+
+        The jobs are fetched with one query per owner: by job id for a
+        single job, else by the longest job name prefix they share, so the
+        other jobs of the owner are mostly left out. A job that is not
+        returned by that query is refreshed on its own.
+
+        Args:
+            job_list (list): Job objects returned by jobs.submit
+        """
+        from zoautil_py import jobs
+
+        by_owner = {}
+        for job in job_list:
+            by_owner.setdefault(job.owner, []).append(job)
+            self.queries[job.id] = self.queries.get(job.id, 0) + 1
+
+        for owner, owned_jobs in by_owner.items():
+            self.total_queries += 1
+            if len(owned_jobs) == 1:
+                fetched = jobs.fetch_multiple(job_id=owned_jobs[0].id)
+            else:
+                fetched = jobs.fetch_multiple(
+                    job_owner=owner, job_name=_name_pattern([job.name for job in owned_jobs])
+                )
+            current = {job.id: job for job in fetched}
+            for job in owned_jobs:
+                if job.id in current:
+                    job.status = current[job.id].status
+                    job.rc = current[job.id].rc
+                else:
+                    self.total_queries += 1
+                    job.refresh()
+
+    def wait(self, job_list, report=None):
+        """Wait until every job in job_list has finished or the deadline passes
+
+        Args:
+            job_list (list): Job objects returned by jobs.submit
+            report (function): optional, called with each job that is still
+                active after a query
+
+        Returns:
+            list: the jobs that were still active when the deadline passed
+        """
+        active = [job for job in job_list if job.status in ACTIVE_STATUSES]
+        while active and not self.expired():
+            if report is not None:
+                for job in active:
+                    report(job)
+            self.sleep()
+            self.poll(active)
+            active = [job for job in active if job.status in ACTIVE_STATUSES]
+        return active
@@ -1,4 +1,14 @@
-from zoautil_py import jobs, datasets
+import argparse
+import fcntl
+import json
+import os
+import time
+from contextlib import contextmanager
+
+# Staged JCL members are remembered here so identical JCL is written once.
+JCL_CACHE_INDEX = os.path.expanduser("~/.zoau_jcl_cache.json")
+# Least recently used members are deleted once the library holds more.
+JCL_CACHE_MAX_MEMBERS = 50
 
 jcl_sample = """//UPTIME    JOB MSGLEVEL=(1,1),
 //  MSGCLASS=A,CLASS=A
@@ -22,18 +32,195 @@ SH uptime
 //STDERR DD SYSOUT=*
 //"""
 
-def run_sample():
+def _stream_command(command, chunk_size=None):
+    """Run command and yield its stdout a line (or chunk) at a time.
+
+    If the caller stops iterating early the command is terminated. If the
+    command fails, OSError is raised with its stderr once its output has
+    been read, like jobs.read_output raises for a DD it cannot read.
+    """
+    import subprocess
+    import tempfile
+
+    # stderr goes to a file, a full stderr pipe would block the command
+    # while only stdout is read
+    with tempfile.TemporaryFile("w+", errors="replace") as errors:
+        process = subprocess.Popen(command, stdout=subprocess.PIPE,
+                                   stderr=errors, text=True,
+                                   errors="replace")
+        try:
+            if chunk_size:
+                chunk = process.stdout.read(chunk_size)
+                while chunk:
+                    yield chunk
+                    chunk = process.stdout.read(chunk_size)
+            else:
+                for record in process.stdout:
+                    yield record
+        finally:
+            process.stdout.close()
+            if process.poll() is None:
+                process.terminate()
+            process.wait()
+        if process.returncode != 0:
+            errors.seek(0)
+            raise OSError(f"{' '.join(command)} ended with rc {process.returncode}: "
+                          f"{errors.read().strip()}")
+
+
+def read_output_stream(job_id, stepname, ddname, chunk_size=None):
+    """Yield the records of one DD of a job instead of returning one string.
+
+    Unlike jobs.read_output, only one record (or chunk_size characters when
+    chunk_size is given) is held in memory at a time. OSError is raised
+    after the last record if pjdd fails, e.g. for a DD that does not exist.
+    """
+    return _stream_command(["pjdd", job_id, stepname, ddname], chunk_size)
+
+
+def iter_job_output(job_id, ddname=None, stepname=None, chunk_size=None):
+    """Yield (stepname, ddname, record) for every DD of a job.
+
+    ddname and stepname restrict the output to the matching DDs. Callers can
+    stop at any time, e.g. once a completion message has been seen:
+
+        for step, dd, record in iter_job_output(job_id, ddname="SYSPRINT"):
+            if "COMPLETED" in record:
+                break
+    """
+    from zoautil_py import jobs
+
+    for dd in jobs.list_dds(job_id):
+        if ddname is not None and dd["dataset"] != ddname:
+            continue
+        if stepname is not None and dd["stepname"] != stepname:
+            continue
+        for record in read_output_stream(job_id, dd["stepname"], dd["dataset"],
+                                         chunk_size):
+            yield dd["stepname"], dd["dataset"], record
+
+
+def _jcl_cache_library():
+    from zoautil_py import datasets
+
+    return datasets.hlq() + ".SAMPLE.JCLCACHE"
+
+
+def _load_cache_index(index_file):
+    try:
+        with open(index_file) as index:
+            return json.load(index)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_cache_index(index_file, cache_index):
+    # write to a temporary file first so concurrent runs never see half an index
+    temp_file = f"{index_file}.{os.getpid()}"
+    with open(temp_file, "w") as index:
+        json.dump(cache_index, index)
+    os.replace(temp_file, index_file)
+
+
+@contextmanager
+def _locked_cache_index(index_file):
+    """Lock the index and yield its contents, saving them afterwards.
+
+    The lock keeps other runs from losing index updates or evicting a
+    member between staging and submitting it.
+    """
+    with open(index_file + ".lock", "w") as lock:
+        fcntl.lockf(lock, fcntl.LOCK_EX)
+        cache_index = _load_cache_index(index_file)
+        yield cache_index
+        _save_cache_index(index_file, cache_index)
 
-    dsn_sample_jcl = datasets.hlq() + ".SAMPLE.JCL"
-    dsn_with_mem_sample_jcl = dsn_sample_jcl + "(UPTIME)"
 
-    # NOTE - data set does NOT need to exist prior to running this sample.
+def _member_exists(dsn_with_member):
+    from zoautil_py import datasets, exceptions
 
-    # create and write JCL to data set
-    datasets.write(dataset=dsn_with_mem_sample_jcl, content=jcl_sample)
+    try:
+        return bool(datasets.list_members(dsn_with_member))
+    except exceptions.ZOAUException:
+        # the library is gone
+        return False
 
-    # submit job
-    job_sample = jobs.submit(dsn_with_mem_sample_jcl)
+
+def _stage(cache_index, jcl, library, max_members, restage=False):
+    """Write jcl to its member unless the index says it is there already"""
+    import hashlib
+    from zoautil_py import datasets
+
+    if library is None:
+        library = _jcl_cache_library()
+    digest = hashlib.sha256(jcl.encode()).hexdigest()
+    member = "J" + digest[:7].upper()
+    dsn_with_member = f"{library}({member})"
+
+    members = cache_index.setdefault(library, {})
+    entry = members.get(member)
+    if restage or entry is None or entry["hash"] != digest \
+            or not _member_exists(dsn_with_member):
+        # NOTE - data set does NOT need to exist prior to the first write.
+        datasets.write(dataset=dsn_with_member, content=jcl)
+    members[member] = {"hash": digest, "last_used": time.time()}
+
+    while len(members) > max_members:
+        oldest = min(members, key=lambda name: members[name]["last_used"])
+        datasets.delete_members(f"{library}({oldest})")
+        del members[oldest]
+    return dsn_with_member
+
+
+def stage_jcl(jcl, library=None, max_members=JCL_CACHE_MAX_MEMBERS,
+              index_file=JCL_CACHE_INDEX):
+    """Return a data set member holding jcl, writing it only if needed.
+
+    The member name is derived from a hash of the JCL text, so the same JCL
+    always maps to the same member and is only written the first time it is
+    staged (or after it was evicted or deleted elsewhere). Once the library
+    holds more than max_members members the least recently used ones are
+    deleted, so a member staged here can be evicted by another run before
+    it is submitted; use submit_jcl to stage and submit in one go.
+    """
+    with _locked_cache_index(index_file) as cache_index:
+        return _stage(cache_index, jcl, library, max_members)
+
+
+def submit_jcl(jcl, library=None, max_members=JCL_CACHE_MAX_MEMBERS,
+               index_file=JCL_CACHE_INDEX, **submit_options):
+    """Stage jcl with stage_jcl and submit it, returning the job.
+
+    The index stays locked until the job is submitted, so no other run can
+    evict the member in between. If the submit fails, e.g. because the
+    member was deleted after it was checked, the JCL is written again and
+    submitted once more.
+    """
+    from zoautil_py import exceptions, jobs
+
+    with _locked_cache_index(index_file) as cache_index:
+        dsn_with_member = _stage(cache_index, jcl, library, max_members)
+        try:
+            return jobs.submit(dsn_with_member, **submit_options)
+        except exceptions.ZOAUException:
+            _stage(cache_index, jcl, library, max_members, restage=True)
+            return jobs.submit(dsn_with_member, **submit_options)
+
+
+def purge_jcl_cache(library=None, index_file=JCL_CACHE_INDEX):
+    """Delete the staging library and forget all of its members."""
+    from zoautil_py import datasets
+
+    if library is None:
+        library = _jcl_cache_library()
+    with _locked_cache_index(index_file) as cache_index:
+        datasets.delete(library)
+        cache_index.pop(library, None)
+
+
+def run_sample():
+    # stage and submit the JCL, it is only written to a data set the first time
+    job_sample = submit_jcl(jcl_sample)
 
     print("Details - sample job")
     print("id:", job_sample.id)
@@ -50,18 +237,31 @@ def run_sample():
     print("status: ", job_sample.status)
     print("rc: ", job_sample.rc)
 
-    dd_stdout = jobs.read_output(job_sample.id, 'UPTIME', 'STDOUT')
-
-    # print the stdout produced by job
+    # print the stdout produced by job, a record at a time, so large
+    # output never has to fit in memory
     print("The contents of the STDOUT DD:")
-    print(dd_stdout)
+    for record in read_output_stream(job_sample.id, 'UPTIME', 'STDOUT'):
+        print(record, end="")
 
 
     # cleanup:
     # cancels and removes job from jes system
     job_sample.purge()
 
-    # delete data set
-    datasets.delete(dsn_sample_jcl)
+    # the staged JCL is kept for the next run, use --purge-cache to delete it
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Submit a sample job and print its output")
+    parser.add_argument("--purge-cache", action="store_true",
+                        help="Delete the staged JCL library and exit")
+    args = parser.parse_args()
+    if args.purge_cache:
+        purge_jcl_cache()
+    else:
+        run_sample()
+
 
-run_sample()
\ No newline at end of file
+if __name__ == "__main__":
+    main()
\ No newline at end of file
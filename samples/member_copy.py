@@ -6,38 +6,182 @@ member_copy.py - Copy members from one dataset to another. It uses IEBCOPY
 because the member copy from ZOAU doesn't preserve the member statistics
 """
 import os
+import re
 import sys
 from datetime import datetime
 
-from zoautil_py import mvscmd
-from zoautil_py.types import DatasetDefinition, DDStatement, FileDefinition
 from create_sysin import create_sysin
 
 
-def _find_bad_members(memberlist, printfile):
+class SysprintReport:
+    """Everything of interest found in an IEBCOPY SYSPRINT
+
+    Members and data set level errors are recorded per input DD name, so
+    the copy groups of a batched IEBCOPY run can be told apart. The errors
+    are (kind, values) findings; the findings before the first COPY
+    statement are kept under None.
+    """
+
+    def __init__(self, filename):
+        self.filename = filename
+        self.copied = {}  # input DD name -> list of members copied
+        self.missing = {}  # input DD name -> list of members not found
+        self.errors = {}  # input DD name -> list of (kind, values) findings
+
+    def missing_members(self, indd=None):
+        """Return the members that were not found, for one DD or all of them"""
+        if indd is not None:
+            return self.missing.get(indd, [])
+        return [member for members in self.missing.values() for member in members]
+
+    def dataset_error(self, indd=None):
+        """Return the last finding for one DD, or the last one of all, or None"""
+        if indd is not None:
+            findings = self.errors.get(indd) or self.errors.get(None, [])
+        else:
+            findings = [finding for found in self.errors.values() for finding in found]
+        return findings[-1] if findings else None
+
+    def error_message(self, source, destination, indd=None):
+        """Turn the data set level finding into message text
+
+        Args:
+             source (String):      The Source dataset
+             destination (String): The destination dataset
+             indd (String):        Optional, the input DD of the copy group
+
+        Returns:
+            Message Text
+        """
+        finding = self.dataset_error(indd)
+        if finding is None:
+            return f"z/OS Unchecked error please check out: {self.filename}"
+        kind, values = finding
+        if kind == "recfm":
+            return (f"Record Formats incompatible: {source} record format is {values[0]}"
+                    f" {destination} record format is {values[1]}")
+        if kind == "pdse recfm":
+            return (f"Record Formats incompatible: {source} record format is {values[0]} "
+                    f" {destination} record format is {values[1]}")
+        if kind == "lrecl":
+            return (f"Record length incompatible: {source} record length is {values[0]}"
+                    f" {destination} record length is {values[1]}")
+        return f"You are not authorized to {source}"
+
+
+def _copied(report, indd, line):
+    report.copied.setdefault(indd, []).append(line.split(None, 2)[1])
+
+
+def _not_found(report, indd, line):
+    report.missing.setdefault(indd, []).append(line.split(None, 2)[1])
+
+
+def _recfm_igw01513t(report, indd, line):
+    words = line.split()
+    report.errors.setdefault(indd, []).append(("pdse recfm", (words[7], words[11])))
+
+
+def _recfm_ieb127i(report, indd, line):
+    words = line.split()
+    report.errors.setdefault(indd, []).append(("recfm", (words[5][6:], words[7][6:])))
+
+
+def _lrecl_ieb124i(report, indd, line):
+    words = line.split()
+    report.errors.setdefault(indd, []).append(
+        ("lrecl", (words[5].strip("()"), words[9].strip("()."))))
+
+
+def _not_authorized(report, indd, line):
+    report.errors.setdefault(indd, []).append(("auth", ()))
+
+
+# Message id -> handler, every handler gets the report, the current input
+# DD name and the line
+_SYSPRINT_HANDLERS = {
+    "IEB154I": _copied,
+    "IEB177I": _not_found,
+    "IGW01513T": _recfm_igw01513t,
+    "IEB127I": _recfm_ieb127i,
+    "IEB124I": _lrecl_ieb124i,
+}
+_SYSPRINT_INDD = re.compile(r"(?:INDD=|REFERENCED BY )(\w+)")
+
+
+def parse_sysprint(printfile):
+    """Read an IEBCOPY SYSPRINT once and collect its findings
+
+    Lines are read one at a time and dispatched on the message id that
+    starts them. Only the abend code and the lines naming an input DD need
+    a closer look.
+
+    Args:
+        printfile (String): file containing the data returned from IEBCOPY
+
+    Returns:
+        A SysprintReport
+    """
+    report = SysprintReport(printfile)
+    indd = None
+    with open(printfile, "r", encoding=("cp1047")) as input_file:
+        for line in input_file:
+            # the message id is the first word, after any carriage control
+            handler = _SYSPRINT_HANDLERS.get(
+                line[:line.find(" ", 1, 12)].lstrip("01-+ ")
+            )
+            if handler is not None:
+                handler(report, indd, line)
+            elif "913-00000038" in line:
+                _not_authorized(report, indd, line)
+            elif "INDD=" in line or "REFERENCED BY" in line:
+                # The next members belong to this copy group
+                found = _SYSPRINT_INDD.search(line)
+                if found is not None:
+                    indd = found.group(1)
+    return report
+
+
+def _sysprint_report(mvscmd_dictionary, printfile):
+    """Parse the SYSPRINT of an IEBCOPY run that did not end with rc 0
+
+    Args:
+        mvscmd_dictionary (dictionary): the data returned from the MVSCMD call
+        printfile (String): the SYSPRINT file
+
+    Returns:
+        A SysprintReport, or None if the rc is 0 or IEBCOPY did not get to
+        write its SYSPRINT, e.g. because a data set could not be allocated
+    """
+    if mvscmd_dictionary["rc"] == 0 or not os.path.exists(printfile):
+        return None
+    if "allocating" in mvscmd_dictionary["stderr_response"]:
+        return None
+    return parse_sysprint(printfile)
+
+
+def _remove_work_files(*filenames):
+    """Remove the SYSIN and SYSPRINT files, the SYSPRINT may not be there"""
+    for filename in filenames:
+        if os.path.exists(filename):
+            os.remove(filename)
+
+
+def _find_bad_members(memberlist, report):
     """Find the bad mambers in the list
 
     Args:
         memberlist (String): The list of members
-        printfile (String): file containing the data returned from IEBCOPY
+        report (SysprintReport): the parsed data returned from IEBCOPY
 
     Returns:
         badmembers (String): A string of members that weren't in the source
         dataset.
     """
     # If there isn't a comma in the list, there is only 1 member
-    if "," not in memberlist:
-        badmembers = memberlist
-    else:
-        # Read the sysprint to find which members were not in the dataset
-        badmembers = ""
-        with open(printfile, "r", encoding=("cp1047")) as input_file:
-            for line in input_file.readlines():
-                if "IEB177I" in line:
-                    text_list = line.split()
-                    badmembers += f"{text_list[1]},"
-                    badmembers = badmembers.rstrip(",")
-    return badmembers
+    if "," not in memberlist or report is None:
+        return memberlist
+    return ",".join(report.missing_members())
 
 
 def get_error_from_file(filename, source, destination):
@@ -51,37 +195,10 @@ def get_error_from_file(filename, source, destination):
     Returns:
         Message Text
     """
-    message = ""
-    with open(filename, "r", encoding=("cp1047")) as input_file:
-        for line in input_file.readlines():
-            if "IGW01513T" in line:
-                message = "Record Formats incompatible:"
-                line_list = line.split()
-                message = f"{message} {source} record format is {line_list[7]} "
-                message = f"{message} {destination} record format is {line_list[11]}"
-            elif "IEB127I" in line:
-                message = "Record Formats incompatible:"
-                line_list = line.split()
-                input_recfm = line_list[5][6:]
-                output_recfm = line_list[7][6:]
-                message = f"{message} {source} record format is {input_recfm}"
-                message = f"{message} {destination} record format is {output_recfm}"
-            elif "IEB124I" in line:
-                message = "Record length incompatible:"
-                line_list = line.split()
-                input_lrecl = line_list[5].strip("()")
-                output_lrecl = line_list[9].strip("().")
-                message = f"{message} {source} record length is {input_lrecl}"
-                message = f"{message} {destination} record length is {output_lrecl}"
-            elif "913-00000038" in line:
-                message = f"You are not authorized to {source}"
-
-    if len(message) < 1:
-        message = f"z/OS Unchecked error please check out: {filename}"
-    return message
+    return parse_sysprint(filename).error_message(source, destination)
 
 
-def _find_bad_dataset(error_text, source, destination):
+def _find_bad_dataset(error_text, source, destination, indd="SYSUT1"):
     """Figure out which datast is not there. If it isn't the source
        then it must be the destination
 
@@ -89,23 +206,39 @@ def _find_bad_dataset(error_text, source, destination):
         error_text (String): The error text
         source (String): The Source dataset
         destination (String): The destination dataset
+        indd (String): The DD name of the source dataset
 
     Returns:
         A string of members that were not in the source dataset
     """
-    if "SYSUT1" in error_text:
+    if re.search(rf"\b{indd}\b", error_text):
         return f"Dataset: {source} does not exist."
     return f"Dataset: {destination} does not exist."
 
 
-def _handle_return(mvscmd_dictionary, source, destination, printfile, memberlist):
+def _unallocated_datasets(error_text, datasets):
+    """Find the data sets whose DD names an allocation error mentions
+
+    Args:
+        error_text (String): The error text
+        datasets (dictionary): DD name -> dataset
+
+    Returns:
+        A list of the datasets, empty if no DD name is mentioned
+    """
+    ddnames = re.findall(r"\b[A-Z][A-Z0-9]{0,7}\b", error_text)
+    return [datasets[ddname] for ddname in dict.fromkeys(ddnames) if ddname in datasets]
+
+
+def _handle_return(mvscmd_dictionary, source, destination, report, memberlist):
     """Handle the result of the command
 
     Args:
         return_dictionary (dictionary): the data returned from the MVSCMD call
         source (string): the dataset that is the source
         destination (string): the dataset that is the destination
-        printfile (string): file containing output to sysprt
+        report (SysprintReport): the parsed SYSPRINT, None if the rc is 0
+            or there is no SYSPRINT
         memberlist (string): the list of members to be copied
 
     Returns:
@@ -120,7 +253,7 @@ def _handle_return(mvscmd_dictionary, source, destination, printfile, memberlist
     else:
         # Return code 4 is bad input parms so it must be the members that are wrong
         if mvscmd_dictionary["rc"] == 4:
-            badmembers = _find_bad_members(memberlist, printfile)
+            badmembers = _find_bad_members(memberlist, report)
             if "," in badmembers:
                 return_message = f"Members: {badmembers} are not in dataset {source}."
             else:
@@ -128,18 +261,308 @@ def _handle_return(mvscmd_dictionary, source, destination, printfile, memberlist
 
         # Return code 8 means the command is can't run. Probably because one of the
         # datasets are not allocated
-        if mvscmd_dictionary["rc"] == 8:
+        if mvscmd_dictionary["rc"] >= 8:
             error_text = mvscmd_dictionary["stderr_response"]
             if "allocating" in error_text:
                 return_message = _find_bad_dataset(error_text, source, destination)
             elif len(error_text) > 0:
                 return_message = f"z/OS Error: {error_text}"
+            elif report is not None:
+                return_message = report.error_message(source, destination)
             else:
-                return_message = get_error_from_file(printfile, source, destination)
+                return_message = (f"z/OS Error: IEBCOPY ended with rc {mvscmd_dictionary['rc']}"
+                                  " and wrote no SYSPRINT")
 
     return {"rc": mvscmd_dictionary["rc"], "message": return_message}
 
 
+def _work_file_names():
+    """Create the names of the SYSIN and SYSPRINT files for an IEBCOPY run
+
+    Returns:
+        A tuple with the SYSIN filename and the SYSPRINT filename
+    """
+    cwd = os.getcwd()  # need explicit paths for dds
+    # the process id keeps parallel copies from picking the same names
+    static_time = f"{datetime.now().timestamp()}.{os.getpid()}"
+    # This will hold any input into the program
+    sysinfile = f"{cwd}/sysin.{static_time}"
+    # This will hold any MVS messages
+    sysprtfile = f"{cwd}/sysprt.{static_time}"
+    return sysinfile, sysprtfile
+
+
+def _select_statements(members):
+    """Build SELECT statements for a list of members
+
+    A single SELECT statement has to fit on one card, so long member lists
+    are spread over several SELECT statements.
+
+    Args:
+        members (List): the members to select
+
+    Returns:
+        A list of SELECT statements
+    """
+    statements = []
+    current = []
+    for member in members:
+        if current and len(" SELECT MEMBER=()" + ",".join(current + [member])) > 71:
+            statements.append(f" SELECT MEMBER=({','.join(current)})")
+            current = []
+        current.append(member)
+    if current:
+        statements.append(f" SELECT MEMBER=({','.join(current)})")
+    return statements
+
+
+def _group_manifest(manifest):
+    """Group a manifest of copies by source and target data set
+
+    Args:
+        manifest (List): tuples of (source, target, members) where members
+            is a list of members or a string of members separated by a comma
+
+    Returns:
+        A dictionary of (source, target) to the list of members to copy
+    """
+    pairs = {}
+    for source, target, members in manifest:
+        if isinstance(members, str):
+            members = members.split(",")
+        pair_members = pairs.setdefault((source.upper(), target.upper()), [])
+        for member in members:
+            member = member.strip().upper()
+            if member and member not in pair_members:
+                pair_members.append(member)
+    return pairs
+
+
+def member_copy_many(manifest, debug_msgs=False):
+    """Copy members for many source and target pairs in one IEBCOPY run.
+
+    The manifest is grouped by source and target data set. Every pair gets
+    its own input and output DD and its own COPY group in a single SYSIN,
+    so IEBCOPY is only started once.
+    Args:
+         manifest (List): tuples of (source, target, members) where members
+             is a list of members or a string of members separated by a comma
+         debug_msgs (Boolean): Flag to print out debug messages
+
+    Returns:
+         A dictionary of (source, target, member) to a dictionary with a
+         return code and a message, the same as member_copy returns
+    """
+    if debug_msgs:
+        print("Running the member_copy_many function")
+
+    results, retained = _copy_pairs(_group_manifest(manifest), debug_msgs)
+    if retained:
+        print(
+            f"Input file: {retained[0]} and Output file: {retained[1]} have been retained"
+        )
+    return results
+
+
+def _copy_pairs(pairs, debug_msgs=False):
+    """Copy the members of several data set pairs in one IEBCOPY run
+
+    Args:
+         pairs (dictionary): (source, target) to the list of members to copy
+         debug_msgs (Boolean): Flag to keep the SYSIN and SYSPRINT files
+
+    Returns:
+         A tuple of the results, as returned by member_copy_many, and the
+         SYSIN and SYSPRINT filenames if they were retained, else None
+    """
+    from zoautil_py import mvscmd
+    from zoautil_py.types import DatasetDefinition, DDStatement, FileDefinition
+
+    if not pairs:
+        return {}, None
+
+    dd_list = []  # This will hold the list of dds for the IEBCOPY call
+    iebcopy_input = []
+    ddnames = {}  # (source, target) -> input DD name
+    for number, ((source, target), members) in enumerate(pairs.items(), start=1):
+        indd = f"IN{number:03d}"
+        outdd = f"OUT{number:03d}"
+        ddnames[(source, target)] = indd
+        dd_list.append(DDStatement(indd, DatasetDefinition(source)))
+        dd_list.append(DDStatement(outdd, DatasetDefinition(target)))
+        iebcopy_input.append(f" COPY OUTDD={outdd},INDD={indd}")
+        iebcopy_input.extend(_select_statements(members))
+
+    sysinfile, sysprtfile = _work_file_names()
+    create_sysin(iebcopy_input, sysinfile)
+    dd_list.append(DDStatement("SYSIN", FileDefinition(sysinfile)))
+    dd_list.append(DDStatement("SYSPRINT", FileDefinition(sysprtfile)))
+
+    # Execute the IEBCOPY Utility once for every pair
+    return_code_dict = (mvscmd.execute("IEBCOPY", dds=dd_list)).to_dict()
+    return_code = return_code_dict["rc"]
+    report = _sysprint_report(return_code_dict, sysprtfile)
+    missing = {}
+    if report is not None:
+        missing = {indd: set(report.missing_members(indd)) for indd in ddnames.values()}
+
+    # A failed allocation names the DD, which tells the pair it belongs to
+    unallocated = []
+    error_text = return_code_dict["stderr_response"]
+    if return_code != 0 and report is None and "allocating" in error_text:
+        datasets = {}
+        for (source, target), indd in ddnames.items():
+            datasets[indd] = source
+            datasets["OUT" + indd[2:]] = target
+        unallocated = _unallocated_datasets(error_text, datasets)
+
+    results = {}
+    for (source, target), members in pairs.items():
+        indd = ddnames[(source, target)]
+        copied = set(report.copied.get(indd, ())) if report is not None else set()
+        for member in members:
+            if return_code == 0 or member in copied:
+                result = {"rc": 0, "message": f"Member: {member} has been copied."}
+            elif member in missing.get(indd, ()):
+                result = {"rc": 4, "message": f"Member: {member} is not in dataset {source}."}
+            elif return_code == 4:
+                # rc 4 only means members were missing; the others were copied
+                # even if their message is not IEB154I, e.g. for a PDSE
+                result = {"rc": 0, "message": f"Member: {member} has been copied."}
+            elif report is not None and report.dataset_error(indd) is not None:
+                result = {"rc": return_code,
+                          "message": report.error_message(source, target, indd)}
+            elif source in unallocated or target in unallocated:
+                result = {"rc": return_code,
+                          "message": _find_bad_dataset(error_text, source, target, indd)}
+            elif unallocated:
+                result = {"rc": return_code,
+                          "message": f"Member: {member} was not copied because dataset: "
+                          f"{', '.join(unallocated)} does not exist."}
+            elif report is not None and report.dataset_error() is not None:
+                # the error belongs to the COPY group of another pair
+                result = {"rc": return_code,
+                          "message": f"Member: {member} was not copied because IEBCOPY "
+                          f"ended with rc {return_code} in another COPY group"}
+            elif len(error_text) > 0:
+                result = {"rc": return_code, "message": f"z/OS Error: {error_text}"}
+            elif report is not None:
+                result = {"rc": return_code,
+                          "message": report.error_message(source, target, indd)}
+            else:
+                result = {"rc": return_code,
+                          "message": f"z/OS Error: IEBCOPY ended with rc {return_code}"
+                          " and wrote no SYSPRINT"}
+            results[(source, target, member)] = result
+
+    # As long as we know what the error is then we can erase the input and output files
+    if not debug_msgs and all("z/OS" not in result["message"] for result in results.values()):
+        _remove_work_files(sysinfile, sysprtfile)
+        return results, None
+    return results, (sysinfile, sysprtfile)
+
+
+def _plan_parallel_copies(pairs, workers):
+    """Split data set pairs into batches that can run at the same time
+
+    Pairs that write to the same target library always end up in the same
+    batch, so two IEBCOPY runs never compete for the same target. The
+    targets are spread over the batches by member count, largest first.
+
+    Args:
+         pairs (dictionary): (source, target) to the list of members to copy
+         workers (int): the maximum number of batches
+
+    Returns:
+         A list of batches, each a dictionary like pairs
+    """
+    by_target = {}
+    for (source, target), members in pairs.items():
+        by_target.setdefault(target, {})[(source, target)] = members
+
+    def _member_count(target_pairs):
+        return sum(len(members) for members in target_pairs.values())
+
+    batches = [{} for _ in range(min(workers, len(by_target)))]
+    sizes = [0] * len(batches)
+    for target_pairs in sorted(by_target.values(), key=_member_count, reverse=True):
+        smallest = sizes.index(min(sizes))
+        batches[smallest].update(target_pairs)
+        sizes[smallest] += _member_count(target_pairs)
+    return batches
+
+
+def member_copy_parallel(manifest, workers=4, debug_msgs=False):
+    """Copy members for many data set pairs with several IEBCOPY runs at once.
+
+    The manifest is split into at most workers batches (see
+    _plan_parallel_copies) and every batch runs as one IEBCOPY in its own
+    process.
+    Args:
+         manifest (List): tuples of (source, target, members), see
+             member_copy_many
+         workers (int): the number of worker processes
+         debug_msgs (Boolean): Flag to print out debug messages
+
+    Returns:
+         A dictionary of (source, target, member) to a dictionary with a
+         return code and a message, the same as member_copy_many returns
+
+    Raises:
+         ValueError: if workers is less than 1
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    if workers < 1:
+        raise ValueError(f"workers must be at least 1, not {workers}")
+    if debug_msgs:
+        print("Running the member_copy_parallel function")
+
+    batches = _plan_parallel_copies(_group_manifest(manifest), workers)
+    results = {}
+    retained_files = []
+    with ProcessPoolExecutor(max_workers=max(1, len(batches))) as executor:
+        futures = [executor.submit(_copy_pairs, batch, debug_msgs) for batch in batches]
+        for future in futures:
+            batch_results, retained = future.result()
+            results.update(batch_results)
+            if retained:
+                retained_files.append(retained)
+
+    # Report all of the retained files together
+    for sysinfile, sysprtfile in retained_files:
+        print(
+            f"Input file: {sysinfile} and Output file: {sysprtfile} have been retained"
+        )
+
+    return results
+
+
+def _read_manifest(filename):
+    """Read a manifest file
+
+    Every line holds a source data set, a target data set and the members
+    to copy, separated by blanks. Blank lines and lines starting with #
+    are ignored.
+
+    Args:
+        filename (String): the manifest file
+
+    Returns:
+        A list of (source, target, members) tuples
+    """
+    manifest = []
+    with open(filename, "r") as manifest_file:
+        for line in manifest_file:
+            fields = line.split()
+            if not fields or fields[0].startswith("#"):
+                continue
+            if len(fields) < 3:
+                raise ValueError(f"Manifest line needs a source, target and members: {line}")
+            manifest.append((fields[0], fields[1], fields[2:]))
+    return manifest
+
+
 def member_copy(input_dataset, output_dataset, memberlist, debug_msgs=False):
     """Copy Members from one dataset to another.
 
@@ -153,22 +576,20 @@ def member_copy(input_dataset, output_dataset, memberlist, debug_msgs=False):
     Returns:
          Returns dictionary with a return code and a message
     """
+    from zoautil_py import mvscmd
+    from zoautil_py.types import DatasetDefinition, DDStatement, FileDefinition
+
     if debug_msgs:
         print("Running the member_copy function")
 
     dd_list = []  # This will hold the list of dds for the IEBCOPY call
 
-    cwd = os.getcwd()  # need explicit paths for dds
-    static_time = str(datetime.now().timestamp())
-    # This will hold any input into the program
-    sysinfile = f"{cwd}/sysin.{static_time}"
-    # This will hold any MVS messages
-    sysprtfile = f"{cwd}/sysprt.{static_time}"
+    sysinfile, sysprtfile = _work_file_names()
 
     # Create a SYSIN that defines the member or members to copy
     iebcopy_input = []
     iebcopy_input.append(" COPY OUTDD=SYSUT2,INDD=SYSUT1")
-    iebcopy_input.append(f" SELECT MEMBER=({memberlist.upper()})")
+    iebcopy_input.extend(_select_statements(memberlist.upper().split(",")))
 
     # Take the input data and put it into a file.
     create_sysin(iebcopy_input, sysinfile)
@@ -189,14 +610,14 @@ def member_copy(input_dataset, output_dataset, memberlist, debug_msgs=False):
     # Turn the return code object into a Python Dictionary
     # return_code_dict = return_code.to_dict()
     # If the return code is good, then we can get rid of the input file
+    report = _sysprint_report(return_code_dict, sysprtfile)
     return_dictionary = _handle_return(
-        return_code_dict, input_dataset, output_dataset, sysprtfile, memberlist
+        return_code_dict, input_dataset, output_dataset, report, memberlist
     )
 
     # As long as we know what the error is then we can erase the input and output files
     if "z/OS" not in return_dictionary["message"] and not debug_msgs:
-        os.remove(sysinfile)
-        os.remove(sysprtfile)
+        _remove_work_files(sysinfile, sysprtfile)
     else:
         print(
             f"Input file: {sysinfile} and Output file: {sysprtfile} have been retained"
@@ -208,14 +629,37 @@ def member_copy(input_dataset, output_dataset, memberlist, debug_msgs=False):
 def main():
     """Call the member_copy function
 
+    Call it with --manifest filename to copy the members listed in a file
+    instead, see _read_manifest for the format. Add --workers and a number
+    to spread the copies over that many processes.
     Args:
          input (String):  The input dataset
          output (String): The output dataset
          members (List):  A list of members that need to be copied
     """
+    # A manifest copies members for many data set pairs in one IEBCOPY run,
+    # or with --workers, in several IEBCOPY runs at the same time
+    if len(sys.argv) in (3, 5) and sys.argv[1] == "--manifest":
+        manifest = _read_manifest(sys.argv[2])
+        if len(sys.argv) == 5 and sys.argv[3] == "--workers":
+            if not sys.argv[4].isdigit() or int(sys.argv[4]) < 1:
+                print("--workers must be followed by a number of processes of at least 1")
+                print("member_copy.py --manifest filename --workers processes")
+                sys.exit(1)
+            results = member_copy_parallel(manifest, int(sys.argv[4]))
+        else:
+            results = member_copy_many(manifest)
+        for result in results.values():
+            if result["rc"] != 0:
+                print(f'Return Code:{result["rc"]}')
+            print(result["message"])
+        sys.exit(max((result["rc"] for result in results.values()), default=0))
+
     # If I don't have 3 arguments then I can't do anything
     if len(sys.argv) < 4:
         print("You must provide an input, output, and members")
+        print("or --manifest and a file of input, output, and members lines")
+        print("optionally followed by --workers and the number of processes")
         sys.exit(1)
 
     # Identify input and output datasets
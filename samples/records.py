@@ -0,0 +1,336 @@
+#!/usr/bin/env python3
+"""Code rights.
+
+Copyright IBM Corp 2026.
+records.py - read the records of FB and VB data sets that were copied to a
+file in binary, e.g. unloads copied to z/OS UNIX or to another system, and
+decode their fields without a SORT step.
+
+The file is mapped into memory and every record is a memoryview of the
+map, so nothing is copied until a field is decoded. VB files hold a 4 byte
+RDW in front of every record (as cp -B or an FTP transfer with RDW keeps
+them); with bdw=True they hold whole blocks with their BDWs instead.
+
+Fields are given the way SORT gives them: start,length,type with start
+counting from 1 and including the RDW of VB records, so 5,4,CH is the
+first 4 data bytes of a VB record. The types are:
+    CH  characters in cp1047 (or another code page), decoded to str
+    ZD  zoned decimal, the sign in the zone of the last byte
+    PD  packed decimal, the sign in the last half byte
+    BI  unsigned binary
+
+    with RecordFile("/u/racf.unload", "VB") as unload:
+        layout = RecordLayout([parse_field("5,4,CH", "type"),
+                               parse_field("10,8,CH", "user")])
+        for record in unload.records(layout):
+            if record["type"] == "0200":
+                print(record["user"])
+
+With NumPy installed, RecordFile.array() extracts one field of all records
+into an array; for FB files CH and BI fields are views of the map.
+"""
+import mmap
+from typing import NamedTuple
+
+FIELD_TYPES = ("CH", "ZD", "PD", "BI")
+RECFMS = ("FB", "VB")
+
+# Turns zoned decimal digits into ASCII digits, ignoring the zone
+_ZONED_DIGITS = bytes(0x30 + (byte & 0x0F) if byte & 0x0F < 10 else 0x30
+                      for byte in range(256))
+# ZD and PD fields with more digits than this do not fit in an int64 array
+_MAX_ARRAY_DIGITS = 18
+
+
+def decode_ch(field, codepage="cp1047"):
+    """Return a CH field as a str"""
+    return str(field, codepage)
+
+
+def decode_zd(field):
+    """Return the value of a ZD field, negative if the last zone is B or D"""
+    value = int(bytes(field).translate(_ZONED_DIGITS))
+    return -value if field[-1] >> 4 in (0xB, 0xD) else value
+
+
+def decode_pd(field):
+    """Return the value of a PD field, negative if the sign is B or D"""
+    digits = field.hex()
+    value = int(digits[:-1] or "0")
+    return -value if digits[-1] in "bd" else value
+
+
+def decode_bi(field):
+    """Return the value of a BI field"""
+    return int.from_bytes(field, "big")
+
+
+DECODERS = {"CH": decode_ch, "ZD": decode_zd, "PD": decode_pd, "BI": decode_bi}
+
+
+class Field(NamedTuple):
+    """A field of a record, see parse_field"""
+    name: str
+    start: int
+    length: int
+    field_type: str = "CH"
+
+    @property
+    def end(self):
+        """The offset just after the field"""
+        return self.start - 1 + self.length
+
+    def raw(self, record):
+        """Return the bytes of the field in record, without copying them"""
+        return record[self.start - 1:self.end]
+
+    def decode(self, record):
+        """Return the value of the field in record"""
+        return DECODERS[self.field_type](record[self.start - 1:self.end])
+
+
+def parse_field(text, name=None):
+    """Parse a field given as start,length[,type], e.g. 257,8,CH
+
+    Args:
+        text (str): the field, the type defaults to CH
+        name (str): optional, the name of the field, default the text
+
+    Returns:
+        Field: the field
+
+    Raises:
+        ValueError: if the field is not valid
+    """
+    parts = text.replace(" ", "").split(",")
+    if len(parts) not in (2, 3):
+        raise ValueError(f"field {text} is not start,length[,type]")
+    start, length = int(parts[0]), int(parts[1])
+    field_type = parts[2].upper() if len(parts) == 3 else "CH"
+    if field_type not in FIELD_TYPES:
+        raise ValueError(f"field {text}: type must be one of {', '.join(FIELD_TYPES)}")
+    if start < 1 or length < 1:
+        raise ValueError(f"field {text}: start and length must be at least 1")
+    return Field(name or text, start, length, field_type)
+
+
+class Record:
+    """A record whose fields are decoded when they are first used
+
+    record[name] returns the value of a field of the layout, or None if the
+    record ends before the field does (like SORT does with VLSHRT).
+    """
+
+    __slots__ = ("data", "layout", "_values")
+
+    def __init__(self, data, layout):
+        self.data = data
+        self.layout = layout
+        self._values = {}
+
+    def __getitem__(self, name):
+        try:
+            return self._values[name]
+        except KeyError:
+            pass
+        field = self.layout.fields[name]
+        value = field.decode(self.data) if field.end <= len(self.data) else None
+        self._values[name] = value
+        return value
+
+    def get(self, name, default=None):
+        """Return the value of a field, or default if the record is too short"""
+        value = self[name]
+        return default if value is None else value
+
+
+class RecordLayout:
+    """The named fields of a record type"""
+
+    def __init__(self, fields):
+        """
+        Args:
+            fields (list): the Field of every field
+        """
+        self.fields = {field.name: field for field in fields}
+
+    def record(self, data):
+        """Return data as a Record of this layout"""
+        return Record(data, self)
+
+
+class RecordFile:
+    """The records of an FB or VB file, as memoryviews of the mapped file
+
+    The records are only valid until the file is closed.
+    """
+
+    def __init__(self, path, recfm="FB", lrecl=80, bdw=False):
+        """
+        Args:
+            path (str): the file
+            recfm (str): FB, or VB for records with RDWs
+            lrecl (int): the record length of FB records
+            bdw (bool): VB records are in blocks that start with a BDW
+        """
+        recfm = recfm.upper()
+        if recfm not in RECFMS:
+            raise ValueError(f"record format must be one of {', '.join(RECFMS)}")
+        self.path = path
+        self.recfm = recfm
+        self.lrecl = lrecl
+        self.bdw = bdw
+        self._offsets = None
+        with open(path, "rb") as file:
+            try:
+                self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:
+                # an empty file cannot be mapped
+                self._map = None
+        self.view = memoryview(self._map if self._map is not None else b"")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """Unmap the file; left to the garbage collector while records are in use"""
+        try:
+            self.view.release()
+            if self._map is not None:
+                self._map.close()
+        except BufferError:
+            pass
+
+    def _variable_offsets(self):
+        """Yield (offset, length) of every VB record"""
+        view = self.view
+        position = 0
+        size = len(view)
+        while position + 4 <= size:
+            if self.bdw:
+                if view[position] & 0x80:
+                    # a large block, the BDW holds a 31 bit length
+                    block_end = position + (int.from_bytes(view[position:position + 4], "big")
+                                            & 0x7FFFFFFF)
+                else:
+                    block_end = position + (view[position] << 8 | view[position + 1])
+                position += 4
+            else:
+                block_end = size
+            while position + 4 <= block_end:
+                length = view[position] << 8 | view[position + 1]
+                if length < 4:
+                    raise ValueError(f"{self.path}: bad RDW at offset {position}")
+                yield position, length
+                position += length
+            if not self.bdw:
+                return
+
+    def offsets(self):
+        """Return the offset of every record in the file"""
+        if self._offsets is None:
+            if self.recfm == "FB":
+                self._offsets = range(0, len(self.view) - self.lrecl + 1, self.lrecl)
+            else:
+                self._offsets = [offset for offset, _ in self._variable_offsets()]
+        return self._offsets
+
+    def __len__(self):
+        return len(self.offsets())
+
+    def _slices(self, source):
+        """Yield the records as slices of source, the view or the map"""
+        if self.recfm == "FB":
+            lrecl = self.lrecl
+            for offset in range(0, len(self.view) - lrecl + 1, lrecl):
+                yield source[offset:offset + lrecl]
+        else:
+            for offset, length in self._variable_offsets():
+                yield source[offset:offset + length]
+
+    def __iter__(self):
+        return self._slices(self.view)
+
+    def record_bytes(self):
+        """Yield every record as bytes
+
+        This copies the records, but is faster than slicing memoryviews
+        when every record is used whole, e.g. written to another file.
+        """
+        return self._slices(self._map if self._map is not None else b"")
+
+    def records(self, layout):
+        """Yield every record as a Record of layout"""
+        for data in self:
+            yield Record(data, layout)
+
+    def column(self, field):
+        """Return the values of field in every record, None where it is missing"""
+        decode = DECODERS[field.field_type]
+        begin, end = field.start - 1, field.end
+        return [decode(data[begin:end]) if end <= len(data) else None for data in self]
+
+    def array(self, field, rows=None):
+        """Return the values of field in every record as a NumPy array
+
+        CH fields give an array of (cp1047) bytes, BI fields of 1, 2, 4 or
+        8 bytes an unsigned integer array and ZD and PD fields of up to 18
+        digits an int64 array; for FB files the first two are views of the
+        file. Longer numbers give an array of Python ints.
+
+        Args:
+            field (Field): the field
+            rows: optional, a NumPy index (e.g. a boolean mask) of the records
+
+        Raises:
+            ImportError: if NumPy is not installed
+            ValueError: if a selected record ends before the field
+        """
+        import numpy
+
+        if len(self.view) == 0:
+            data = numpy.zeros((0, field.length), dtype=numpy.uint8)
+        elif self.recfm == "FB":
+            if field.end > self.lrecl:
+                raise ValueError(f"field {field.name} ends after the record")
+            data = numpy.lib.stride_tricks.as_strided(
+                numpy.frombuffer(self._map, dtype=numpy.uint8, offset=field.start - 1),
+                shape=(len(self), field.length), strides=(self.lrecl, 1), writeable=False,
+            )
+        else:
+            pairs = numpy.array(list(self._variable_offsets()), dtype=numpy.int64)
+            offsets, lengths = pairs.reshape(-1, 2).T
+            if rows is not None:
+                offsets, lengths = offsets[rows], lengths[rows]
+                rows = None
+            if (lengths < field.end).any():
+                raise ValueError(f"field {field.name} ends after {(lengths < field.end).sum()}"
+                                 " of the records, select them with rows")
+            data = numpy.frombuffer(self._map, dtype=numpy.uint8)[
+                offsets[:, None] + (field.start - 1 + numpy.arange(field.length))
+            ]
+        if rows is not None:
+            data = data[rows]
+
+        if field.field_type == "BI" and field.length in (1, 2, 4, 8):
+            return data.view(f">u{field.length}")[:, 0]
+        if field.field_type in ("CH", "BI"):
+            return data.view(f"S{field.length}")[:, 0]
+        digits = field.length if field.field_type == "ZD" else 2 * field.length - 1
+        if digits > _MAX_ARRAY_DIGITS:
+            return numpy.array([DECODERS[field.field_type](bytes(row)) for row in data],
+                               dtype=object)
+        if field.field_type == "ZD":
+            values = data & 0x0F
+            signs = data[:, -1] >> 4
+        else:
+            nibbles = numpy.empty((len(data), 2 * field.length), dtype=numpy.uint8)
+            nibbles[:, 0::2] = data >> 4
+            nibbles[:, 1::2] = data & 0x0F
+            values, signs = nibbles[:, :-1], nibbles[:, -1]
+        powers = 10 ** numpy.arange(digits - 1, -1, -1, dtype=numpy.int64)
+        result = values.astype(numpy.int64) @ powers
+        return numpy.where((signs == 0xB) | (signs == 0xD), -result, result)
@@ -1,13 +1,15 @@
 #!/usr/bin/env python3
 """ Copyright IBM Corp 2021.
-    Submits a JCL job and returns status output in a Python dictionary
+    Submits a JCL job and returns status output in a Python dictionary.
+    Several jobs can be submitted at once with --many, in which case they
+    are run concurrently and a list of status dictionaries is returned.
 """
 
 import argparse
 import textwrap
 import time
 
-from zoautil_py import datasets, exceptions, jobs
+from job_poller import ACTIVE_STATUSES, JobPoller
 
 
 def runjob(jcl_ds: str):
@@ -19,6 +21,8 @@ def runjob(jcl_ds: str):
     Returns:
         dictionary: Python dictionary of job status - NAME, OWNER, STATUS, RC
     """
+    from zoautil_py import datasets, exceptions, jobs
+
     status_record = []
     current_status = {}
     # In case JCL job hangs, it will timeout at 70 seconds.
@@ -35,15 +39,18 @@ def runjob(jcl_ds: str):
         return -1
 
     print("Job " + job_submitted.name + " submitted")
-    # status will be stored / displayed until ACTIVE status changes
-    while (job_submitted.status == "AC"):
-        current_status = _set_current_status(job_submitted)
+
+    def _record(job):
+        # status will be stored / displayed until ACTIVE status changes
+        current_status = _set_current_status(job)
         print(current_status)
         # Keep a record of statuses in a list of dictionaries
         status_record.append(current_status)
-        # sleep for three seconds, adjust if more time is needed
-        time.sleep(3)
-        job_submitted.refresh()
+
+    # the poller checks often at first and backs off for long running jobs
+    poller = JobPoller()
+    poller.wait([job_submitted], report=_record)
+    print(f"Job {job_submitted.name}: {poller.summary()}")
 
     # return final status and add it to list for record keeping
     current_status = _set_current_status(job_submitted)
@@ -51,6 +58,110 @@ def runjob(jcl_ds: str):
     return current_status
 
 
+def expand_jcl_datasets(patterns: list):
+    """Expand data set patterns such as LIB(*) into a list of members
+
+    Args:
+        patterns (list): data set names, optionally with a member pattern
+
+    Returns:
+        list: fully qualified data set names to submit
+    """
+    from zoautil_py import datasets
+
+    jcl_datasets = []
+    for pattern in patterns:
+        if "(" in pattern and ("*" in pattern or "?" in pattern):
+            library = pattern.split("(")[0]
+            for member in datasets.list_members(pattern):
+                jcl_datasets.append(f"{library}({member})")
+        else:
+            jcl_datasets.append(pattern)
+    return jcl_datasets
+
+
+def runjobs(jcl_datasets: list, max_active: int = 8, poller: JobPoller = None):
+    """This function will submit several JCL jobs and wait for all of them
+
+    At most max_active jobs are in flight at any time. A single scheduler
+    loop submits new jobs as slots free up and refreshes every job that
+    is still active with one batched status query per tick. Once the
+    deadline of the poller has passed no more jobs are submitted and the
+    jobs still in flight are reported with their current status.
+
+    Args:
+        jcl_datasets (list): data set names to submit
+        max_active (int): maximum number of jobs running at the same time
+        poller (JobPoller): optional, controls the polling interval and
+            deadline, and collects the number of status queries per job
+
+    Returns:
+        list: one entry per data set, in the order given. Each entry is the
+        final status dictionary (NAME, OWNER, STATUS, RC), or -1 if the
+        job could not be submitted.
+
+    Raises:
+        ValueError: if max_active is less than 1
+    """
+    from zoautil_py import datasets, exceptions, jobs
+
+    if max_active < 1:
+        raise ValueError(f"max_active must be at least 1, not {max_active}")
+    timeoutsec = 70
+    results = [None] * len(jcl_datasets)
+    pending = list(enumerate(jcl_datasets))
+    pending.reverse()
+    in_flight = {}  # index -> job
+    if poller is None:
+        poller = JobPoller()
+    start = time.monotonic()
+
+    while (pending or in_flight) and not poller.expired():
+        # fill any free slots
+        while pending and len(in_flight) < max_active:
+            index, jcl_ds = pending.pop()
+            try:
+                if datasets.exists(jcl_ds) is True:
+                    job_submitted = jobs.submit(jcl_ds, timeout=timeoutsec)
+                else:
+                    print(f"Dataset {jcl_ds} not found, check that it exist")
+                    results[index] = -1
+                    continue
+            except exceptions.ZOAUException:
+                print(f"Invalid input {jcl_ds}")
+                results[index] = -1
+                continue
+            print("Job " + job_submitted.name + " submitted")
+            in_flight[index] = job_submitted
+            poller.reset()
+
+        # collect the jobs that are no longer active
+        for index, job_submitted in list(in_flight.items()):
+            if job_submitted.status not in ACTIVE_STATUSES:
+                print(f"Job {job_submitted.name} ended after "
+                      f"{poller.queries.get(job_submitted.id, 0)} status queries")
+                results[index] = _set_current_status(job_submitted)
+                del in_flight[index]
+
+        if in_flight and not (pending and len(in_flight) < max_active):
+            poller.sleep()
+            poller.poll(list(in_flight.values()))
+
+    # only left when the deadline has passed
+    for index, job_submitted in in_flight.items():
+        if job_submitted.status in ACTIVE_STATUSES:
+            print(f"Job {job_submitted.name} is still active after the deadline")
+        results[index] = _set_current_status(job_submitted)
+    for index, jcl_ds in pending:
+        print(f"Dataset {jcl_ds} not submitted, the deadline has passed")
+        results[index] = -1
+
+    wall_time = time.monotonic() - start
+    print(f"{len(jcl_datasets)} jobs finished in {wall_time:.1f} seconds "
+          f"({poller.summary()})")
+    return results
+
+
 def _print_to_log(status_record: list):
     """ Module can be called to write the record of statuses to a file.
         Record will be overwritten every time the script is run to prevent
@@ -87,17 +198,33 @@ def _parse_arguments():
             epilog=textwrap.dedent('''
                 Example:
                 runjob.py "MY.DATASET(JCLJOB)"
+                runjob.py --many "MY.DATASET(*)"
                 '''))
     parse_input.add_argument('dataset',
                              help="Enter job dataset to submit",
-                             type=str)
+                             type=str,
+                             nargs='+')
+    parse_input.add_argument('--many',
+                             help="Submit every matching data set concurrently",
+                             action='store_true')
+    parse_input.add_argument('--max-active',
+                             help="Maximum number of jobs in flight with --many",
+                             type=int,
+                             default=8)
     argument = parse_input.parse_args()
+    if argument.max_active < 1:
+        parse_input.error("--max-active must be at least 1")
     return argument
 
 
 def main():
     argument = _parse_arguments()
-    print(runjob(argument.dataset))
+    if argument.many:
+        jcl_datasets = expand_jcl_datasets(argument.dataset)
+        for status in runjobs(jcl_datasets, max_active=argument.max_active):
+            print(status)
+    else:
+        print(runjob(argument.dataset[0]))
 
 
 if __name__ == "__main__":
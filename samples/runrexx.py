@@ -8,8 +8,7 @@ import os
 import sys
 from datetime import datetime
 
-from zoautil_py import mvscmd
-from zoautil_py.types import DatasetDefinition, DDStatement, FileDefinition
+from create_sysin import _check_length, create_sysin, sysin_file
 
 
 def write_out_the_input(inputdata, filename):
@@ -23,18 +22,35 @@ def write_out_the_input(inputdata, filename):
     """
     # Take the input data and put it into a file.
     # (make sure it's EBCDIC and less than 72 bytes)
-    if len(inputdata) > 0:
-        with open(filename, "w", encoding="cp1047") as systsin:
-            for listitem in inputdata:
-                if len(listitem) > 72:
-                    raise Exception(
-                        f"Input lines must be 72 chars or fewer\n"
-                        f"{listitem} length: {len(listitem)}"
-                    )
-                systsin.write(f"{listitem}\n")
-    else:
-        with open(filename, "w", encoding="cp1047") as systsin:
-            systsin.write(" ")
+    create_sysin(inputdata, filename)
+
+
+def _output_dds(outputinfo):
+    """Create the DD for the output the REXX code writes, if there is one
+
+    Args:
+        outputinfo (dict): see runrexx
+
+    Returns:
+        A list with the DD statement, empty if there is no output DD
+    """
+    from zoautil_py.types import DatasetDefinition, DDStatement, FileDefinition
+
+    dd_list = []
+    #  The output can go to a dataset or a file
+    if len(outputinfo) != 0:
+        if "Filename" in outputinfo:
+            outputfilename = outputinfo["Filename"]
+            dd_list.append(
+                DDStatement(outputinfo["DDName"], FileDefinition(f"{outputfilename}"))
+            )
+
+    if "Dataset" in outputinfo:
+        outputfilename = outputinfo["Dataset"]
+        dd_list.append(
+            DDStatement(outputinfo["DDName"], DatasetDefinition(outputfilename))
+        )
+    return dd_list
 
 
 def runrexx(authorized, library, program_info, inputdata, outputinfo):
@@ -62,12 +78,13 @@ def runrexx(authorized, library, program_info, inputdata, outputinfo):
             sysprtfile: The filename that the SYSPRINT DD pointed to in case any
                    data is there
     """
+    from zoautil_py import mvscmd
+    from zoautil_py.types import DatasetDefinition, DDStatement, FileDefinition
+
     dd_list = []  # This will hold the list of dds for the IKJEFT01 call
 
     cwd = os.getcwd()  # need explicit paths for dds
     static_time = str(datetime.now().timestamp())
-    # This will hold any input into the program
-    systsinfile = f"{cwd}/systsin.{static_time}"
     # This will hold any MVS messages
     sysprtfile = f"{cwd}/sysprt.{static_time}"
     # This will hold TSO output
@@ -77,49 +94,30 @@ def runrexx(authorized, library, program_info, inputdata, outputinfo):
     # the REXX code
     dd_list.append(DDStatement("SYSEXEC", DatasetDefinition(library)))
 
-    # Take the input data and put it into a file.
-    write_out_the_input(inputdata, systsinfile)
-
-    # Now create a DD that points to the created file
-    dd_list.append(DDStatement("SYSTSIN", FileDefinition(systsinfile)))
-
     # If there is a DD that the REXX code is writing to, make sure that
     # there is a DD that points to it.
-    #  The output can go to a dataset or a file
-    if len(outputinfo) != 0:
-        if "Filename" in outputinfo:
-            outputfilename = outputinfo["Filename"]
-            dd_list.append(
-                DDStatement(outputinfo["DDName"], FileDefinition(f"{outputfilename}"))
-            )
-
-    if "Dataset" in outputinfo:
-        outputfilename = outputinfo["Dataset"]
-        dd_list.append(
-            DDStatement(outputinfo["DDName"], DatasetDefinition(outputfilename))
-        )
+    dd_list.extend(_output_dds(outputinfo))
 
     # Create DD statements that point to the files we defined
     dd_list.append(DDStatement("SYSPRINT", FileDefinition(sysprtfile)))
     dd_list.append(DDStatement("SYSTSPRT", FileDefinition(systsprtfile)))
 
-    # now we determine how to run the REXX code in IKJEFT01
-    if authorized is True:
-        # Execute the REXX code authorized
-        return_code_dict = (
-            mvscmd.execute_authorized("IKJEFT01", pgm_args=program_info, dds=dd_list)
-        ).to_dict()
-    else:
-        # Execute the code unauthorized
-        return_code_dict = (
-            mvscmd.execute("IKJEFT01", pg_args=program_info, dds=dd_list)
-        ).to_dict()
+    # Hand the input data to the program through a pipe, it is gone
+    # once the program has run
+    with sysin_file(inputdata, prefix="systsin") as systsinfile:
+        dd_list.append(DDStatement("SYSTSIN", FileDefinition(systsinfile)))
 
-    # Turn the return code object into a Python Dictionary
-    # return_code_dict = return_code.to_dict()
-    # If the return code is good, then we can get rid of the input file
-    if return_code_dict["rc"] == 0:
-        os.remove(systsinfile)
+        # now we determine how to run the REXX code in IKJEFT01
+        if authorized is True:
+            # Execute the REXX code authorized
+            return_code_dict = (
+                mvscmd.execute_authorized("IKJEFT01", pgm_args=program_info, dds=dd_list)
+            ).to_dict()
+        else:
+            # Execute the code unauthorized
+            return_code_dict = (
+                mvscmd.execute("IKJEFT01", pg_args=program_info, dds=dd_list)
+            ).to_dict()
 
     # Return all data to the caller in a dictionary
     return_data = {
@@ -131,6 +129,249 @@ def runrexx(authorized, library, program_info, inputdata, outputinfo):
     return return_data
 
 
+def _ikjeft01(authorized, dd_list, files):
+    """Run IKJEFT01 with the commands in the SYSTSIN DD
+
+    Args:
+        authorized (boolean): A flag to determine if the code run authorized
+        dd_list (list): the DD statements for the run
+        files (dict): DD name to file name for SYSTSIN, SYSTSPRT and SYSPRINT,
+                only needed by drivers that do not run IKJEFT01
+
+    Returns:
+        The return information from the command call as a dictionary
+    """
+    from zoautil_py import mvscmd
+
+    if authorized is True:
+        return mvscmd.execute_authorized("IKJEFT01", dds=dd_list).to_dict()
+    return mvscmd.execute("IKJEFT01", dds=dd_list).to_dict()
+
+
+def _library_attributes(library):
+    """Return the record format and record length of a REXX library
+
+    Args:
+        library (str): the library
+
+    Returns:
+        A tuple of the record format and length, FB 80 if the library is
+        not found; the allocation of SYSEXEC then reports it
+    """
+    from zoautil_py import datasets
+
+    found = datasets.list_datasets(library)
+    if not found:
+        return "FB", 80
+    return found[0].record_format, int(found[0].record_length)
+
+
+# The exec a RexxSession runs in IKJEFT01. Every line of the RXCALLS DD
+# holds the number of input lines and the command of one call. Each call
+# runs on a data stack of its own that holds the input from its RXInnnnn
+# DD followed by an empty line, and whatever it does not read is dropped
+# with the stack. SYSTSIN only holds the command that starts this exec, so
+# an exec that reads too far cannot read the next exec's command.
+SESSION_EXEC = "RXSESSN"
+_SESSION_EXEC_SOURCE = """/* REXX - run the execs of a runrexx.py RexxSession */
+"EXECIO * DISKR RXCALLS (STEM CALL. FINIS"
+do i = 1 to call.0
+  parse var call.i lines command
+  say "RXSESSN CALL" i
+  "NEWSTACK"
+  if lines > 0 then
+    "EXECIO" lines "DISKR RXI"right(i, 5, "0") "(FINIS"
+  queue ""
+  address TSO command
+  call_rc = rc
+  "DELSTACK"
+  say "RXSESSN END" i call_rc
+end
+exit 0
+"""
+
+
+class RexxSession:
+    """Run many REXX execs in a single IKJEFT01 address space.
+
+    Starting IKJEFT01 costs far more than a short exec, so a session queues
+    exec invocations with call() and runs all of them in one IKJEFT01 when
+    flush() is called or the with block ends.
+
+    The execs are run by the RXSESSN exec, which flush() writes to a
+    temporary library with the record format of library. It gives every exec its input lines on a data stack
+    of its own, followed by an empty line, so an exec that reads its input
+    until an empty line stops at the right place, and input an exec does
+    not read is discarded instead of being run as a TSO command. RXSESSN
+    says a line before and after every exec; those lines split SYSTSPRT
+    into one file per call.
+
+        with RexxSession(False, "USER.REXX") as session:
+            first = session.call("HELOWRLD one", ["Line 1"])
+            second = session.call("HELOWRLD two", [])
+        print(session.results[first]["systsprtfile"])
+    """
+
+    def __init__(self, authorized, library, outputinfo=None, driver=_ikjeft01):
+        """
+        Args:
+            authorized (boolean): A flag to determine if the code run authorized
+            library (str): library that the REXX code is in
+            outputinfo (dict): the output DD shared by all execs, see runrexx
+            driver (function): runs IKJEFT01, see _ikjeft01. Replace it to run
+                    sessions without z/OS.
+        """
+        self.authorized = authorized
+        self.library = library
+        self.outputinfo = outputinfo or {}
+        self.driver = driver
+        self.results = []  # one return_data dictionary per call
+        self._pending = []  # (program_info, inputdata) not yet run
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.flush()
+
+    def call(self, program_info, inputdata=None):
+        """Queue an exec invocation
+
+        Args:
+            program_info: A string containing the program and its arguments
+            inputdata (list): input lines for the exec
+
+        Returns:
+            The index of the call in results, filled in by flush()
+
+        Raises:
+            ValueError: if program_info or an input line holds a line break,
+                which would split it into several records
+            CardImageError: if program_info or an input line does not fit
+                on a card, so flush() would fail for every call
+        """
+        inputdata = list(inputdata or [])
+        for text in [program_info] + inputdata:
+            if "\n" in text or "\r" in text:
+                raise ValueError(f"Line breaks cannot be passed to an exec: {text!r}")
+        if not program_info.strip():
+            raise ValueError("The program to call is empty")
+        _check_length([f"{len(inputdata)} {program_info}"])
+        _check_length(inputdata)
+        self._pending.append((program_info, inputdata))
+        return len(self.results) + len(self._pending) - 1
+
+    def flush(self):
+        """Run all queued execs in one IKJEFT01
+
+        Returns:
+            A list with a dictionary per call, with the same keys runrexx
+            returns plus exec_rc, the return code of the exec (None if it
+            did not end, e.g. because it abended). returninfo and
+            sysprintfile are shared by all calls, systsprtfile holds only
+            the output of that call.
+        """
+        from contextlib import ExitStack
+
+        from zoautil_py import datasets
+        from zoautil_py.types import DatasetDefinition, DDStatement, FileDefinition
+
+        if not self._pending:
+            return []
+        calls, self._pending = self._pending, []
+
+        cwd = os.getcwd()  # need explicit paths for dds
+        static_time = str(datetime.now().timestamp())
+        sysprtfile = f"{cwd}/sysprt.{static_time}"
+        systsprtfile = f"{cwd}/systsprt.{static_time}"
+
+        # a SYSEXEC concatenation needs libraries of the same format
+        record_format, record_length = _library_attributes(self.library)
+        session_library = datasets.tmp_name()
+        datasets.create(session_library, type="PDS", record_format=record_format,
+                        record_length=record_length)
+        try:
+            datasets.write(f"{session_library}({SESSION_EXEC})", _SESSION_EXEC_SOURCE)
+            dd_list = [DDStatement("SYSEXEC", [DatasetDefinition(session_library),
+                                               DatasetDefinition(self.library)])]
+            dd_list.extend(_output_dds(self.outputinfo))
+            dd_list.append(DDStatement("SYSPRINT", FileDefinition(sysprtfile)))
+            dd_list.append(DDStatement("SYSTSPRT", FileDefinition(systsprtfile)))
+            with ExitStack() as stack:
+                files = {"SYSTSPRT": systsprtfile, "SYSPRINT": sysprtfile}
+                files["SYSTSIN"] = stack.enter_context(
+                    sysin_file([f"%{SESSION_EXEC}"], prefix="systsin"))
+                files["RXCALLS"] = stack.enter_context(sysin_file(
+                    [f"{len(inputdata)} {program_info}" for program_info, inputdata in calls],
+                    prefix="rxcalls"))
+                for number, (_, inputdata) in enumerate(calls, start=1):
+                    if inputdata:
+                        files[f"RXI{number:05d}"] = stack.enter_context(
+                            sysin_file(inputdata, prefix="rxinput"))
+                dd_list.extend(DDStatement(ddname, FileDefinition(filename))
+                               for ddname, filename in files.items()
+                               if ddname not in ("SYSTSPRT", "SYSPRINT"))
+                return_code_dict = self.driver(self.authorized, dd_list, files)
+        finally:
+            datasets.delete(session_library)
+
+        with open(systsprtfile, "r", encoding="cp1047") as systsprt:
+            segments = split_systsprt(systsprt, len(calls))
+
+        results = []
+        for number, (segment, exec_rc) in enumerate(segments):
+            callfile = f"{systsprtfile}.{number}"
+            with open(callfile, "w", encoding="cp1047") as output:
+                output.writelines(segment)
+            results.append({
+                "returninfo": return_code_dict,
+                "systsprtfile": callfile,
+                "sysprintfile": sysprtfile,
+                "exec_rc": exec_rc,
+            })
+        os.remove(systsprtfile)
+        self.results.extend(results)
+        return results
+
+
+def split_systsprt(lines, count):
+    """Split the SYSTSPRT of a RexxSession into the output of each call
+
+    The output of call n is between the lines "RXSESSN CALL n" and
+    "RXSESSN END n rc" that the RXSESSN exec says. Anything outside them,
+    such as the READY prompts, is dropped.
+
+    Args:
+        lines: the SYSTSPRT lines, any iterable of strings
+        count (int): the number of calls
+
+    Returns:
+        A list with a tuple (output lines, exec rc) per call. The rc is an
+        int, the text TSO gave for it if that is not a number, or None if
+        the call did not end.
+    """
+    segments = [([], None) for _ in range(count)]
+    current = None
+    for line in lines:
+        words = line.split()
+        if len(words) >= 3 and words[0] == "RXSESSN" and words[2].isdigit():
+            number = int(words[2]) - 1
+            if words[1] == "CALL" and len(words) == 3 and 0 <= number < count:
+                current = number
+                continue
+            if words[1] == "END" and number == current:
+                exec_rc = words[3] if len(words) > 3 else None
+                if exec_rc is not None and exec_rc.lstrip("-").isdigit():
+                    exec_rc = int(exec_rc)
+                segments[current] = (segments[current][0], exec_rc)
+                current = None
+                continue
+        if current is not None:
+            segments[current][0].append(line)
+    return segments
+
+
 def main():
     """Call the runrexx function.
 
@@ -0,0 +1,308 @@
+#! /usr/bin/env python3
+"""
+Code rights.
+
+Copyright IBM Corp 2026.
+smpe_inventory.py - keep an inventory of the SYSMODs in SMP/E zones in a
+local SQLite database and report what changed since the last run.
+
+Each run lists the zones with smpe_list.smpe_list_zones (one GIMSMP run
+for all zones), stores the SYSMODs of every zone and records the SYSMODs
+that were added, removed or changed since the previous snapshot. Only the
+differences are written, and a diff is read back from the changes table
+without comparing listings, so queries stay fast for large inventories.
+
+With --incremental the record counts that LISTCAT reports for the CSI
+(REC-TOTAL, REC-UPDATED, REC-INSERTED, REC-DELETED) are compared with
+those of the last snapshot first, and nothing is listed if they have not
+moved.
+
+    smpe_inventory.py SYS1 -z MVST MVSD --incremental
+"""
+import argparse
+import hashlib
+import os
+import re
+import sys
+import time
+from typing import NamedTuple, Optional
+
+from create_sysin import sysin_file
+import smpe_list
+
+INVENTORY_DB = os.path.expanduser("~/.smpe_inventory.db")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS snapshots (
+    id INTEGER PRIMARY KEY,
+    csi TEXT, zone TEXT, taken REAL, change_token TEXT, sysmods INTEGER);
+CREATE TABLE IF NOT EXISTS sysmods (
+    csi TEXT, zone TEXT, name TEXT, type TEXT, status TEXT, fmid TEXT,
+    digest TEXT, PRIMARY KEY (csi, zone, name)) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS sysmods_name ON sysmods (name);
+CREATE TABLE IF NOT EXISTS changes (
+    snapshot INTEGER, name TEXT, change TEXT, old_status TEXT, new_status TEXT);
+CREATE INDEX IF NOT EXISTS changes_snapshot ON changes (snapshot);
+"""
+
+# The LISTCAT statistics that move whenever a record of the CSI changes
+_LISTCAT_STATS = re.compile(r"(REC-TOTAL|REC-UPDATED|REC-INSERTED|REC-DELETED)-*(\d+)")
+
+
+class Change(NamedTuple):
+    """
+    A SYSMOD that was added, removed or changed between two snapshots.
+    """
+    name: str
+    change: str
+    old_status: Optional[str]
+    new_status: Optional[str]
+
+
+def _sysmod_row(entry):
+    """
+    Return the values stored for a SYSMOD entry. The digest covers all of
+    its attributes, so any change to the entry changes it.
+    """
+    attributes = "\n".join(f"{keyword}={value}" for keyword, value
+                           in sorted(entry.attributes.items()))
+    digest = hashlib.sha1(attributes.encode()).hexdigest()
+    return (entry.attributes.get("TYPE"), entry.attributes.get("STATUS"),
+            entry.attributes.get("FMID"), digest)
+
+
+class SmpeInventory:
+    """
+    The SQLite database that holds the current SYSMODs of every zone, one
+    row per snapshot, and the changes each snapshot brought.
+    """
+
+    def __init__(self, path=INVENTORY_DB):
+        import sqlite3
+
+        self.connection = sqlite3.connect(path)
+        # the inventory can be rebuilt from SMP/E, so trade durability for speed
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.executescript(_SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        self.connection.close()
+
+    def last_snapshot(self, csi, zone):
+        """
+        Return (id, change token) of the newest snapshot of a zone, or None.
+        """
+        return self.connection.execute(
+            "SELECT id, change_token FROM snapshots WHERE csi = ? AND zone = ?"
+            " ORDER BY id DESC LIMIT 1", (csi, zone)
+        ).fetchone()
+
+    def record(self, csi, zone, entries, change_token=None):
+        """
+        Store a new snapshot of a zone from its SYSMOD entries (SmpeEntry)
+        and return its id. Only the rows of SYSMODs that were added,
+        removed or changed are written.
+        """
+        current = {
+            name: (status, digest) for name, status, digest in self.connection.execute(
+                "SELECT name, status, digest FROM sysmods WHERE csi = ? AND zone = ?",
+                (csi, zone))
+        }
+        rows = {entry.name: _sysmod_row(entry) for entry in entries}
+
+        with self.connection:
+            snapshot = self.connection.execute(
+                "INSERT INTO snapshots (csi, zone, taken, change_token, sysmods)"
+                " VALUES (?, ?, ?, ?, ?)", (csi, zone, time.time(), change_token, len(rows))
+            ).lastrowid
+
+            changes = []
+            upserts = []
+            for name, (sysmod_type, status, fmid, digest) in rows.items():
+                old = current.pop(name, None)
+                if old is None:
+                    changes.append((snapshot, name, "added", None, status))
+                elif old[1] != digest:
+                    changes.append((snapshot, name, "changed", old[0], status))
+                else:
+                    continue
+                upserts.append((csi, zone, name, sysmod_type, status, fmid, digest))
+            for name, (status, _) in current.items():
+                changes.append((snapshot, name, "removed", status, None))
+
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO sysmods VALUES (?, ?, ?, ?, ?, ?, ?)", upserts)
+            self.connection.executemany(
+                "DELETE FROM sysmods WHERE csi = ? AND zone = ? AND name = ?",
+                [(csi, zone, name) for name in current])
+            self.connection.executemany(
+                "INSERT INTO changes VALUES (?, ?, ?, ?, ?)", changes)
+        return snapshot
+
+    def diff(self, csi, zone, snapshot=None):
+        """
+        Return the changes of a snapshot, by default the newest of the
+        zone, as a dictionary of "added", "removed" and "changed" lists.
+        """
+        if snapshot is None:
+            last = self.last_snapshot(csi, zone)
+            snapshot = last[0] if last else None
+        result = {"added": [], "removed": [], "changed": []}
+        for row in self.connection.execute(
+                "SELECT name, change, old_status, new_status FROM changes"
+                " WHERE snapshot = ? ORDER BY name", (snapshot,)):
+            result[row[1]].append(Change(*row))
+        return result
+
+    def find(self, name, status=None):
+        """
+        Return (csi, zone, status) for every zone that has SYSMOD name.
+        With status (e.g. "APP") only zones where the SYSMOD has it count.
+        """
+        return [
+            row for row in self.connection.execute(
+                "SELECT csi, zone, status FROM sysmods WHERE name = ?"
+                " ORDER BY csi, zone", (name,))
+            if status is None or status in (row[2] or "").split()
+        ]
+
+
+def csi_change_token(csi):
+    """
+    Return the LISTCAT record statistics of the CSI as one string, or None
+    if LISTCAT fails. The string changes whenever a record of the CSI is
+    inserted, updated or deleted.
+    """
+    import tempfile
+    from zoautil_py import mvscmd
+    from zoautil_py.types import DDStatement, FileDefinition
+
+    sysprint = os.path.join(tempfile.gettempdir(), f"listcat.{os.getpid()}")
+    try:
+        with sysin_file([f" LISTCAT ENTRIES('{csi}') ALL"]) as sysin:
+            result = mvscmd.execute_authorized(
+                "IDCAMS",
+                dds=[DDStatement("SYSIN", FileDefinition(sysin)),
+                     DDStatement("SYSPRINT", FileDefinition(sysprint))],
+            ).to_dict()
+        if result["rc"] != 0:
+            return None
+        with open(sysprint, "r", encoding="cp1047") as listing:
+            stats = [f"{key}={value}" for line in listing
+                     for key, value in _LISTCAT_STATS.findall(line)]
+    finally:
+        if os.path.exists(sysprint):
+            os.remove(sysprint)
+    return " ".join(stats) or None
+
+
+def refresh(inventory, csi, zones, high_level_qualifier="SYS1", incremental=False):
+    """
+    List the zones in one GIMSMP run and record a snapshot of each. With
+    incremental, zones whose last snapshot has the current change token of
+    the CSI are skipped, and nothing is listed if all of them are.
+
+    Nothing is recorded if GIMSMP ends with a return code above 4, and a
+    zone that is not in the listing is not recorded either, so a failed
+    run never marks SYSMODs removed or stores its change token. If the
+    listing cannot be read, the OSError of smpe_list.read_listing is
+    raised before anything is recorded.
+
+    Returns a dictionary of zone to the new snapshot id (None for a zone
+    that was listed but is not in the listing), and the GIMSMP result
+    (None if GIMSMP did not run).
+    """
+    change_token = csi_change_token(csi)
+    if incremental and change_token is not None:
+        zones = [zone for zone in zones
+                 if (inventory.last_snapshot(csi, zone) or (None, None))[1] != change_token]
+    if not zones:
+        return {}, None
+
+    command_return_code, index = smpe_list.smpe_list_zones(
+        zones, "SYSMODS", high_level_qualifier, csi=csi
+    )
+    if command_return_code.to_dict()["rc"] > 4:
+        return {}, command_return_code
+    by_zone = {zone: [] for zone in zones}
+    for (zone, entry_type, _), entry in index.entries.items():
+        if entry_type == "SYSMOD" and zone in by_zone:
+            by_zone[zone].append(entry)
+    snapshots = {
+        zone: inventory.record(csi, zone, entries, change_token) if entries else None
+        for zone, entries in by_zone.items()
+    }
+    return snapshots, command_return_code
+
+
+def parse_args(argv=None):
+    """
+    This function is responsible for handling arguments. It relies on
+    the argparse module.
+    """
+    program_name = os.path.basename(sys.argv[0])
+
+    if argv is None:
+        argv = sys.argv[1:]
+
+    parser = argparse.ArgumentParser(program_name)
+    parser.add_argument("hlq", help="The High Level Qualifier to be used.")
+    parser.add_argument("-z", "--zone", nargs="+", required=True,
+                        help="The zones to take a snapshot of.")
+    parser.add_argument("-c", "--csi", default=None,
+                        help="The CSI, by default the one in SMPElistDefaults.yaml.")
+    parser.add_argument("-i", "--incremental", action="store_true",
+                        help="Skip zones if the CSI has not changed since their last snapshot.")
+    parser.add_argument("-d", "--database", default=INVENTORY_DB,
+                        help="The SQLite inventory file.")
+    return parser.parse_args(argv)
+
+
+def main():
+    """
+    Main function. Take a snapshot of the zones and print what changed.
+    """
+    args = parse_args()
+    csi = args.csi
+    if csi is None:
+        csi = smpe_list.get_defaults()["SMPECSI"]["dataset"]
+
+    with SmpeInventory(args.database) as inventory:
+        try:
+            snapshots, command_return_code = refresh(
+                inventory, csi, args.zone, args.hlq, args.incremental
+            )
+        except OSError as error:
+            sys.stderr.write(f"The SMP/E listing could not be read: {error}\n")
+            sys.exit(8)
+        if command_return_code is not None:
+            result = command_return_code.to_dict()
+            if result["rc"] > 4:
+                sys.stderr.write(f"Return Code: {result['rc']}\n")
+                sys.stderr.write(f"Message from the system:\n{result}\n")
+                sys.exit(result["rc"])
+
+        for zone in args.zone:
+            if zone not in snapshots:
+                print(f"{zone}: unchanged")
+                continue
+            if snapshots[zone] is None:
+                print(f"{zone}: no SYSMODs in the listing, the inventory is unchanged")
+                continue
+            diff = inventory.diff(csi, zone, snapshots[zone])
+            print(f"{zone}: {len(diff['added'])} added, {len(diff['removed'])} removed, "
+                  f"{len(diff['changed'])} changed")
+            for change in diff["added"] + diff["removed"] + diff["changed"]:
+                print(f"  {change.change:8s} {change.name:8s} "
+                      f"{change.old_status or '-'} -> {change.new_status or '-'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,8 @@
 #! /usr/bin/env python3
 """
 List SMPE Data. This is a Python implementation that provides the ability to
-list data stored in SMPE. It relies on yaml to get defaults and argparse to
-handle input.
+list data stored in SMPE. It relies on yaml (or json) to get defaults and
+argparse to handle input.
 It would replace the following JCL:
 //SMPLIST  JOB ,,MSGLEVEL=1,MSGCLASS=H,CLASS=A,REGION=0M,
 //             NOTIFY=&SYSUID
@@ -21,18 +21,63 @@ It would replace the following JCL:
  """
 import sys
 import os
-import yaml
+import re
+import textwrap
+import json
 import argparse
-from zoautil_py import mvscmd, datasets
-from zoautil_py.types import DDStatement, DatasetDefinition, FileDefinition
+from typing import NamedTuple
+from create_sysin import sysin_file
+from work_datasets import WorkDatasetPool
 
+# SMPWRK6 data sets, shared by all smpe_list calls of this process
+_work_pool = None
 
-def smpe_list(target_zone="GLOBAL", list_options=None, high_level_qualifier="SYS1"):
+
+def work_pool(defaults):
     """
-    This function does the heavy lifting. It performs the function that
-        is contained in the JCL. It sets up the DD statements and issues the
-        call to the executable.
+    Return the pool of SMPWRK6 data sets, creating it on first use. Its
+    data sets are deleted when the program ends.
+    """
+    global _work_pool
+    if _work_pool is None:
+        _work_pool = WorkDatasetPool(
+            {
+                "type": "PDSE",
+                "primary_space": (defaults["TEMP_DATASET"]["primary_space"]).strip(),
+                "secondary_space": (defaults["TEMP_DATASET"]["secondary_space"]).strip(),
+                "block_size": 3200,
+                "record_format": "FB",
+                "record_length": 80,
+                "directory_blocks": 10,
+            }
+        )
+    return _work_pool
+
+
+def _smpcntl(zones, list_options):
+    """
+    Build the SMPCNTL statements: a SET and a LIST for every zone. SMP/E
+    statements are free form so long list options can simply go on to the
+    next line.
+    """
+    smpcntl = []
+    for zone in zones:
+        smpcntl.append(f"SET     BDY({zone}).")
+        if list_options is None:
+            smpcntl.append("LIST.")
+        else:
+            smpcntl.extend(textwrap.wrap(f"LIST {list_options}.", 71))
+    return smpcntl
+
+
+def _run_gimsmp(smpcntl, high_level_qualifier, pool, csi=None):
     """
+    Run GIMSMP with the SMPCNTL statements in smpcntl against csi, by
+    default the CSI in the defaults. Returns the result of the call and
+    the name of the data set SMPLIST was written to.
+    """
+    from zoautil_py import mvscmd, datasets
+    from zoautil_py.types import DDStatement, DatasetDefinition, FileDefinition
 
     # Initialize DD List
     dd_list = []
@@ -40,46 +85,26 @@ def smpe_list(target_zone="GLOBAL", list_options=None, high_level_qualifier="SYS
     # and the temporary dataset
     temp_dataset = None
 
-    # setup the filename just in case
-    sysin_file_name = None
-
     # get the defaults from the yaml file
-    defaults = get_defaults("./SMPElistDefaults.yaml")
+    defaults = get_defaults()
 
     try:
         # Setup base DDs
-        dd_list.append(
-            DDStatement("SMPCSI", DatasetDefinition(defaults["SMPECSI"]["dataset"]))
-        )
+        if csi is None:
+            csi = defaults["SMPECSI"]["dataset"]
+        dd_list.append(DDStatement("SMPCSI", DatasetDefinition(csi)))
         dd_list.append(DDStatement("SMPLOG", "DUMMY"))
         dd_list.append(DDStatement("SMPLOGA", "DUMMY"))
 
-        # Create Temporary File
-        temp_dataset_name = datasets.tmp_name(high_level_qualifier)
-        datasets.create(
-            temp_dataset_name,
-            type="PDS",
-            primary_space=(defaults["TEMP_DATASET"]["primary_space"]).strip(),
-            secondary_space=(defaults["TEMP_DATASET"]["secondary_space"]).strip(),
-            block_size=3200,
-            record_format="FB",
-            record_length=80,
-            volumes=(defaults["TEMP_DATASET"]["volume"]).strip(),
-            directory_blocks=10,
+        # Lease an empty work data set from the pool
+        if pool is None:
+            pool = work_pool(defaults)
+        temp_dataset = pool.acquire(
+            high_level_qualifier, (defaults["TEMP_DATASET"]["volume"]).strip()
         )
 
         # add it to the ddList
-        dd_list.append(DDStatement("SMPWRK6", DatasetDefinition(temp_dataset_name)))
-
-        # define the input for the program make - sure the input is EBCIDIC
-        sysin_file_name = defaults["SMPECNTL"]["filename"]
-        with open(sysin_file_name, mode="w", encoding="cp1047") as file:
-            file.write(f"SET     BDY({target_zone}).\n")
-            if list_options is None:
-                file.write("LIST.\n")
-            else:
-                file.write(f"LIST {list_options}.\n")
-        dd_list.append(DDStatement("SMPCNTL", FileDefinition(sysin_file_name)))
+        dd_list.append(DDStatement("SMPWRK6", DatasetDefinition(temp_dataset)))
 
         # define the place for the output to go
         output_dataset_name = datasets.tmp_name(high_level_qualifier)
@@ -92,8 +117,13 @@ def smpe_list(target_zone="GLOBAL", list_options=None, high_level_qualifier="SYS
         )
         dd_list.append(DDStatement("SMPLIST", DatasetDefinition(output_dataset_name)))
 
-        # execute the program
-        command_return_code = mvscmd.execute_authorized(pgm="GIMSMP", dds=dd_list)
+        # execute the program, SMPCNTL is fed to it through a pipe named
+        # after the SMPECNTL filename in the defaults
+        sysin_file_name = defaults["SMPECNTL"]["filename"]
+        with sysin_file(smpcntl, directory=os.path.dirname(sysin_file_name),
+                        prefix=os.path.basename(sysin_file_name)) as smpcntl_file:
+            dd_list.append(DDStatement("SMPCNTL", FileDefinition(smpcntl_file)))
+            command_return_code = mvscmd.execute_authorized(pgm="GIMSMP", dds=dd_list)
 
     except Exception as e:
         sys.stderr.write("Error processing command environment...\n")
@@ -101,45 +131,288 @@ def smpe_list(target_zone="GLOBAL", list_options=None, high_level_qualifier="SYS
         sys.exit(1)
 
     finally:
-        # remove temporary dataset and file
+        # give the work dataset back to the pool
         if temp_dataset:
-            datasets.delete(temp_dataset_name)
-        if sysin_file_name is not None:
-            os.remove(sysin_file_name)
+            pool.release(temp_dataset)
+
+    return command_return_code, output_dataset_name
+
+
+def smpe_list(target_zone="GLOBAL", list_options=None, high_level_qualifier="SYS1",
+              pool=None):
+    """
+    This function does the heavy lifting. It performs the function that
+        is contained in the JCL. It sets up the DD statements and issues the
+        call to the executable. The SMPWRK6 data set is leased from pool
+        (by default the one work_pool returns), so repeated calls reuse it.
+    """
+    command_return_code, output_dataset_name = _run_gimsmp(
+        _smpcntl([target_zone], list_options), high_level_qualifier, pool
+    )
 
     print(f"Output can be found in: {output_dataset_name}\n")
 
     return command_return_code
 
 
-def get_defaults(filename):
+def smpe_list_zones(zones, list_options=None, high_level_qualifier="SYS1",
+                    pool=None, keep_output=False, csi=None):
+    """
+    List many zones in a single GIMSMP run and parse the listing into an
+    SmpeIndex. The listing is read as it is parsed, so it is never held in
+    memory as a whole. The SMPLIST data set is deleted afterwards unless
+    keep_output is True. csi overrides the CSI in the defaults.
+
+    Returns the result of the GIMSMP call and the SmpeIndex.
+    """
+    from zoautil_py import datasets
+
+    command_return_code, output_dataset_name = _run_gimsmp(
+        _smpcntl(zones, list_options), high_level_qualifier, pool, csi
+    )
+
+    index = SmpeIndex()
+    try:
+        for entry in parse_smplist(read_listing(output_dataset_name)):
+            index.add(entry)
+    finally:
+        if keep_output:
+            print(f"Output can be found in: {output_dataset_name}\n")
+        else:
+            datasets.delete(output_dataset_name)
+
+    return command_return_code, index
+
+
+def read_listing(dataset_name):
+    """
+    Yield the lines of a data set one at a time, as cat reads them. If
+    the caller stops early, cat is terminated. Raises OSError with the
+    message of cat if it cannot read the data set.
+    """
+    import subprocess
+
+    process = subprocess.Popen(
+        ["cat", f"//'{dataset_name}'"], stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE, text=True, errors="replace"
+    )
+    try:
+        for line in process.stdout:
+            yield line
+    finally:
+        process.stdout.close()
+        if process.poll() is None:
+            process.terminate()
+        errors = process.stderr.read()
+        process.stderr.close()
+        process.wait()
+    # only reached when every line was read
+    if process.returncode != 0:
+        raise OSError(f"cat of {dataset_name} ended with rc {process.returncode}: "
+                      f"{errors.strip()}")
+
+
+class SmpeEntry(NamedTuple):
+    """
+    One entry of an SMP/E LIST: the zone it is in, the entry type (SYSMOD,
+    MOD, MAC, ...), its name and its attributes. An attribute that is
+    continued over several lines has its values joined by blanks.
+    """
+    zone: str
+    entry_type: str
+    name: str
+    attributes: dict
+
+    def values(self, keyword):
+        """Return the blank separated values of an attribute as a list"""
+        return self.attributes.get(keyword, "").split()
+
+
+# The page header names the zone, e.g. "NOW SET TO TARGET ZONE MVST"
+_ZONE_HEADER = re.compile(r"NOW SET TO \w+ ZONE\s+([A-Z0-9$#@]+)")
+# A section starts with e.g. "MVST      SYSMOD ENTRIES"
+_SECTION = re.compile(r"^\s*[A-Z0-9$#@]+\s+([A-Z]+(?: [A-Z]+)*) ENTRIES\s*$")
+# The first line of an entry holds its name and the first attribute
+_ENTRY = re.compile(r"^ {0,6}([A-Z0-9$#@]{1,8})\s{2,}([A-Z][A-Z0-9/ -]*?)\s*=\s*(.*?)\s*$")
+
+
+def parse_smplist(lines):
+    """
+    Parse SMPLIST output in one pass and yield an SmpeEntry for every
+    entry, as soon as the entry is complete. lines can be any iterable of
+    listing lines with the carriage control character in column 1, like
+    the lines read_listing yields. An entry that is continued on the next
+    page stays open over the page and section headers at the top of it.
+    """
+    zone = None
+    entry_type = None
+    entry = None
+    keyword = None
+    # in the headers at the top of a page, until the next entry line
+    page_top = False
+    for line in lines:
+        if line[:1] == "1":
+            page_top = True
+        text = line[1:].rstrip()
+        if not text:
+            continue
+
+        if entry is not None and text.startswith("       "):
+            # an indented line is another attribute of the entry, or more
+            # values for the last one
+            name, equals, value = text.partition("=")
+            if equals:
+                keyword = name.strip()
+                value = value.strip()
+                if keyword in entry.attributes:
+                    entry.attributes[keyword] += " " + value
+                else:
+                    entry.attributes[keyword] = value
+            else:
+                entry.attributes[keyword] += " " + text.strip()
+            page_top = False
+            continue
+
+        match = _ENTRY.match(text) if "=" in text else None
+        if match is not None and entry_type is not None:
+            if entry is not None:
+                yield entry
+            keyword = match.group(2)
+            entry = SmpeEntry(zone, entry_type, match.group(1), {keyword: match.group(3)})
+            page_top = False
+            continue
+
+        # a new zone or section ends the current entry, a repeated one
+        # at the top of a page does not
+        match = _ZONE_HEADER.search(text)
+        if match is not None:
+            if match.group(1) != zone:
+                if entry is not None:
+                    yield entry
+                    entry = None
+                zone = match.group(1)
+                entry_type = None
+            continue
+        match = _SECTION.match(text)
+        if match is not None:
+            if match.group(1) != entry_type and entry is not None:
+                yield entry
+                entry = None
+            entry_type = match.group(1)
+            continue
+
+        # anything else ends the current entry, except the column
+        # headings at the top of a page
+        if entry is not None and not page_top:
+            yield entry
+            entry = None
+            keyword = None
+
+    if entry is not None:
+        yield entry
+
+
+class SmpeIndex:
+    """
+    The entries of an SMP/E LIST, indexed by zone and by name so that
+    lookups do not have to scan the listing:
+
+        rc, index = smpe_list_zones(["MVST", "MVSD"], "SYSMODS")
+        print(index.zones_with("UJ12345", status="APP"))
+    """
+
+    def __init__(self):
+        # (zone, entry type, name) -> SmpeEntry
+        self.entries = {}
+        # (entry type, name) -> {zone: SmpeEntry}
+        self._by_name = {}
+
+    def __len__(self):
+        return len(self.entries)
+
+    def add(self, entry):
+        """Add an entry, replacing an earlier one with the same key"""
+        self.entries[(entry.zone, entry.entry_type, entry.name)] = entry
+        self._by_name.setdefault((entry.entry_type, entry.name), {})[entry.zone] = entry
+
+    def zones(self):
+        """Return the names of the zones in the index"""
+        return sorted({zone for zone, _, _ in self.entries})
+
+    def entry(self, zone, name, entry_type="SYSMOD"):
+        """Return the entry of name in zone, or None"""
+        return self.entries.get((zone, entry_type, name))
+
+    def zones_with(self, name, entry_type="SYSMOD", status=None):
+        """
+        Return the zones that have an entry for name. With status (e.g.
+        "APP" or "REC") only zones where the entry has that status count.
+        """
+        by_zone = self._by_name.get((entry_type, name), {})
+        return sorted(
+            zone for zone, entry in by_zone.items()
+            if status is None or status in entry.values("STATUS")
+        )
+
+
+# The defaults file that ships next to this program
+DEFAULTS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                             "SMPElistDefaults.yaml")
+
+# This is all of the information the defaults file should contain
+REQUIRED_DEFAULTS = {
+    "SMPECSI": ("dataset",),
+    "TEMP_DATASET": ("primary_space", "secondary_space", "volume"),
+    "SMPECNTL": ("filename",),
+    "OUTPUT_DATASET": ("primary_space", "secondary_space", "volume"),
+}
+
+# path -> (modification time, defaults), so each file is read once
+_defaults_cache = {}
+
+
+def _load_defaults(filename):
+    """
+    Read a defaults file. JSON files are read with json, anything else
+    with yaml, which is only imported when it is needed.
+    """
+    with open(filename) as file:
+        if filename.endswith(".json"):
+            return json.load(file)
+        import yaml
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+        return yaml.load(file, Loader=loader)
+
+
+def get_defaults(filename=None):
     """
     Get the defaults for this program. This is will hold information
     for the workarea dataset and the location of the file we will use
-    to hold SMPECNTL.
-    """
-    # This is all of the information the yaml file should contain
-    required_keys = [
-        ("SMPECSI", "dataset"),
-        ("TEMP_DATASET", "primary_space"),
-        ("TEMP_DATASET", "secondary_space"),
-        ("TEMP_DATASET", "volume"),
-        ("SMPECNTL", "filename"),
-        ("OUTPUT_DATASET", "primary_space"),
-        ("OUTPUT_DATASET", "secondary_space"),
-        ("OUTPUT_DATASET", "volume"),
-    ]
-
-    # Open the yaml file and load the data into defaults
-    with open(filename) as file:
-        defaults = yaml.load(file, Loader=yaml.FullLoader)
+    to hold SMPECNTL. filename defaults to DEFAULTS_FILE, set that to use
+    another file (for example a .json one) everywhere. The file is read
+    and checked once per process; it is only read again if it changes.
+    """
+    if filename is None:
+        filename = DEFAULTS_FILE
+    path = os.path.abspath(filename)
+    mtime = os.stat(path).st_mtime_ns
+    cached = _defaults_cache.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    defaults = _load_defaults(path)
 
-    # Make sure the yaml file has all the required info
-    for dataset, key in required_keys:
-        if dataset in defaults.keys():
-            if key not in defaults[dataset]:
-                sys.exit(f"Yaml file missing {dataset}:{key}\n")
+    # Make sure the file has all the required info
+    if not isinstance(defaults, dict):
+        sys.exit(f"Defaults file {filename} does not hold any sections\n")
+    for section, keys in REQUIRED_DEFAULTS.items():
+        if not isinstance(defaults.get(section), dict):
+            sys.exit(f"Defaults file missing {section}\n")
+        for key in keys:
+            if key not in defaults[section]:
+                sys.exit(f"Defaults file missing {section}:{key}\n")
 
+    _defaults_cache[path] = (mtime, defaults)
     return defaults
 
 
@@ -157,12 +430,21 @@ def parse_args(argv=None):
         parser = argparse.ArgumentParser(program_name)
         parser.add_argument("hlq", help="The High Level Qualifier to be used.")
         parser.add_argument(
-            "-z", "--zone", default="GLOBAL", help="The target zone to be queried."
+            "-z", "--zone", action="append", default=[],
+            help="The target zone to be queried. Repeat it or give several "
+            "zones separated by commas to query them all in one GIMSMP run."
         )
         parser.add_argument(
             "-o", "--options", default=None, help="Any list options to be added"
         )
+        parser.add_argument(
+            "-f", "--find", action="append", default=[], metavar="SYSMOD",
+            help="Print the zones that list SYSMOD and where it is applied. "
+            "Can be repeated."
+        )
         opts = parser.parse_args(argv)
+        opts.zone = [zone.strip() for zones in opts.zone
+                     for zone in zones.split(",") if zone.strip()] or ["GLOBAL"]
         return opts
 
     except Exception as e:
@@ -178,7 +460,20 @@ def main():
     SMPE_list function
     """
     args = parse_args()
-    result = smpe_list(args.zone, args.options, args.hlq).to_dict()
+    if len(args.zone) == 1 and not args.find:
+        result = smpe_list(args.zone[0], args.options, args.hlq).to_dict()
+    else:
+        # without -f the listing is the output, so keep it as smpe_list does
+        command_return_code, index = smpe_list_zones(args.zone, args.options, args.hlq,
+                                                     keep_output=not args.find)
+        result = command_return_code.to_dict()
+        for zone in index.zones():
+            count = sum(1 for entry_zone, _, _ in index.entries if entry_zone == zone)
+            print(f"{zone}: {count} entries")
+        for sysmod in args.find:
+            print(f"{sysmod} is in zones: {' '.join(index.zones_with(sysmod)) or 'none'}")
+            print(f"{sysmod} is applied in: "
+                  f"{' '.join(index.zones_with(sysmod, status='APP')) or 'none'}")
     if result["rc"] > 0:
         sys.stderr.write(f"Return Code: {result['rc']}\n")
         if result["stderr_response"]:
@@ -1,11 +1,23 @@
 #!/bin/sh
 #
 # Routine to submit short running JCL and wait for output.
+# The job status is checked after 1 second, then the wait between checks
+# doubles up to 8 seconds, so short jobs return quickly and long jobs
+# do not issue a jls every second. Set SUBMIT_AND_WAIT_STATS=1 to see how
+# many status queries the job took. If ZOAUD_SOCKET names the socket of a
+# running zoaud.py, the status queries go to it through one zoau_client.py
+# session (see zoau_session.sh) instead of starting jls for every query.
 #
 # Copyright IBM Corp 2021.
 #
 
 #set -x
+. "$(dirname "$0")/zoau_session.sh"
+
+function jobstatus {
+	zoau_call jls "$1"
+}
+
 function runJCL {
 	jcl="$1"
 	maxwait=$2
@@ -19,8 +31,12 @@ function runJCL {
 		return $rc
 	fi
 	currwait=0
+	interval=1
+	maxinterval=8
+	queries=0
 	while [ true ]; do
-		status=`jls 2>/dev/null ${jobid}`
+		status=`jobstatus ${jobid} 2>/dev/null`
+		queries=$((queries+1))
 		state=`echo ${status} | awk ' { print $4; }'`
 		case "$state" in
 		CC)
@@ -28,26 +44,47 @@ function runJCL {
 			if [ $rc -gt 0 ]; then
 				echo "Job ${jobid} failed with rc: $rc" >&2
 			fi
+			stats
 			return ${rc}
 		;;
 		ABEND*)
 			echo "Job ${jobid} ABENDED" >&2
+			stats
 			return 32
 		;;
 		JCLERR)
 			echo "Job ${jobid} has a JCL error" >&2
+			stats
 			return 32
 		;;
 		*)
-			sleep 1
-			currwait=$((currwait+1))
+			if [ ${currwait} -ge ${maxwait} ]; then
+				echo "Timed out waiting for job ${jobid} to complete" >&2
+				stats
+				return -1
+			fi
+			# never sleep past the deadline
+			if [ $((currwait+interval)) -gt ${maxwait} ]; then
+				interval=$((maxwait-currwait))
+			fi
+			sleep ${interval}
+			currwait=$((currwait+interval))
+			interval=$((interval*2))
+			if [ ${interval} -gt ${maxinterval} ]; then
+				interval=${maxinterval}
+			fi
 		esac
-		if [ ${currwait} -gt ${maxwait} ]; then
-			echo "Timed out waiting for job ${jobid} to complete" >&2
-			return -1
-		fi
 	done
 }
 
+function stats {
+	if [ "${SUBMIT_AND_WAIT_STATS}" != '' ]; then
+		echo "Job ${jobid}: ${queries} status queries in ${currwait} seconds" >&2
+	fi
+}
+
+zoau_session_start
 runJCL "$1" 10
-exit $?
+rc=$?
+zoau_session_end
+exit $rc
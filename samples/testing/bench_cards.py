@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""Code rights.
+
+Copyright IBM Corp 2026.
+bench_cards.py - time create_sysin.encode_cards on a large deck against
+writing the same card images a line at a time through a cp1047 text file.
+
+Usage: bench_cards.py [cards]
+"""
+import os
+import sys
+import tempfile
+import time
+
+MYDIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(MYDIR, "fakes"))
+sys.path.insert(0, os.path.join(MYDIR, ".."))
+
+import zoautil_py  # noqa: E402,F401 pylint: disable=unused-import
+from create_sysin import write_cards  # noqa: E402
+
+
+def _line_by_line(inputdata, filename):
+    with open(filename, "w", encoding="cp1047") as sysin:
+        for number, listitem in enumerate(inputdata, start=1):
+            if len(listitem) > 71:
+                raise Exception(f"Input lines must be 71 chars or fewer\n{listitem}")
+            sysin.write(f"{listitem:<72}{number * 10:08d}\n")
+
+
+def main():
+    cards = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    inputdata = [f"  INCLUDE COND=(1,8,CH,EQ,C'M{number:07d}')" for number in range(cards)]
+    filename = os.path.join(tempfile.gettempdir(), f"cards.bench.{os.getpid()}")
+    try:
+        for label, write in (
+            ("line by line", lambda: _line_by_line(inputdata, filename)),
+            ("write_cards", lambda: write_cards(inputdata, filename, sequence=True)),
+        ):
+            start = time.monotonic()
+            write()
+            print(f"{label:13} {time.monotonic() - start:.3f} seconds for {cards} cards")
+    finally:
+        os.remove(filename)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""Code rights.
+
+Copyright IBM Corp 2026.
+bench_catalog_crawler.py - time a full and an incremental refresh of
+catalog-utils/catalog_crawler.py over synthetic user catalogs, using the
+fake IDCAMS in testing/fakes, and the latency of lookups in the index.
+The fake IDCAMS sleeps FAKE_MVSCMD_DELAY seconds per run.
+
+Usage: bench_catalog_crawler.py [catalogs] [entries per catalog] [workers]
+"""
+import os
+import sys
+import tempfile
+import time
+
+MYDIR = os.path.dirname(os.path.abspath(__file__))
+os.environ.setdefault("FAKE_MVSCMD_DELAY", "1")
+sys.path.insert(0, os.path.join(MYDIR, "fakes"))
+sys.path.insert(0, os.path.join(MYDIR, "..", "catalog-utils"))
+
+import catalog_crawler  # noqa: E402
+from zoautil_py import mvscmd  # noqa: E402
+
+
+def _catalog(number, entries):
+    """Return the (type, name, volser) entries of a synthetic user catalog"""
+    hlq = f"HLQ{number:04d}"
+    result = []
+    for entry in range(entries):
+        if entry % 10 == 0:
+            name = f"{hlq}.APP{entry % 97:02d}.KSDS{entry:06d}"
+            result += [("CLUSTER", name, None),
+                       ("DATA", f"{name}.DATA", f"VOL{entry % 50:03d}"),
+                       ("INDEX", f"{name}.INDEX", f"VOL{entry % 50:03d}")]
+        else:
+            result.append(("NONVSAM", f"{hlq}.APP{entry % 97:02d}.D{entry:06d}",
+                           f"VOL{entry % 50:03d}"))
+    return result
+
+
+def _timed(label, function, *args, **kwargs):
+    start = time.monotonic()
+    result = function(*args, **kwargs)
+    print(f"{label:24} {time.monotonic() - start:7.2f} seconds")
+    return result
+
+
+def main():
+    catalog_count = int(sys.argv[1]) if len(sys.argv) > 1 else 16
+    entries = int(sys.argv[2]) if len(sys.argv) > 2 else 5000
+    workers = int(sys.argv[3]) if len(sys.argv) > 3 else 8
+    mvscmd.CATALOGS[mvscmd.MASTER_CATALOG] = [
+        ("USERCATALOG", f"CATALOG.UCAT{number:04d}", "CAT001") for number in range(catalog_count)]
+    for number in range(catalog_count):
+        mvscmd.CATALOGS[f"CATALOG.UCAT{number:04d}"] = _catalog(number, entries)
+    print(f"{catalog_count} user catalogs of {entries} entries, "
+          f"{os.environ['FAKE_MVSCMD_DELAY']}s per IDCAMS run")
+
+    with tempfile.TemporaryDirectory() as directory:
+        with catalog_crawler.CatalogIndex(os.path.join(directory, "index.db")) as index:
+            _timed("refresh, 1 worker", catalog_crawler.refresh, index, workers=1)
+            _timed(f"refresh, {workers} workers", catalog_crawler.refresh, index,
+                   workers=workers)
+            mvscmd.LISTCAT_STATS["CATALOG.UCAT0000"] = {"REC-UPDATED": 1}
+            listed = _timed("incremental refresh", catalog_crawler.refresh, index,
+                            workers=workers, incremental=True)
+            print(f"{'':24} listed {', '.join(listed)}")
+
+            for pattern in ("HLQ0003.APP42.*", "HLQ0003.**", "HLQ0003.*.D0001%%",
+                            "HLQ%%%%.APP32.KSDS000420"):
+                start = time.perf_counter()
+                runs = 0
+                while time.perf_counter() - start < 1:
+                    found = index.lookup(pattern)
+                    runs += 1
+                elapsed = (time.perf_counter() - start) / runs
+                print(f"lookup {pattern:26} {elapsed * 1000:8.3f} ms, {len(found)} found")
+
+
+if __name__ == "__main__":
+    main()
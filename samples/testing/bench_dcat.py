@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""Code rights.
+
+Copyright IBM Corp 2026.
+bench_dcat.py - time dcat.py with 1 and with several workers on a PDS with
+many members, using the fake zoautil_py in testing/fakes and a fake cat
+that sleeps for FAKE_READ_DELAY seconds before it prints a member. The
+peak memory of each run is reported too; it should not grow with the
+number of members, nor with the size of a large sequential data set.
+
+Usage: bench_dcat.py [members] [workers]
+"""
+import io
+import os
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+
+MYDIR = os.path.dirname(os.path.abspath(__file__))
+os.environ.setdefault("FAKE_READ_DELAY", "0.002")
+sys.path.insert(0, os.path.join(MYDIR, "fakes"))
+sys.path.insert(0, os.path.join(MYDIR, ".."))
+
+import dcat  # noqa: E402
+from zoautil_py import datasets  # noqa: E402
+
+
+class _CountingOutput(io.TextIOBase):
+    """Count what is written instead of keeping it"""
+
+    def __init__(self):
+        self.characters = 0
+
+    def write(self, text):
+        self.characters += len(text)
+        return len(text)
+
+
+def _timed(label, pattern, workers):
+    output = _CountingOutput()
+    tracemalloc.start()
+    start = time.monotonic()
+    dcat.dcat([pattern], output, workers, header=True)
+    elapsed = time.monotonic() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print(f"{label:12} {elapsed:6.2f} seconds, peak {peak / 1024:7.0f} KiB, "
+          f"{output.characters} characters")
+
+
+def _fake_cat(directory):
+    """Put a cat on PATH that prints the large file for BENCH.BIG, else a member"""
+    member = os.path.join(directory, "member")
+    with open(member, "w") as text:
+        text.writelines(f"//STEP{line:04d} EXEC PGM=IEFBR14{' ' * 40}\n"
+                        for line in range(200))
+    big = os.path.join(directory, "big")
+    with open(big, "w") as text:
+        line = f"{'X' * 79}\n"
+        text.writelines(line for _ in range(500000))
+    cat = os.path.join(directory, "cat")
+    with open(cat, "w") as script:
+        script.write("#!/bin/sh\n"
+                     f"sleep {os.environ['FAKE_READ_DELAY']}\n"
+                     f"case \"$1\" in *BENCH.BIG*) exec {shutil.which('cat')} {big};; esac\n"
+                     f"exec {shutil.which('cat')} {member}\n")
+    os.chmod(cat, 0o755)
+    os.environ["PATH"] = f"{directory}{os.pathsep}{os.environ['PATH']}"
+
+
+def main():
+    member_count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else 16
+    datasets.MEMBERS["BENCH.JCL"] = [f"M{member:07d}" for member in range(member_count)]
+    datasets.DATASETS.append("BENCH.BIG")
+    with tempfile.TemporaryDirectory() as directory:
+        _fake_cat(directory)
+        print(f"{member_count} members of 200 lines, "
+              f"{os.environ['FAKE_READ_DELAY']}s per read")
+        _timed("serial", "BENCH.JCL(*)", 1)
+        _timed(f"{workers} workers", "BENCH.JCL(*)", workers)
+        print("one data set of 40 MB")
+        _timed("large", "BENCH.BIG", workers)
+
+
+if __name__ == "__main__":
+    main()
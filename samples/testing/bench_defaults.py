@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""Code rights.
+
+Copyright IBM Corp 2026.
+bench_defaults.py - time how long smpe_list takes to start and to get its
+defaults: importing smpe_list in a fresh interpreter, the first
+get_defaults (which imports yaml and parses the file) and the cached
+calls after it, against parsing the file on every call as before.
+
+Usage: bench_defaults.py [calls]
+"""
+import os
+import subprocess
+import sys
+import time
+
+MYDIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(MYDIR, "fakes"))
+sys.path.insert(0, os.path.join(MYDIR, ".."))
+
+
+def _fresh_import(statement, runs=5):
+    """Best time of a statement in a new interpreter, in seconds"""
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path[:2]))
+    best = None
+    for _ in range(runs):
+        start = time.monotonic()
+        subprocess.run([sys.executable, "-c", statement], env=env, check=True)
+        elapsed = time.monotonic() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def main():
+    calls = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    baseline = _fresh_import("pass")
+    print(f"interpreter start: {baseline * 1e3:.1f} ms")
+    print(f"import smpe_list: +{(_fresh_import('import smpe_list') - baseline) * 1e3:.1f} ms")
+    print(f"import yaml: +{(_fresh_import('import yaml') - baseline) * 1e3:.1f} ms")
+
+    import smpe_list
+
+    start = time.monotonic()
+    smpe_list.get_defaults()
+    print(f"first get_defaults, including import yaml: "
+          f"{(time.monotonic() - start) * 1e3:.2f} ms")
+    import yaml
+
+    start = time.monotonic()
+    for _ in range(calls):
+        smpe_list.get_defaults()
+    cached = (time.monotonic() - start) / calls
+    print(f"cached get_defaults: {cached * 1e6:.1f} us per call")
+
+    start = time.monotonic()
+    for _ in range(calls):
+        with open(smpe_list.DEFAULTS_FILE) as file:
+            yaml.load(file, Loader=yaml.FullLoader)
+    parsed = (time.monotonic() - start) / calls
+    print(f"FullLoader parse per call (before): {parsed * 1e6:.1f} us per call")
+
+
+if __name__ == "__main__":
+    main()
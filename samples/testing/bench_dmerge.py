@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""Code rights.
+
+Copyright IBM Corp 2026.
+bench_dmerge.py - time the local k-way merge of dmerge.py on synthetic,
+sorted FB 80 files in cp1047, with a single CH key and with CH, ZD and a
+descending CH key together. Give the total size in MB; use a few thousand
+for multi-GB inputs (the files are written to the temporary directory).
+
+Usage: bench_dmerge.py [total-MB] [inputs]
+"""
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+MYDIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(MYDIR, "fakes"))
+sys.path.insert(0, os.path.join(MYDIR, ".."))
+
+# the fake zoautil_py registers the cp1047 codec
+import zoautil_py  # noqa: E402,F401
+import dmerge  # noqa: E402
+
+LRECL = 80
+# Records are written in batches of this many
+BATCH = 10000
+
+
+def _write_input(path, records, seed):
+    """Write records FB 80 records sorted on their first 10 columns"""
+    generator = random.Random(seed)
+    keys = sorted(generator.randrange(10 ** 10) for _ in range(records))
+    with open(path, "wb") as file:
+        for first in range(0, records, BATCH):
+            file.write(b"".join(
+                f"{key:010d}{generator.randrange(10 ** 7):07d}{'EXTRACT RECORD':<63}"
+                .encode("cp1047") for key in keys[first:first + BATCH]
+            ))
+
+
+def _timed(label, inputs, output, keys, size):
+    start = time.monotonic()
+    count = dmerge.merge_files(inputs, output, keys, "FB", LRECL)
+    elapsed = time.monotonic() - start
+    print(f"{label:24} {elapsed:7.2f} seconds, {size / elapsed / 2 ** 20:6.1f} MB/s, "
+          f"{count / elapsed:9.0f} records/s")
+
+
+def main():
+    total_mb = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    input_count = int(sys.argv[2]) if len(sys.argv) > 2 else 24
+    records = total_mb * 2 ** 20 // LRECL // input_count
+    directory = tempfile.mkdtemp(prefix="bench_dmerge.")
+    try:
+        inputs = [os.path.join(directory, f"in{number:03d}") for number in range(input_count)]
+        for number, path in enumerate(inputs):
+            _write_input(path, records, number)
+        size = records * input_count * LRECL
+        print(f"{input_count} inputs of {records} records, {size / 2 ** 20:.0f} MB")
+
+        output = os.path.join(directory, "merged")
+        _timed("-K1,10,CH,A", inputs, output, ["1,10,CH,A"], size)
+        _timed("-K1,10,CH,A -K11,7,ZD,D", inputs, output,
+               ["1,10,CH,A", "11,7,ZD,D"], size)
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    main()
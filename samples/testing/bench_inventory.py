@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""Code rights.
+
+Copyright IBM Corp 2026.
+bench_inventory.py - time smpe_inventory.SmpeInventory on a synthetic
+inventory: the first snapshot, a second one where a few SYSMODs changed,
+reading the diff and looking up a SYSMOD in every zone. A refresh in
+incremental mode with an unchanged CSI is checked to skip GIMSMP.
+
+Usage: bench_inventory.py [zones] [sysmods per zone]
+"""
+import os
+import sys
+import tempfile
+import time
+
+MYDIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(MYDIR, "fakes"))
+sys.path.insert(0, os.path.join(MYDIR, ".."))
+
+import smpe_inventory  # noqa: E402
+from smpe_list import SmpeEntry  # noqa: E402
+from zoautil_py import mvscmd  # noqa: E402
+
+
+def _entries(zone, sysmods, changed=()):
+    for number in range(sysmods):
+        status = "REC APP" if number % 2 == 0 or number in changed else "REC"
+        yield SmpeEntry(zone, "SYSMOD", f"UJ{number:05d}",
+                        {"TYPE": "PTF", "STATUS": status, "FMID": "HBB77C0"})
+
+
+def main():
+    zone_count = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    sysmod_count = int(sys.argv[2]) if len(sys.argv) > 2 else 10000
+    zones = [f"ZONE{number:03d}" for number in range(zone_count)]
+    csi = "SMPE.GLOBAL.CSI"
+    print(f"{zone_count} zones, {sysmod_count} SYSMODs each")
+
+    with tempfile.TemporaryDirectory() as directory:
+        with smpe_inventory.SmpeInventory(os.path.join(directory, "inv.db")) as inventory:
+            for label, changed in (("first snapshot", ()), ("second snapshot", (1, 3, 5))):
+                start = time.monotonic()
+                for zone in zones:
+                    inventory.record(csi, zone, _entries(zone, sysmod_count, changed), "T1")
+                print(f"{label}: {time.monotonic() - start:.2f}s")
+
+            start = time.monotonic()
+            diffs = [inventory.diff(csi, zone) for zone in zones]
+            elapsed = time.monotonic() - start
+            print(f"diff of every zone: {elapsed * 1e3:.1f} ms")
+            assert [change.name for change in diffs[0]["changed"]] == \
+                ["UJ00001", "UJ00003", "UJ00005"], diffs[0]
+
+            start = time.monotonic()
+            applied = inventory.find("UJ00003", status="APP")
+            elapsed = time.monotonic() - start
+            print(f"find one SYSMOD in every zone: {elapsed * 1e3:.1f} ms")
+            assert len(applied) == zone_count
+
+            # the CSI has not changed since the snapshots, so nothing is listed
+            mvscmd.LISTCAT_STATS[csi] = {"REC-TOTAL": 42}
+            token = smpe_inventory.csi_change_token(csi)
+            for zone in zones:
+                inventory.record(csi, zone, _entries(zone, 10), token)
+            snapshots, result = smpe_inventory.refresh(inventory, csi, zones,
+                                                       incremental=True)
+            assert snapshots == {} and result is None
+            print(f"incremental refresh with token {token!r}: nothing to list")
+
+
+if __name__ == "__main__":
+    main()
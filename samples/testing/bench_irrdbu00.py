@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""Code rights.
+
+Copyright IBM Corp 2026.
+bench_irrdbu00.py - time the local filter of irrdbu00.py on a synthetic
+IRRDBU00 unload (VB with RDWs, in cp1047): counting the matches of a few
+filters, and writing the matches of the default filter to CSV and, if
+pyarrow is installed, to Parquet files. The unload is written to the
+temporary directory.
+
+Usage: bench_irrdbu00.py [records]
+"""
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+MYDIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(MYDIR, "fakes"))
+sys.path.insert(0, os.path.join(MYDIR, ".."))
+
+# the fake zoautil_py registers the cp1047 codec
+import zoautil_py  # noqa: E402,F401
+import irrdbu00  # noqa: E402
+
+FILTERS = [
+    irrdbu00.DEFAULT_FILTER,
+    "usbd_name^=SYS and usbd_create_date=2020-01-01..2020-12-31",
+    "dsacc_access=ALTER or gracc_access=ALTER",
+]
+# record type -> how many of every 100 records have it
+MIX = {"0200": 10, "0205": 20, "0207": 1, "0400": 15, "0404": 30,
+       "0500": 8, "0505": 14, "0560": 2}
+
+
+def unload_record(record_type, **values):
+    """Return an IRRDBU00 record with its RDW, the fields not given blank"""
+    layout = irrdbu00.RECORD_TYPES[record_type]
+    data = bytearray(b"\x40" * (layout.fields[-1].end - 4))
+    data[0:4] = record_type.encode("cp1047")
+    for field in layout.fields[1:]:
+        value = values.get(field.name[len(layout.name) + 1:])
+        if value is not None:
+            data[field.start - 5:field.start - 5 + len(value)] = value.encode("cp1047")
+    return (len(data) + 4).to_bytes(2, "big") + b"\0\0" + bytes(data)
+
+
+def synthetic_unload(path, count):
+    """Write count records of the types in MIX"""
+    types = [record_type for record_type, share in MIX.items() for _ in range(share)]
+    with open(path, "wb") as unload:
+        batch = []
+        for number in range(count):
+            record_type = types[number % len(types)]
+            user = f"{'SYS' if number % 7 == 0 else 'USR'}{number % 100000:05d}"
+            batch.append(unload_record(
+                record_type, name=user if record_type < "0400" else f"HLQ{number % 997}.DATA",
+                create_date=f"{2015 + number % 10}-0{1 + number % 9}-15",
+                class_name="DIGTRING" if number % 3 == 0 else "FACILITY",
+                auth_id=user, access=("ALTER", "READ", "UPDATE")[number % 3],
+                cert_name=f"CN=CERT{number}",
+            ))
+            if len(batch) == 10000:
+                unload.write(b"".join(batch))
+                batch = []
+        unload.write(b"".join(batch))
+
+
+def _timed(label, function, count):
+    start = time.monotonic()
+    result = function()
+    elapsed = time.monotonic() - start
+    print(f"{label:62} {elapsed:6.2f} seconds, {count / elapsed:9.0f} records/s")
+    return result
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    directory = tempfile.mkdtemp(prefix="bench_irrdbu00.")
+    try:
+        path = os.path.join(directory, "unload")
+        synthetic_unload(path, count)
+        print(f"{count} records, {os.path.getsize(path) / 2 ** 20:.0f} MB")
+        for filter_text in FILTERS:
+            matches = _timed(f"count {filter_text}", lambda: sum(
+                1 for _ in irrdbu00.filter_unload(path, filter_text)), count)
+            print(f"{'':62} {matches} matches")
+        _timed("csv", lambda: irrdbu00.write_csv(
+            irrdbu00.filter_unload(path), directory), count)
+        try:
+            _timed("parquet", lambda: irrdbu00.write_parquet(
+                irrdbu00.filter_unload(path), directory), count)
+        except ImportError:
+            print("pyarrow is not installed, no Parquet timing")
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""Code rights.
+
+Copyright IBM Corp 2026.
+bench_job_output.py - compare the peak RSS of reading a job DD as one
+string (what jobs.read_output does) with jobs.read_output_stream. A
+synthetic spool file stands in for the DD and cat stands in for pjdd.
+Each approach runs in its own process so the peaks do not mix.
+
+Usage: bench_job_output.py [size-in-MB]
+"""
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+MYDIR = os.path.dirname(os.path.abspath(__file__))
+RECORD = "IEF142I SAMPLE STEP1 - STEP WAS EXECUTED - COND CODE 0000" + " " * 20 + "\n"
+
+
+def _whole_string(spool_file):
+    output = subprocess.run(["cat", spool_file], capture_output=True,
+                            text=True, check=True).stdout
+    return output.count("\n")
+
+
+def _streamed(spool_file):
+    sys.path.insert(0, os.path.join(MYDIR, "fakes"))
+    sys.path.insert(0, os.path.join(MYDIR, ".."))
+    import jobs  # pylint: disable=import-outside-toplevel
+    return sum(1 for _ in jobs._stream_command(["cat", spool_file]))
+
+
+def _measure(mode, spool_file):
+    start = time.monotonic()
+    records = _whole_string(spool_file) if mode == "string" else _streamed(spool_file)
+    elapsed = time.monotonic() - start
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(f"{mode:8} {records} records {elapsed:6.2f} seconds "
+          f"peak RSS {peak_kb // 1024} MB")
+
+
+def main():
+    if len(sys.argv) == 3:
+        _measure(sys.argv[1], sys.argv[2])
+        return
+    size_mb = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    with tempfile.NamedTemporaryFile("w", suffix=".spool", delete=False) as spool:
+        block = RECORD * (1024 * 1024 // len(RECORD))
+        for _ in range(size_mb):
+            spool.write(block)
+    try:
+        for mode in ("string", "stream"):
+            subprocess.run([sys.executable, __file__, mode, spool.name], check=True)
+    finally:
+        os.remove(spool.name)
+
+
+if __name__ == "__main__":
+    main()
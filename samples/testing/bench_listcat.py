@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""Code rights.
+
+Copyright IBM Corp 2026.
+bench_listcat.py - time catalog-utils/listcat.py on LISTCAT ALL listings of
+growing size, with and without attributes, and report the peak memory of
+every run. The time should grow linearly with the number of lines and the
+peak memory should not grow at all.
+
+The listings are made by repeating the entries of
+testing/listcat_corpus/listcat_all.txt under new names, with a page header
+every 60 lines, and written to the temporary directory. A captured listing
+can be given instead.
+
+Usage: bench_listcat.py [million lines ...]
+       bench_listcat.py --listing SYSPRINT
+"""
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+MYDIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(MYDIR, "..", "catalog-utils"))
+
+import listcat  # noqa: E402
+
+TEMPLATE = os.path.join(MYDIR, "listcat_corpus", "listcat_all.txt")
+PAGE_LINES = 60
+
+
+def _entry_lines():
+    """Return the lines of the template from its first entry to its totals"""
+    with open(TEMPLATE) as template:
+        lines = [line for line in template if not line.startswith(("1", "0LISTING"))]
+    first = next(number for number, line in enumerate(lines) if line.startswith("0NONVSAM"))
+    last = next(number for number, line in enumerate(lines) if "THE NUMBER OF" in line)
+    return lines[first:last]
+
+
+def write_listing(path, line_count):
+    """Write a LISTCAT ALL listing of about line_count lines"""
+    entries = "".join(_entry_lines())
+    header = ("1IDCAMS  SYSTEM SERVICES                                           TIME: 10:21:04"
+              "        10/17/26     PAGE {page:6d}\n0LISTING FROM CATALOG -- CATALOG.UCAT1\n")
+    written = 0
+    page = 1
+    with open(path, "w") as listing:
+        listing.write("  LISTCAT CATALOG('CATALOG.UCAT1') ALL\n")
+        copy = 0
+        while written < line_count:
+            lines = entries.replace("IBMUSER.", f"USER{copy % 1000:03d}.D{copy:07d}.").splitlines(True)
+            for start in range(0, len(lines), PAGE_LINES):
+                listing.write(header.format(page=page))
+                listing.writelines(lines[start:start + PAGE_LINES])
+                page += 1
+            written += len(lines) + 2 * ((len(lines) + PAGE_LINES - 1) // PAGE_LINES)
+            copy += 1
+        listing.write("0         THE NUMBER OF ENTRIES PROCESSED WAS:\n"
+                      f"                    TOTAL -----------------{copy * 6}\n")
+    return written
+
+
+def _run(path, attributes, trace):
+    """Parse the listing, return (seconds, entries, peak bytes or None)"""
+    if trace:
+        tracemalloc.start()
+    start = time.monotonic()
+    with open(path) as listing:
+        entries = sum(1 for _ in listcat.parse(listing, attributes))
+    elapsed = time.monotonic() - start
+    peak = None
+    if trace:
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return elapsed, entries, peak
+
+
+def bench(path, lines):
+    for attributes in (True, False):
+        elapsed, entries, _ = _run(path, attributes, False)
+        _, _, peak = _run(path, attributes, True)
+        label = "attributes" if attributes else "volumes only"
+        print(f"{lines / 1e6:6.2f}M lines  {label:12}  {elapsed:6.2f} s  "
+              f"{lines / elapsed / 1e6:5.2f}M lines/s  {entries:8d} entries  "
+              f"peak {peak / 1024:6.0f} KiB")
+
+
+def main():
+    if sys.argv[1:2] == ["--listing"]:
+        with open(sys.argv[2]) as listing:
+            lines = sum(1 for _ in listing)
+        bench(sys.argv[2], lines)
+        return
+    sizes = [float(size) for size in sys.argv[1:]] or [0.5, 1, 2, 4]
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "listcat.txt")
+        for size in sizes:
+            lines = write_listing(path, int(size * 1e6))
+            bench(path, lines)
+
+
+if __name__ == "__main__":
+    main()
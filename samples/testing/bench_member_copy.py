@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""Code rights.
+
+Copyright IBM Corp 2026.
+bench_member_copy.py - time member_copy, member_copy_many and
+member_copy_parallel on the same manifest using the fake zoautil_py in
+testing/fakes. The fake IEBCOPY sleeps for FAKE_MVSCMD_DELAY seconds per
+run plus FAKE_MVSCMD_MEMBER_DELAY seconds per member.
+
+Usage: bench_member_copy.py [pairs] [members-per-pair] [workers]
+"""
+import os
+import sys
+import tempfile
+import time
+
+MYDIR = os.path.dirname(os.path.abspath(__file__))
+os.environ.setdefault("FAKE_MVSCMD_DELAY", "0.5")
+os.environ.setdefault("FAKE_MVSCMD_MEMBER_DELAY", "0.01")
+sys.path.insert(0, os.path.join(MYDIR, "fakes"))
+sys.path.insert(0, os.path.join(MYDIR, ".."))
+
+import member_copy  # noqa: E402
+
+
+def _timed(label, function, *args):
+    start = time.monotonic()
+    results = function(*args)
+    print(f"{label:22} {time.monotonic() - start:6.2f} seconds")
+    return results
+
+
+def main():
+    pair_count = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    member_count = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    workers = int(sys.argv[3]) if len(sys.argv) > 3 else 4
+    manifest = [
+        (f"SRC.LIB{pair:03d}", f"TGT.LIB{pair:03d}",
+         [f"MEM{member:05d}" for member in range(member_count)])
+        for pair in range(pair_count)
+    ]
+    print(f"{pair_count} pairs of {member_count} members, "
+          f"{os.environ['FAKE_MVSCMD_DELAY']}s per run, "
+          f"{os.environ['FAKE_MVSCMD_MEMBER_DELAY']}s per member")
+
+    os.chdir(tempfile.mkdtemp())
+    _timed("member_copy per pair", lambda: [
+        member_copy.member_copy(source, target, ",".join(members))
+        for source, target, members in manifest])
+    _timed("member_copy_many", member_copy.member_copy_many, manifest)
+    _timed(f"member_copy_parallel/{workers}", member_copy.member_copy_parallel,
+           manifest, workers)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""Code rights.
+
+Copyright IBM Corp 2026.
+bench_records.py - time reading one field of every record of a synthetic
+FB 80 unload with records.py: record by record with column(), and with
+array() if NumPy is installed. Give the size in MB; use a few thousand for
+multi-GB unloads (the file is written to the temporary directory).
+
+Usage: bench_records.py [MB]
+"""
+import os
+import sys
+import tempfile
+import time
+
+MYDIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(MYDIR, "fakes"))
+sys.path.insert(0, os.path.join(MYDIR, ".."))
+
+# the fake zoautil_py registers the cp1047 codec
+import zoautil_py  # noqa: E402,F401
+import records  # noqa: E402
+
+LRECL = 80
+# Records are written in batches of this many
+BATCH = 100000
+FIELDS = [records.parse_field("1,8,CH", "name"), records.parse_field("9,7,ZD", "amount"),
+          records.parse_field("16,4,PD", "count"), records.parse_field("20,4,BI", "id")]
+
+
+def _write_unload(path, record_count):
+    record = ("USERNAME".encode("cp1047") + "123456".encode("cp1047") + b"\xc7"
+              + b"\x01\x23\x45\x6c" + b"\x00\x01\x02\x03").ljust(LRECL, b"\x40")
+    with open(path, "wb") as file:
+        for first in range(0, record_count, BATCH):
+            file.write(record * min(BATCH, record_count - first))
+
+
+def _timed(label, function, size):
+    start = time.monotonic()
+    function()
+    elapsed = time.monotonic() - start
+    print(f"{label:22} {elapsed:7.2f} seconds, {size / elapsed / 2 ** 20:8.1f} MB/s")
+
+
+def main():
+    size_mb = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    record_count = size_mb * 2 ** 20 // LRECL
+    path = os.path.join(tempfile.gettempdir(), f"bench_records.{os.getpid()}")
+    try:
+        _write_unload(path, record_count)
+        size = record_count * LRECL
+        print(f"{record_count} records, {size / 2 ** 20:.0f} MB")
+        with records.RecordFile(path) as unload:
+            _timed("iterate", lambda: sum(1 for _ in unload), size)
+            for field in FIELDS:
+                _timed(f"column {field.name} {field.field_type}",
+                       lambda: unload.column(field), size)
+            try:
+                import numpy  # noqa: F401
+            except ImportError:
+                print("NumPy is not installed, no array() timings")
+                return
+            for field in FIELDS:
+                _timed(f"array {field.name} {field.field_type}",
+                       lambda: unload.array(field), size)
+    finally:
+        os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
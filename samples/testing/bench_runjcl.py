@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""Code rights.
+
+Copyright IBM Corp 2026.
+bench_runjcl.py - compare serial runjcl.runjob calls with runjcl.runjobs
+using the fake zoautil_py in testing/fakes, so it runs without ZOAU.
+
+Usage: bench_runjcl.py [jobs] [max_active]
+"""
+import os
+import sys
+import time
+
+MYDIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(MYDIR, "fakes"))
+sys.path.insert(0, os.path.join(MYDIR, ".."))
+
+import runjcl  # noqa: E402
+from zoautil_py import jobs  # noqa: E402
+
+
+def main():
+    job_count = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    max_active = int(sys.argv[2]) if len(sys.argv) > 2 else 8
+    jcl_datasets = [f"FAKEUSER.JCL(JOB{i:05d})" for i in range(job_count)]
+
+    start = time.monotonic()
+    for jcl_ds in jcl_datasets:
+        runjcl.runjob(jcl_ds)
+    serial = time.monotonic() - start
+
+    start = time.monotonic()
+    runjcl.runjobs(jcl_datasets, max_active=max_active)
+    concurrent = time.monotonic() - start
+
+    print(f"serial:     {serial:.1f} seconds")
+    print(f"concurrent: {concurrent:.1f} seconds (max_active={max_active})")
+    print(f"status queries: {jobs.QUERIES}")
+
+
+if __name__ == "__main__":
+    main()
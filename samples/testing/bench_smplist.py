@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""Code rights.
+
+Copyright IBM Corp 2026.
+bench_smplist.py - time smpe_list.parse_smplist and SmpeIndex on a
+synthetic multi-zone SMPLIST, and time "which zones have this PTF
+applied" lookups against a grep over the listing.
+
+Usage: bench_smplist.py [zones] [sysmods per zone]
+"""
+import os
+import sys
+import time
+
+MYDIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(MYDIR, "fakes"))
+sys.path.insert(0, os.path.join(MYDIR, ".."))
+
+import smpe_list  # noqa: E402
+
+
+def synthetic_smplist(zones, sysmods, lines_per_page=60):
+    """Yield the lines of an SMPLIST with a SYSMOD section per zone
+
+    Every other SYSMOD is applied, the rest only received.
+    """
+    page = 0
+    for zone in zones:
+        page += 1
+        yield (f"1 PAGE {page:04d}  - NOW SET TO TARGET ZONE   {zone:8s}  "
+               "DATE 10/17/26  TIME 08:14:03  SMP/E 37.12   SMPLIST OUTPUT\n")
+        yield f"0{zone:8s}  SYSMOD ENTRIES\n"
+        yield "0 NAME\n"
+        printed = 3
+        for number in range(sysmods):
+            if printed > lines_per_page:
+                page += 1
+                yield (f"1 PAGE {page:04d}  - NOW SET TO TARGET ZONE   {zone:8s}  "
+                       "DATE 10/17/26  TIME 08:14:03  SMP/E 37.12   SMPLIST OUTPUT\n")
+                yield f"0{zone:8s}  SYSMOD ENTRIES\n"
+                printed = 2
+            status = "REC APP" if number % 2 == 0 else "REC"
+            yield f"0 UJ{number:05d}   TYPE           = PTF\n"
+            yield f"             STATUS         = {status}\n"
+            yield "             FMID           = HBB77C0\n"
+            yield "             DATE/TIME REC  = 26.290 08:14:03\n"
+            yield f"             MOD            = IEAMOD{number % 10}  IEAMOD{number % 7}\n"
+            yield f"                              IEAMOD{number % 3}\n"
+            printed += 6
+
+
+def main():
+    zone_count = int(sys.argv[1]) if len(sys.argv) > 1 else 40
+    sysmod_count = int(sys.argv[2]) if len(sys.argv) > 2 else 10000
+    zones = [f"ZONE{number:03d}" for number in range(zone_count)]
+    listing = list(synthetic_smplist(zones, sysmod_count))
+    print(f"{zone_count} zones, {sysmod_count} SYSMODs each, {len(listing)} lines")
+
+    start = time.monotonic()
+    index = smpe_list.SmpeIndex()
+    for entry in smpe_list.parse_smplist(listing):
+        index.add(entry)
+    elapsed = time.monotonic() - start
+    print(f"parse and index: {len(index)} entries in {elapsed:.2f}s")
+
+    lookups = 10000
+    start = time.monotonic()
+    for number in range(lookups):
+        index.zones_with(f"UJ{number % sysmod_count:05d}", status="APP")
+    elapsed = time.monotonic() - start
+    print(f"zones_with: {elapsed / lookups * 1e6:.1f} us per lookup")
+
+    start = time.monotonic()
+    matches = [line for line in listing if "UJ00042" in line]
+    elapsed = time.monotonic() - start
+    print(f"one grep over the listing: {elapsed * 1e3:.1f} ms ({len(matches)} lines)")
+
+    applied = index.zones_with("UJ00042", status="APP")
+    received = index.zones_with("UJ00043", status="APP")
+    entry = index.entry(zones[0], "UJ00042")
+    assert applied == zones and received == [], (applied, received)
+    assert entry.values("MOD") == ["IEAMOD2", "IEAMOD0", "IEAMOD0"], entry
+    assert entry.values("STATUS") == ["REC", "APP"], entry
+
+
+if __name__ == "__main__":
+    main()
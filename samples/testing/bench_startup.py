@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""Code rights.
+
+Copyright IBM Corp 2026.
+bench_startup.py - measure the import cost of every Python sample's entry
+point with python -X importtime, running each with --help (or with no
+arguments when it has no --help) the way a mistyped call from a shell
+loop would.
+
+Regression budget, checked by this script (it exits with 1 if broken):
+  * None of HEAVY_MODULES may be imported before the sample has work to
+    do. zoautil_py, yaml, asyncio, sqlite3 and concurrent.futures are
+    imported by the functions that use them.
+  * The imports of an entry point may add at most BUDGET_MS to those of
+    a bare interpreter, best of RUNS runs, measured against the fake
+    zoautil_py in testing/fakes. The budget holds the standard library
+    modules the samples need at start (argparse, re, json, ...) with some
+    room to spare; raise it only together with a reason in the commit
+    message.
+
+Usage: bench_startup.py
+"""
+import os
+import subprocess
+import sys
+
+MYDIR = os.path.dirname(os.path.abspath(__file__))
+SAMPLES = os.path.dirname(MYDIR)
+
+HEAVY_MODULES = ("zoautil_py", "yaml", "asyncio", "sqlite3", "concurrent.futures")
+BUDGET_MS = 50
+RUNS = 5
+
+# script -> arguments that make it stop before doing any work
+ENTRY_POINTS = {
+    "catalog-utils/catalog_crawler.py": ["--help"],
+    "catalog-utils/listcat.py": ["--help"],
+    "dcat.py": ["--help"],
+    "dmerge.py": ["--help"],
+    "irrdbu00.py": ["--help"],
+    "jobs.py": ["--help"],
+    "member_copy.py": [],
+    "runjcl.py": ["--help"],
+    "runrexx.py": [],
+    "smpe_inventory.py": ["--help"],
+    "smpe_list.py": ["--help"],
+    "zcx_versions.py": ["--help"],
+    "zoau_client.py": [],
+    "zoaud.py": ["--help"],
+}
+
+
+def _importtime(arguments):
+    """Return the total import time in ms and the names of the modules"""
+    env = dict(os.environ, PYTHONPATH=os.path.join(MYDIR, "fakes"))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime"] + arguments,
+        stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, env=env,
+        cwd=SAMPLES,
+    )
+    total = 0
+    modules = set()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        modules.add(name.strip())
+        if not name.startswith("  "):
+            # a top level import, its cumulative time includes its children
+            total += int(cumulative)
+    return total / 1000, modules
+
+
+def _best(arguments):
+    """Return the best total import time of RUNS runs and the modules"""
+    best = None
+    for _ in range(RUNS):
+        elapsed, modules = _importtime(arguments)
+        best = elapsed if best is None else min(best, elapsed)
+    return best, modules
+
+
+def main():
+    failed = False
+    baseline, _ = _best(["-c", "pass"])
+    print(f"{'interpreter':32s} {baseline:6.1f} ms")
+    for script, arguments in ENTRY_POINTS.items():
+        best, modules = _best([os.path.join(SAMPLES, script)] + arguments)
+        best -= baseline
+        heavy = sorted(name for name in modules
+                       if name.split(".")[0] in HEAVY_MODULES or name in HEAVY_MODULES)
+        verdict = "ok"
+        if heavy:
+            verdict = f"imports {', '.join(heavy)}"
+        elif best > BUDGET_MS:
+            verdict = f"over the {BUDGET_MS} ms budget"
+        failed = failed or verdict != "ok"
+        print(f"{script:32s} +{best:5.1f} ms  {verdict}")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""Code rights.
+
+Copyright IBM Corp 2026.
+bench_sysin.py - calls per second of create_sysin.sysin_file through a
+pipe and through a temporary file, next to create_sysin plus os.remove.
+Each call reads the data back the way the program would.
+
+Usage: bench_sysin.py [calls] [lines-per-call]
+"""
+import os
+import sys
+import tempfile
+import time
+
+MYDIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(MYDIR, "fakes"))
+sys.path.insert(0, os.path.join(MYDIR, ".."))
+
+import zoautil_py  # noqa: E402,F401 pylint: disable=unused-import
+from create_sysin import create_sysin, sysin_file  # noqa: E402
+
+
+def _read(pathname):
+    with open(pathname, "rb") as sysin:
+        return len(sysin.read())
+
+
+def _create_and_remove(inputdata, number):
+    filename = os.path.join(tempfile.gettempdir(), f"sysin.bench.{number}")
+    create_sysin(inputdata, filename)
+    _read(filename)
+    os.remove(filename)
+
+
+def _provided(inputdata, use_pipe):
+    with sysin_file(inputdata, use_pipe=use_pipe) as pathname:
+        _read(pathname)
+
+
+def main():
+    calls = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    lines = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    inputdata = [f" SELECT MEMBER=(MEM{number:05d})" for number in range(lines)]
+    for label, call in (
+        ("create_sysin", lambda number: _create_and_remove(inputdata, number)),
+        ("sysin_file file", lambda number: _provided(inputdata, False)),
+        ("sysin_file pipe", lambda number: _provided(inputdata, True)),
+    ):
+        start = time.monotonic()
+        for number in range(calls):
+            call(number)
+        elapsed = time.monotonic() - start
+        print(f"{label:16} {calls / elapsed:8.0f} calls per second")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""Code rights.
+
+Copyright IBM Corp 2026.
+bench_sysprint.py - time member_copy.parse_sysprint on a synthetic
+IEBCOPY SYSPRINT against the two readlines() passes it replaced, and
+compare the peak Python memory of both.
+
+Usage: bench_sysprint.py [lines]
+"""
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+MYDIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(MYDIR, "fakes"))
+sys.path.insert(0, os.path.join(MYDIR, ".."))
+
+# the fake zoautil_py registers the cp1047 codec
+import zoautil_py  # noqa: E402,F401
+import member_copy  # noqa: E402
+
+
+def _two_passes(printfile):
+    """The previous approach: one readlines() pass per question"""
+    badmembers = []
+    with open(printfile, "r", encoding="cp1047") as input_file:
+        for line in input_file.readlines():
+            if "IEB177I" in line:
+                badmembers.append(line.split()[1])
+    message = ""
+    with open(printfile, "r", encoding="cp1047") as input_file:
+        for line in input_file.readlines():
+            if "IGW01513T" in line:
+                message = "recfm"
+            elif "IEB127I" in line:
+                message = "recfm"
+            elif "IEB124I" in line:
+                message = "lrecl"
+            elif "913-00000038" in line:
+                message = "auth"
+    return badmembers, message
+
+
+def main():
+    line_count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    with tempfile.NamedTemporaryFile("w", encoding="cp1047", delete=False) as listing:
+        listing.write("  COPY OUTDD=SYSUT2,INDD=SYSUT1\n")
+        for number in range(line_count):
+            if number % 100 == 99:
+                listing.write(f"IEB177I M{number:07d} WAS SELECTED BUT NOT FOUND\n")
+            else:
+                listing.write(f"IEB154I M{number:07d} HAS BEEN SUCCESSFULLY COPIED\n")
+    print(f"{line_count} lines")
+    try:
+        for label, parse in (("parse_sysprint", member_copy.parse_sysprint),
+                             ("two passes", _two_passes)):
+            start = time.monotonic()
+            parse(listing.name)
+            elapsed = time.monotonic() - start
+            tracemalloc.start()
+            parse(listing.name)
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            print(f"{label:15} {elapsed:.3f} seconds, peak {peak // 1024} KB")
+    finally:
+        os.remove(listing.name)
+
+
+if __name__ == "__main__":
+    main()
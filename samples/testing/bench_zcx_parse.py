@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""Code rights.
+
+Copyright IBM Corp 2026.
+bench_zcx_parse.py - time zcx_versions.iter_version_messages on a large
+console log built from the zcx_corpus samples, and report how many corpus
+samples the fixed offset parser it replaced got right.
+
+Usage: bench_zcx_parse.py [messages]
+"""
+import json
+import os
+import sys
+import tempfile
+import time
+
+MYDIR = os.path.dirname(os.path.abspath(__file__))
+CORPUS = os.path.join(MYDIR, "zcx_corpus")
+sys.path.insert(0, os.path.join(MYDIR, ".."))
+
+import zcx_versions  # noqa: E402
+
+
+def _fixed_offsets(name, output):
+    """The previous approach: last GLZB022I line plus fixed line offsets"""
+    if ("NOT ACTIVE" in output):
+        return None
+    lines = output.splitlines()
+    msg_start_idx = None
+    for i in range(0, len(lines)):
+        if "GLZB022I" in lines[i]:
+            msg_start_idx = i
+    if msg_start_idx is None:
+        return zcx_versions.ZcxVersion(name, error="Unable to parse version message.")
+    if "Current Appliance" not in lines[msg_start_idx + 3]:
+        return zcx_versions.ZcxVersion(name, error="Unable to find current instance version.")
+    current_apar = lines[msg_start_idx + 3].split()[3]
+    current_version = lines[msg_start_idx + 4].split()[1]
+    available_apar = lines[msg_start_idx + 6].split()[3]
+    available_version = lines[msg_start_idx + 7].split()[1]
+    return zcx_versions.ZcxVersion(name, current_apar, current_version, available_apar,
+                                   available_version, current_version != available_version)
+
+
+def main():
+    message_count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    with open(os.path.join(CORPUS, "expected.json")) as expected_file:
+        expected = json.load(expected_file)
+    samples = {}
+    for sample in sorted(expected):
+        with open(os.path.join(CORPUS, sample)) as output:
+            samples[sample] = output.read()
+
+    right = 0
+    for sample, output in samples.items():
+        name = expected[sample]["instance"] if expected[sample] else "ZCX9"
+        try:
+            record = _fixed_offsets(name, output)
+            record = record._asdict() if record else None
+        except (IndexError, ValueError):
+            record = "exception"
+        right += record == expected[sample]
+    print(f"fixed offset parser: {right} of {len(samples)} corpus samples right")
+
+    messages = [output for output in samples.values() if "GLZB022I" in output]
+    with tempfile.NamedTemporaryFile("w", delete=False) as log:
+        for number in range(message_count):
+            log.write(messages[number % len(messages)])
+    try:
+        start = time.monotonic()
+        with open(log.name) as lines:
+            found = sum(1 for _ in zcx_versions.iter_version_messages(lines))
+        elapsed = time.monotonic() - start
+        size = os.path.getsize(log.name) / 1024 / 1024
+        print(f"iter_version_messages: {found} messages in {size:.1f} MB "
+              f"in {elapsed:.2f}s ({found / elapsed:.0f} messages/s)")
+    finally:
+        os.remove(log.name)
+
+
+if __name__ == "__main__":
+    main()
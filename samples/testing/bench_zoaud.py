@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""Code rights.
+
+Copyright IBM Corp 2026.
+bench_zoaud.py - operations per second for member listings: a new
+process per call (the fake mls in fakes/bin, a shell script, so this is
+a lower bound for the real utility), a new zoaud connection per call,
+one reused connection, and one pipelined connection. The shell path is
+measured too: a shell loop that starts mls for every call, one that
+starts zoau_client.py for every call, and one that sends every call
+through a zoau_session.sh session.
+
+Usage: bench_zoaud.py [operations]
+"""
+import os
+import shlex
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+MYDIR = os.path.dirname(os.path.abspath(__file__))
+SAMPLES = os.path.dirname(MYDIR)
+sys.path.insert(0, os.path.join(MYDIR, "fakes"))
+sys.path.insert(0, SAMPLES)
+
+import zoaud  # noqa: E402
+from zoau_client import ZoauClient  # noqa: E402
+from zoautil_py import datasets  # noqa: E402
+
+
+def _rate(label, operations, run):
+    start = time.monotonic()
+    run()
+    elapsed = time.monotonic() - start
+    print(f"{label:28s} {operations / elapsed:8.0f} operations/s")
+
+
+def main():
+    operations = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    libraries = [f"USER.LIB{number:04d}" for number in range(100)]
+    for library in libraries:
+        datasets.MEMBERS[library] = [f"MEM{number:05d}" for number in range(1, 11)]
+    patterns = [f"{libraries[number % len(libraries)]}(*)" for number in range(operations)]
+
+    path = os.path.join(tempfile.mkdtemp(), "zoaud.sock")
+    daemon = zoaud.ZoauDaemon(path)
+    threading.Thread(target=daemon.serve_forever, daemon=True).start()
+    try:
+        mls = os.path.join(MYDIR, "fakes", "bin", "mls")
+        spawned = patterns[:max(1, operations // 10)]
+        _rate("process per call", len(spawned), lambda: [
+            subprocess.run([mls, pattern], stdout=subprocess.PIPE, check=True)
+            for pattern in spawned])
+
+        def connection_per_call():
+            for pattern in patterns:
+                with ZoauClient(path) as client:
+                    client.call("mls", pattern)
+        _rate("connection per call", operations, connection_per_call)
+
+        def reused_connection():
+            with ZoauClient(path) as client:
+                for pattern in patterns:
+                    client.call("mls", pattern)
+        _rate("reused connection", operations, reused_connection)
+
+        def shell_loop(call, session=False):
+            # $0 is a file in samples, so zoau_session.sh finds zoau_client.py
+            script = (f'. "{SAMPLES}/zoau_session.sh"\n'
+                      + ("zoau_session_start || exit 1\n" if session else "")
+                      + f"for pattern in {' '.join(map(shlex.quote, spawned))}; do\n"
+                      + f'  {call} "$pattern" >/dev/null || exit 1\n'
+                      + "done\n"
+                      + ("zoau_session_end\n" if session else ""))
+            environment = dict(os.environ, ZOAUD_SOCKET=path,
+                               PATH=os.path.join(MYDIR, "fakes", "bin") + os.pathsep
+                               + os.environ["PATH"])
+            subprocess.run(["sh", "-c", script, os.path.join(SAMPLES, "bench")],
+                           env=environment, check=True)
+        _rate("shell, mls per call", len(spawned), lambda: shell_loop("mls"))
+        _rate("shell, client per call", len(spawned), lambda: shell_loop(
+            f'python3 "{SAMPLES}/zoau_client.py" mls'))
+        _rate("shell, one session", len(spawned), lambda: shell_loop("zoau_call mls", True))
+
+        def pipelined():
+            with ZoauClient(path) as client:
+                responses = client.pipeline(("mls", [pattern]) for pattern in patterns)
+            assert all(response["ok"] and len(response["result"]) == 10
+                       for response in responses)
+        _rate("pipelined", operations, pipelined)
+    finally:
+        daemon.shutdown()
+        daemon.server_close()
+        os.rmdir(os.path.dirname(path))
+
+
+if __name__ == "__main__":
+    main()
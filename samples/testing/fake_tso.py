@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""Code rights.
+
+Copyright IBM Corp 2026.
+fake_tso.py - a stand-in for IKJEFT01 so runrexx.RexxSession can be run
+without z/OS. fake_ikjeft01 reads the commands from SYSTSIN and writes a
+SYSTSPRT the way batch TSO does, with a READY prompt and the echo of every
+command. %RXSESSN behaves like the session exec of runrexx.py: it runs the
+calls in the RXCALLS DD, each with its input lines from its RXInnnnn DD
+and an empty line on a data stack of its own, and says the RXSESSN CALL
+and END lines around each.
+
+The execs behave like the HELOWRLD sample in runrexx.py: they say their
+arguments and echo their input lines until an empty line. READ n echoes
+exactly n lines instead, reading from SYSTSIN like TSO once its stack is
+empty, and FAIL ends with rc 12.
+
+Run it to see a session split into per-call output.
+"""
+import os
+import sys
+import tempfile
+
+MYDIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(MYDIR, "fakes"))
+sys.path.insert(0, os.path.join(MYDIR, ".."))
+
+import runrexx  # noqa: E402
+
+
+def _read(filename):
+    with open(filename, "r", encoding="cp1047") as records:
+        return [line.rstrip("\n") for line in records]
+
+
+def _run_exec(command, stack, terminal, output):
+    """Run one fake exec, return its rc"""
+    def pull():
+        if stack:
+            return stack.pop(0)
+        # like TSO, an empty stack reads from SYSTSIN, empty at its end
+        return terminal.pop(0) if terminal else ""
+
+    words = command.split(None, 1)
+    if words[0] == "FAIL":
+        output.append("FAIL ended with rc 12")
+        return 12
+    if words[0] == "READ":
+        for _ in range(int(words[1])):
+            output.append(pull())
+        return 0
+    if len(words) > 1:
+        output.append(f"Argument passed in is:  {words[1]}")
+    else:
+        output.append(" No input passed in")
+    output.append("Now printing data passed in via STDIN:")
+    data = pull()
+    while data:
+        output.append(data)
+        data = pull()
+    return 0
+
+
+def fake_ikjeft01(authorized, dd_list, files):
+    """Driver for RexxSession that imitates IKJEFT01"""
+    terminal = _read(files["SYSTSIN"])
+    output = []
+    while terminal:
+        command = terminal.pop(0).strip()
+        output.append("READY")
+        if not command:
+            continue
+        output.append(f" {command}")
+        if command != f"%{runrexx.SESSION_EXEC}":
+            _run_exec(command, [], terminal, output)
+            continue
+        for number, call in enumerate(_read(files["RXCALLS"]), start=1):
+            lines, command = call.split(None, 1)
+            stack = _read(files[f"RXI{number:05d}"]) if int(lines) else []
+            output.append(f"RXSESSN CALL {number}")
+            exec_rc = _run_exec(command, stack[:int(lines)] + [""], terminal, output)
+            output.append(f"RXSESSN END {number} {exec_rc}")
+    output.extend(["READY", "END"])
+    with open(files["SYSTSPRT"], "w", encoding="cp1047") as systsprt:
+        systsprt.write("\n".join(output) + "\n")
+    with open(files["SYSPRINT"], "w", encoding="cp1047"):
+        pass
+    return {"rc": 0, "stdout_response": "", "stderr_response": ""}
+
+
+def main():
+    os.chdir(tempfile.mkdtemp())
+    with runrexx.RexxSession(False, "FAKE.REXX", driver=fake_ikjeft01) as session:
+        for number in range(3):
+            session.call(f"HELOWRLD call {number}", [f"input {number}.{line}" for line in range(number)])
+    for result in session.results:
+        print(f"--- {result['systsprtfile']}")
+        with open(result["systsprtfile"], "r", encoding="cp1047") as output:
+            print(output.read(), end="")
+
+
+if __name__ == "__main__":
+    main()
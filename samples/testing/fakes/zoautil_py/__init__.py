@@ -0,0 +1,48 @@
+"""Code rights.
+
+Copyright IBM Corp 2026.
+Minimal stand-in for zoautil_py so the samples can be exercised on
+systems without ZOAU. Only the calls used by the samples are provided.
+"""
+import codecs
+
+# Python on z/OS ships a cp1047 codec, most other platforms do not.
+# Build it from cp037, which only differs in the characters swapped below.
+try:
+    codecs.lookup("cp1047")
+except LookupError:
+    _decoding_table = list(bytes(range(256)).decode("cp037"))
+    for _byte, _char in ((0x5F, "^"), (0xAD, "["), (0xB0, "\xac"),
+                         (0xBA, "\xdd"), (0xBB, "\xa8"), (0xBD, "]")):
+        _decoding_table[_byte] = _char
+    _decoding_table = "".join(_decoding_table)
+    _encoding_table = codecs.charmap_build(_decoding_table)
+
+    class _Codec(codecs.Codec):
+        def encode(self, input, errors="strict"):
+            return codecs.charmap_encode(input, errors, _encoding_table)
+
+        def decode(self, input, errors="strict"):
+            return codecs.charmap_decode(input, errors, _decoding_table)
+
+    class _IncrementalEncoder(codecs.IncrementalEncoder):
+        def encode(self, input, final=False):
+            return codecs.charmap_encode(input, self.errors, _encoding_table)[0]
+
+    class _IncrementalDecoder(codecs.IncrementalDecoder):
+        def decode(self, input, final=False):
+            return codecs.charmap_decode(input, self.errors, _decoding_table)[0]
+
+    class _StreamWriter(_Codec, codecs.StreamWriter):
+        pass
+
+    class _StreamReader(_Codec, codecs.StreamReader):
+        pass
+
+    _codec_info = codecs.CodecInfo(
+        name="cp1047", encode=_Codec().encode, decode=_Codec().decode,
+        incrementalencoder=_IncrementalEncoder,
+        incrementaldecoder=_IncrementalDecoder,
+        streamwriter=_StreamWriter, streamreader=_StreamReader,
+    )
+    codecs.register(lambda name: _codec_info if name in ("cp1047", "ibm1047") else None)
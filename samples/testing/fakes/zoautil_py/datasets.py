@@ -0,0 +1,100 @@
+"""Fake zoautil_py.datasets
+
+Members of a library can be preset through MEMBERS, for example
+MEMBERS["USER.JCL"] = ["JOB1", "JOB2"]; those libraries and the names in
+DATASETS are the data sets that exist for list_dataset_names. read
+returns CONTENTS[name] if it is set, else a few lines naming the data set,
+after READ_DELAY seconds (or FAKE_READ_DELAY). list_datasets reports the
+ATTRIBUTES preset for a data set, PS FB 80 if there are none. Writes and
+deletes are only recorded in WRITES and DELETES, and creates in CREATES,
+with their options in CREATE_OPTIONS.
+"""
+import fnmatch
+import itertools
+import os
+import time
+
+MEMBERS = {}
+DATASETS = []
+CONTENTS = {}
+ATTRIBUTES = {}
+READ_DELAY = float(os.environ.get("FAKE_READ_DELAY", "0"))
+WRITES = []
+DELETES = []
+CREATES = []
+CREATE_OPTIONS = {}
+_tmp_names = itertools.count(1)
+
+
+def hlq():
+    """Return the high level qualifier"""
+    return "FAKEUSER"
+
+
+def exists(name):
+    """Every data set exists"""
+    return True
+
+
+def list_dataset_names(pattern):
+    """Return the preset data sets that match pattern"""
+    names = sorted(set(DATASETS) | set(MEMBERS))
+    return [name for name in names if fnmatch.fnmatchcase(name, pattern.upper())]
+
+
+class Dataset:
+    """The attributes of a data set that list_datasets reports"""
+
+    def __init__(self, name, organization="PS", record_format="FB", record_length=80):
+        self.name = name
+        self.organization = organization
+        self.record_format = record_format
+        self.record_length = record_length
+
+
+def list_datasets(pattern):
+    """Return a Dataset for every preset data set that matches pattern"""
+    return [Dataset(name, **ATTRIBUTES.get(name, {}))
+            for name in sorted(set(DATASETS) | set(MEMBERS) | set(ATTRIBUTES))
+            if fnmatch.fnmatchcase(name, pattern.upper())]
+
+
+def list_members(pattern):
+    """Return the members preset for the library in pattern that match"""
+    library, _, member_pattern = pattern.rstrip(")").partition("(")
+    return [member for member in MEMBERS.get(library, [])
+            if fnmatch.fnmatchcase(member, (member_pattern or "*").upper())]
+
+
+def read(dataset):
+    """Return the preset contents of dataset"""
+    time.sleep(READ_DELAY)
+    if dataset in CONTENTS:
+        return CONTENTS[dataset]
+    return "".join(f"{dataset} LINE {number}\n" for number in range(1, 4))
+
+
+def write(dataset, content, append=False):
+    """Record the write in WRITES"""
+    WRITES.append(dataset)
+
+
+def delete(dataset):
+    """Record the delete in DELETES"""
+    DELETES.append(dataset)
+
+
+def delete_members(pattern):
+    """Record the delete in DELETES"""
+    DELETES.append(pattern)
+
+
+def tmp_name(high_level_qualifier=None):
+    """Return a new unique data set name"""
+    return f"{high_level_qualifier or hlq()}.T{next(_tmp_names):07d}"
+
+
+def create(name, type=None, **kwargs):
+    """Record the create in CREATES and its options in CREATE_OPTIONS"""
+    CREATES.append(name)
+    CREATE_OPTIONS[name] = dict(kwargs, type=type)
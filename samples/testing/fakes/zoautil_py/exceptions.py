@@ -0,0 +1,5 @@
+"""Fake zoautil_py.exceptions"""
+
+
+class ZOAUException(Exception):
+    """Base exception, as raised by the real ZOAU API"""
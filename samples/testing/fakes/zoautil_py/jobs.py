@@ -0,0 +1,77 @@
+"""Fake zoautil_py.jobs
+
+Submitted jobs stay active ("AC") for a random time taken from LATENCY
+and then complete with "CC" and rc 0. QUERIES counts status queries and
+FETCHED the jobs fetch_multiple returned.
+"""
+import fnmatch
+import itertools
+import random
+import time
+
+LATENCY = (0.5, 2.0)
+QUERIES = 0
+FETCHED = 0
+
+_job_numbers = itertools.count(1)
+_submitted = {}
+
+
+class Job:
+    """A simulated JES job"""
+
+    def __init__(self, name, owner="FAKEUSER"):
+        self.id = f"JOB{next(_job_numbers):05d}"
+        self.name = name[:8]
+        self.owner = owner
+        self.status = "AC"
+        self.rc = None
+        self._ends_at = time.monotonic() + random.uniform(*LATENCY)
+
+    def _update(self):
+        if self.status == "AC" and time.monotonic() >= self._ends_at:
+            self.status = "CC"
+            self.rc = 0
+
+    def refresh(self):
+        """Refresh the job status, counting it as one query"""
+        global QUERIES
+        QUERIES += 1
+        self._update()
+
+    def wait(self):
+        """Block until the job completes"""
+        time.sleep(max(0, self._ends_at - time.monotonic()))
+        self._update()
+
+    def purge(self):
+        """Remove the job"""
+        _submitted.pop(self.id, None)
+
+
+def submit(dataset, timeout=None, **kwargs):
+    """Submit the JCL in dataset, the member name becomes the job name"""
+    name = dataset.rstrip(")").split("(")[-1].split(".")[-1]
+    job = Job(name)
+    _submitted[job.id] = job
+    return job
+
+
+def fetch_multiple(job_id=None, job_owner=None, job_name="*", **kwargs):
+    """Return copies of all matching jobs, counting it as one query"""
+    global QUERIES, FETCHED
+    QUERIES += 1
+    matching = []
+    for job in _submitted.values():
+        if job_id is not None and job.id != job_id:
+            continue
+        if job_owner is not None and job.owner != job_owner:
+            continue
+        if not fnmatch.fnmatchcase(job.name, job_name or "*"):
+            continue
+        job._update()
+        copy = Job.__new__(Job)
+        copy.__dict__.update(job.__dict__)
+        matching.append(copy)
+    FETCHED += len(matching)
+    return matching
@@ -0,0 +1,168 @@
+"""Fake zoautil_py.mvscmd
+
+execute sleeps for DELAY seconds to stand in for program startup, plus
+MEMBER_DELAY seconds per member IEBCOPY copies. Both can also be set with
+the FAKE_MVSCMD_DELAY and FAKE_MVSCMD_MEMBER_DELAY environment variables,
+which reach worker processes too. For IEBCOPY it also writes a SYSPRINT
+that reports every selected member as copied, except the members listed
+in MISSING. Members of a copy group whose input data set is in PDSE
+are reported with IGW01551I instead of IEB154I. A copy group whose input data set is in BAD_RECFM gets an
+IEB127I message instead and ends the run with rc 8. A program that
+has a DD for a data set in UNALLOCATED is not run: it ends with rc 8 and
+an allocation error in stderr, and writes no SYSPRINT. For IDCAMS LISTCAT ENTRIES it writes the record statistics in
+LISTCAT_STATS for the entry, all zero if there are none. LISTCAT
+CATALOG lists the (type, name, volser) entries in CATALOGS for the
+catalog, and LISTCAT USERCATALOG the catalogs in CATALOGS other than
+MASTER_CATALOG. For SORT it
+appends the control statements and the SORTINnn and SORTOUT data sets to
+SORTS.
+"""
+import os
+import re
+import time
+
+DELAY = float(os.environ.get("FAKE_MVSCMD_DELAY", "0"))
+MEMBER_DELAY = float(os.environ.get("FAKE_MVSCMD_MEMBER_DELAY", "0"))
+MISSING = set()
+PDSE = set()
+BAD_RECFM = set()
+UNALLOCATED = set()
+CALLS = []
+LISTCAT_STATS = {}
+MASTER_CATALOG = "CATALOG.MASTER"
+CATALOGS = {}
+SORTS = []
+
+
+class _Result:
+    def __init__(self, rc, stdout="", stderr=""):
+        self.rc = rc
+        self.stdout_response = stdout
+        self.stderr_response = stderr
+
+    def to_dict(self):
+        return {
+            "rc": self.rc,
+            "stdout_response": self.stdout_response,
+            "stderr_response": self.stderr_response,
+        }
+
+
+def _dd_file(dds, ddname):
+    for dd in dds:
+        if dd.name == ddname:
+            return dd.definition.name
+    return None
+
+
+def _iebcopy(dds):
+    rc = 0
+    with open(_dd_file(dds, "SYSIN"), encoding="cp1047") as sysin:
+        statements = sysin.read().splitlines()
+    listing = ["1IEBCOPY MESSAGES AND CONTROL STATEMENTS"]
+    bad_group = False
+    pdse_group = False
+    for statement in statements:
+        listing.append(f"  {statement.strip()}")
+        indd = re.search(r"INDD=(\w+)", statement)
+        if indd:
+            source = [dd.definition.name for dd in dds if dd.name == indd.group(1)]
+            bad_group = bool(source) and source[0] in BAD_RECFM
+            pdse_group = bool(source) and source[0] in PDSE
+            if bad_group:
+                listing.append("IEB127I RECORD FORMATS ARE INCOMPATIBLE RECFM=FB AND RECFM=VB")
+                rc = 8
+                continue
+            listing.append(
+                "IEB167I FOLLOWING MEMBER(S) COPIED FROM INPUT DATA SET "
+                f"REFERENCED BY {indd.group(1)}"
+            )
+        select = re.search(r"MEMBER=\((.*)\)", statement)
+        if select and not bad_group:
+            for member in select.group(1).split(","):
+                if member in MISSING:
+                    listing.append(f"IEB177I {member} WAS SELECTED BUT NOT FOUND")
+                    rc = max(rc, 4)
+                else:
+                    time.sleep(MEMBER_DELAY)
+                    if pdse_group:
+                        listing.append(f"IGW01551I MEMBER {member} HAS BEEN LOADED")
+                        continue
+                    listing.append(f"IEB154I {member}     HAS BEEN SUCCESSFULLY COPIED")
+    with open(_dd_file(dds, "SYSPRINT"), "w", encoding="cp1047") as sysprint:
+        sysprint.write("\n".join(listing) + "\n")
+    return rc
+
+
+def _listcat_entries(entry):
+    stats = LISTCAT_STATS.get(entry, {})
+    listing = [f"0CLUSTER ------- {entry}", f"0   DATA ------- {entry}.DATA",
+               "      STATISTICS"]
+    for key in ("REC-TOTAL", "REC-DELETED", "REC-INSERTED", "REC-UPDATED"):
+        listing.append(f"        {key}{'-' * 10}{stats.get(key, 0)}")
+    return listing
+
+
+def _listcat_catalog(catalog):
+    listing = [f"0LISTING FROM CATALOG -- {catalog}"]
+    for entry_type, name, volser in CATALOGS.get(catalog, []):
+        indent = "   " if entry_type in ("DATA", "INDEX") else ""
+        listing.append(f"{indent}0{entry_type} {'-' * 7} {name}")
+        if entry_type == "ALIAS":
+            listing.append(f"{indent}     IN-CAT --- {catalog}")
+        if volser:
+            listing += [f"{indent}     VOLUMES",
+                        f"{indent}       VOLSER------------{volser}     DEVTYPE------X'3010200F'"]
+    return listing
+
+
+def _idcams(dds):
+    with open(_dd_file(dds, "SYSIN"), encoding="cp1047") as sysin:
+        statements = [line for line in sysin.read().splitlines() if line.strip()]
+    listing = []
+    for statement in statements:
+        listing += ["1IDCAMS  SYSTEM SERVICES", "0", f"  {statement.strip()}"]
+        entries = re.search(r"ENTRIES\('?([^')]+)", statement)
+        catalog = re.search(r"CATALOG\('?([^')]+)", statement)
+        if entries:
+            listing += _listcat_entries(entries.group(1))
+        elif "USERCATALOG" in statement:
+            listing.append(f"0LISTING FROM CATALOG -- {MASTER_CATALOG}")
+            listing += [f"0USERCATALOG --- {name}" for name in CATALOGS
+                        if name != MASTER_CATALOG]
+        elif catalog:
+            listing += _listcat_catalog(catalog.group(1))
+    with open(_dd_file(dds, "SYSPRINT"), "w", encoding="cp1047") as sysprint:
+        sysprint.write("\n".join(listing) + "\n")
+    return 0
+
+
+def _sort(dds):
+    with open(_dd_file(dds, "SYSIN"), encoding="cp1047") as sysin:
+        control = sysin.read().splitlines()
+    sortin = [dd.definition.name for dd in dds if dd.name.startswith("SORTIN")]
+    SORTS.append((control, sortin, _dd_file(dds, "SORTOUT")))
+    return 0
+
+
+def execute(pgm, pgm_args="", dds=None, **kwargs):
+    """Pretend to run pgm"""
+    CALLS.append(pgm)
+    time.sleep(DELAY)
+    for dd in dds or []:
+        if getattr(dd.definition, "name", None) in UNALLOCATED:
+            return _Result(8, stderr=f"BGYSC1003E Error allocating data set "
+                                     f"{dd.definition.name} for DD {dd.name}")
+    rc = 0
+    if pgm.upper() == "IEBCOPY":
+        rc = _iebcopy(dds or [])
+    elif pgm.upper() == "IDCAMS":
+        rc = _idcams(dds or [])
+    elif pgm.upper() == "SORT":
+        rc = _sort(dds or [])
+    return _Result(rc)
+
+
+def execute_authorized(pgm, pgm_args="", dds=None, **kwargs):
+    """Pretend to run pgm authorized"""
+    return execute(pgm, pgm_args, dds, **kwargs)
@@ -0,0 +1,30 @@
+"""Fake zoautil_py.opercmd
+
+execute answers every command with a canned response after DELAY
+seconds, which can also be set with FAKE_OPERCMD_DELAY.
+"""
+import os
+import time
+
+DELAY = float(os.environ.get("FAKE_OPERCMD_DELAY", "0"))
+
+
+class _Result:
+    def __init__(self, rc, stdout="", stderr=""):
+        self.rc = rc
+        self.stdout_response = stdout
+        self.stderr_response = stderr
+
+    def to_dict(self):
+        return {
+            "rc": self.rc,
+            "stdout_response": self.stdout_response,
+            "stderr_response": self.stderr_response,
+        }
+
+
+def execute(command, parameters=None, **kwargs):
+    """Pretend to issue an operator command"""
+    time.sleep(DELAY)
+    return _Result(0, f"S0W1     26290 08:14:03.17             ISF031I CONSOLE FAKE\n"
+                      f"S0W1     26290 08:14:03.17  {command.upper()}\n")
@@ -0,0 +1,24 @@
+"""Fake zoautil_py.types"""
+
+
+class DatasetDefinition:
+    """A DD that points to a data set"""
+
+    def __init__(self, dataset_name, disposition="SHR", **kwargs):
+        self.name = dataset_name
+        self.disposition = disposition
+
+
+class FileDefinition:
+    """A DD that points to a z/OS UNIX file"""
+
+    def __init__(self, path_name, **kwargs):
+        self.name = path_name
+
+
+class DDStatement:
+    """A DD name and its definition"""
+
+    def __init__(self, name, definition):
+        self.name = name
+        self.definition = definition
@@ -0,0 +1,170 @@
+"""Code rights.
+
+Copyright IBM Corp 2026.
+test_catalog_crawler.py - check the LISTCAT parsing, the incremental refresh
+and the pattern lookups of catalog-utils/catalog_crawler.py, with the fake
+IDCAMS in testing/fakes.
+
+Run with: python3 -m pytest testing/test_catalog_crawler.py
+"""
+import os
+import sys
+
+import pytest
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, "fakes"))
+sys.path.insert(0, os.path.join(os.path.dirname(HERE), "catalog-utils"))
+
+import catalog_crawler  # noqa: E402
+from zoautil_py import mvscmd  # noqa: E402
+
+CATALOGS = {
+    "CATALOG.MASTER": [
+        ("NONVSAM", "SYS1.PARMLIB", "RES001"),
+        ("ALIAS", "IBMUSER", None),
+        ("USERCATALOG", "CATALOG.UCAT1", "CAT001"),
+    ],
+    "CATALOG.UCAT1": [
+        ("NONVSAM", "IBMUSER.JCL", "USR001"),
+        ("CLUSTER", "IBMUSER.KSDS", None),
+        ("DATA", "IBMUSER.KSDS.DATA", "USR002"),
+        ("INDEX", "IBMUSER.KSDS.INDEX", "USR003"),
+        ("GDG BASE", "IBMUSER.GDG", None),
+        ("NONVSAM", "IBMUSER.GDG.G0001V00", "USR001"),
+    ],
+}
+
+
+@pytest.fixture
+def index(tmp_path, monkeypatch):
+    monkeypatch.setattr(mvscmd, "CATALOGS", dict(CATALOGS))
+    monkeypatch.setattr(mvscmd, "LISTCAT_STATS", {})
+    with catalog_crawler.CatalogIndex(str(tmp_path / "index.db")) as index:
+        yield index
+
+
+def test_parse_listcat():
+    listing = [
+        "0NONVSAM ------- SYS1.PARMLIB",
+        "         VOLSER------------RES001     DEVTYPE------X'3010200F'",
+        "0CLUSTER ------- IBMUSER.KSDS",
+        "   0DATA ------- IBMUSER.KSDS.DATA",
+        "         VOLSER------------USR002     DEVTYPE------X'3010200F'",
+        "   0INDEX ------ IBMUSER.KSDS.INDEX",
+        "         VOLSER------------USR003     DEVTYPE------X'3010200F'",
+    ]
+    assert [(entry.dsn, entry.entry_type, entry.volser)
+            for entry in catalog_crawler.parse_listcat(listing, "CATALOG.MASTER")] == [
+        ("SYS1.PARMLIB", "NONVSAM", "RES001"),
+        ("IBMUSER.KSDS.DATA", "DATA", "USR002"),
+        ("IBMUSER.KSDS.INDEX", "INDEX", "USR003"),
+        ("IBMUSER.KSDS", "CLUSTER", "USR002"),
+    ]
+
+
+def test_list_catalogs(index):
+    assert catalog_crawler.list_catalogs() == ("CATALOG.MASTER", ["CATALOG.UCAT1"])
+
+
+def test_refresh(index):
+    assert catalog_crawler.refresh(index) == {"CATALOG.MASTER": (3, 0), "CATALOG.UCAT1": (4, 0)}
+    assert index.lookup("ibmuser.ksds") == [
+        catalog_crawler.CatalogEntry("IBMUSER.KSDS", "CLUSTER", "USR002", "CATALOG.UCAT1")]
+
+
+def test_incremental_refresh(index):
+    mvscmd.LISTCAT_STATS["CATALOG.UCAT1"] = {"REC-UPDATED": 1}
+    catalog_crawler.refresh(index)
+    assert catalog_crawler.refresh(index, incremental=True) == {}
+    mvscmd.LISTCAT_STATS["CATALOG.UCAT1"] = {"REC-UPDATED": 2}
+    mvscmd.CATALOGS["CATALOG.UCAT1"] = CATALOGS["CATALOG.UCAT1"][:1]
+    assert catalog_crawler.refresh(index, incremental=True) == {"CATALOG.UCAT1": (1, 0)}
+    assert [entry.dsn for entry in index.lookup("IBMUSER.**")] == ["IBMUSER.JCL"]
+
+
+@pytest.mark.parametrize("pattern, names", [
+    ("IBMUSER.*", ["IBMUSER.GDG", "IBMUSER.JCL", "IBMUSER.KSDS"]),
+    ("IBMUSER.**", ["IBMUSER.GDG", "IBMUSER.GDG.G0001V00", "IBMUSER.JCL", "IBMUSER.KSDS"]),
+    ("IBMUSER.%%%", ["IBMUSER.GDG", "IBMUSER.JCL"]),
+    ("IBMUSER.GDG.G%%%%V00", ["IBMUSER.GDG.G0001V00"]),
+    ("*.PARMLIB", ["SYS1.PARMLIB"]),
+    ("SYS1", []),
+])
+def test_lookup(index, pattern, names):
+    catalog_crawler.refresh(index)
+    assert [entry.dsn for entry in index.lookup(pattern)] == names
+
+
+def _failing_listcat(monkeypatch, catalog, rc=12):
+    """Make the LISTCAT of catalog end with rc without writing a SYSPRINT"""
+    execute_authorized = mvscmd.execute_authorized
+
+    def execute(pgm, dds=(), **kwargs):
+        with open(dds[0].definition.name, encoding="cp1047") as sysin:
+            if f"CATALOG('{catalog}')" in sysin.read():
+                return mvscmd._Result(rc, stderr="IDC3009I ** VSAM CATALOG RETURN CODE IS 4")
+        return execute_authorized(pgm, dds=dds, **kwargs)
+
+    monkeypatch.setattr(mvscmd, "execute_authorized", execute)
+
+
+def test_idcams_without_sysprint(monkeypatch):
+    monkeypatch.setattr(mvscmd, "execute_authorized",
+                        lambda pgm, dds=(), **kwargs: mvscmd._Result(16))
+    with catalog_crawler.idcams(["LISTCAT CATALOG('CATALOG.UCAT1')"]) as (listing, rc):
+        assert list(listing) == []
+        assert rc == 16
+
+
+def test_failed_listcat_keeps_entries(index, monkeypatch):
+    catalog_crawler.refresh(index)
+    _failing_listcat(monkeypatch, "CATALOG.UCAT1")
+    assert catalog_crawler.refresh(index) == {"CATALOG.MASTER": (3, 0), "CATALOG.UCAT1": (0, 12)}
+    assert len(index.lookup("IBMUSER.**")) == 4
+
+
+def test_refresh_streams_batches(index, monkeypatch):
+    monkeypatch.setattr(catalog_crawler, "BATCH_SIZE", 1)
+    monkeypatch.setattr(catalog_crawler, "_QUEUED_BATCHES", 1)
+    replace = index.replace
+    stored = []
+
+    def streamed_replace(catalog, entries, change_token=None):
+        assert not isinstance(entries, (list, tuple))
+        stored.append(catalog)
+        return replace(catalog, entries, change_token)
+
+    monkeypatch.setattr(index, "replace", streamed_replace)
+    assert catalog_crawler.refresh(index, workers=1) == {
+        "CATALOG.MASTER": (3, 0), "CATALOG.UCAT1": (4, 0)}
+    assert stored == ["CATALOG.MASTER", "CATALOG.UCAT1"]
+    assert len(index.lookup("**")) == 7
+
+
+def test_failed_parse_keeps_entries(index, monkeypatch):
+    catalog_crawler.refresh(index)
+    monkeypatch.setattr(catalog_crawler, "BATCH_SIZE", 1)
+
+    def broken(lines, catalog):
+        yield catalog_crawler.CatalogEntry("IBMUSER.NEW", "NONVSAM", "USR001", catalog)
+        raise ValueError("unexpected listing")
+
+    monkeypatch.setattr(catalog_crawler, "parse_listcat", broken)
+    with pytest.raises(ValueError, match="unexpected listing"):
+        catalog_crawler.refresh(index)
+    assert [entry.dsn for entry in index.lookup("IBMUSER.*")] == [
+        "IBMUSER.GDG", "IBMUSER.JCL", "IBMUSER.KSDS"]
+
+
+def test_failed_store_stops_listings(index, monkeypatch):
+    monkeypatch.setattr(catalog_crawler, "BATCH_SIZE", 1)
+    monkeypatch.setattr(catalog_crawler, "_QUEUED_BATCHES", 1)
+
+    def full_disk(catalog, entries, change_token=None):
+        raise OSError("database or disk is full")
+
+    monkeypatch.setattr(index, "replace", full_disk)
+    # returns instead of waiting for the blocked listings forever
+    with pytest.raises(OSError, match="disk is full"):
+        catalog_crawler.refresh(index, workers=2)
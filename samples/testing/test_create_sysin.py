@@ -0,0 +1,154 @@
+"""Code rights.
+
+Copyright IBM Corp 2026.
+test_create_sysin.py - check the card images built by create_sysin.py:
+the 72 column limit, continuation cards, sequence numbers and the errors
+reported for lines that do not fit, and the pipe or temporary file that
+sysin_file hands out.
+
+Run with: python3 -m pytest testing/test_create_sysin.py
+"""
+import os
+import stat
+import sys
+import threading
+
+import pytest
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, "fakes"))
+sys.path.insert(0, os.path.dirname(HERE))
+
+import zoautil_py  # noqa: E402,F401 pylint: disable=unused-import
+from create_sysin import CardImageError, create_sysin, encode_cards, sysin_file  # noqa: E402
+
+
+def _cards(data, newline=True):
+    text = data.decode("cp1047")
+    return text.split("\n")[:-1] if newline else [text[i:i + 80] for i in range(0, len(text), 80)]
+
+
+def test_cards_are_80_columns():
+    cards = _cards(encode_cards(["  SORT FIELDS=COPY", "X" * 72]))
+    assert cards == ["  SORT FIELDS=COPY".ljust(80), "X" * 72 + " " * 8]
+
+
+def test_cards_without_newline():
+    data = encode_cards(["A", "B"], newline=False)
+    assert len(data) == 160
+    assert _cards(data, newline=False) == ["A".ljust(80), "B".ljust(80)]
+
+
+def test_sequence_numbers():
+    cards = _cards(encode_cards(["A", "X" * 72], sequence=True, sequence_start=100,
+                                sequence_step=5))
+    assert cards == ["A".ljust(72) + "00000100", "X" * 72 + "00000105"]
+
+
+def test_sequence_overflow():
+    with pytest.raises(CardImageError, match="does not fit in 8 columns"):
+        encode_cards(["A", "B"], sequence=True, sequence_start=99999999)
+
+
+@pytest.mark.parametrize("sequence", [False, True])
+def test_overlong_cards_reported_together(sequence):
+    inputdata = ["OK", "Y" * 73, "X" * 72, "Z" * 80]
+    with pytest.raises(CardImageError) as error:
+        encode_cards(inputdata, sequence=sequence)
+    assert [(number, line) for number, line, _ in error.value.violations] == [
+        (2, "Y" * 73), (4, "Z" * 80)
+    ]
+    assert "72 chars or fewer, length: 73" in error.value.violations[0][2]
+
+
+def test_same_limit_as_create_sysin(tmp_path):
+    with pytest.raises(CardImageError) as error:
+        create_sysin(["Y" * 73], str(tmp_path / "sysin"))
+    assert error.value.violations == [
+        (1, "Y" * 73, "Input lines must be 72 chars or fewer, length: 73")
+    ]
+    create_sysin(["X" * 72], str(tmp_path / "sysin"))
+    assert (tmp_path / "sysin").read_bytes().decode("cp1047") == "X" * 72 + "\n"
+
+
+def test_continuation():
+    line = "".join(chr(ord("A") + number % 26) for number in range(140))
+    cards = _cards(encode_cards([line, "SHORT"], continuation="X"))
+    assert cards[0] == line[:71] + "X" + " " * 8
+    assert cards[1] == " " * 15 + line[71:127] + "X" + " " * 8
+    assert cards[2] == (" " * 15 + line[127:]).ljust(80)
+    assert cards[3] == "SHORT".ljust(80)
+
+
+def test_continuation_with_sequence_numbers():
+    cards = _cards(encode_cards(["A" * 72], continuation="-", sequence=True))
+    assert cards == ["A" * 71 + "-" + "00000010", " " * 15 + "A" + " " * 56 + "00000020"]
+
+
+def test_encoding_errors():
+    with pytest.raises(CardImageError) as error:
+        encode_cards(["OK", "cafâ¬"])
+    assert error.value.violations == [(2, "cafâ¬", "'â¬' is not in cp1047")]
+
+
+def test_sysin_file_pipe(tmp_path):
+    with sysin_file(["  SORT FIELDS=COPY"], directory=str(tmp_path)) as pathname:
+        assert stat.S_ISFIFO(os.stat(pathname).st_mode)
+        with open(pathname, "rb") as sysin:
+            assert sysin.read().decode("cp1047") == "  SORT FIELDS=COPY\n"
+    assert os.listdir(tmp_path) == []
+
+
+def test_sysin_file_pipe_never_opened(tmp_path):
+    before = threading.active_count()
+    with sysin_file(["A"], directory=str(tmp_path)) as pathname:
+        assert stat.S_ISFIFO(os.stat(pathname).st_mode)
+    assert os.listdir(tmp_path) == []
+    # the writer thread was released instead of waiting for a reader
+    assert threading.active_count() == before
+
+
+@pytest.mark.parametrize("use_pipe", [True, False])
+def test_sysin_file_removed_on_error(tmp_path, use_pipe):
+    with pytest.raises(RuntimeError):
+        with sysin_file(["A"], use_pipe=use_pipe, directory=str(tmp_path)):
+            raise RuntimeError("the program failed")
+    assert os.listdir(tmp_path) == []
+
+
+def test_sysin_file_without_pipe(tmp_path):
+    with sysin_file(["A", "B"], use_pipe=False, directory=str(tmp_path),
+                    prefix="systsin") as pathname:
+        assert stat.S_ISREG(os.stat(pathname).st_mode)
+        assert os.path.basename(pathname).startswith("systsin.")
+        # a file can be read more than once
+        for _ in range(2):
+            with open(pathname, "rb") as sysin:
+                assert sysin.read().decode("cp1047") == "A\nB\n"
+    assert os.listdir(tmp_path) == []
+
+
+def test_sysin_file_falls_back_to_file(tmp_path, monkeypatch):
+    def no_fifo(pathname, mode=0o666):
+        raise OSError("mkfifo is not supported here")
+
+    monkeypatch.setattr(os, "mkfifo", no_fifo)
+    with sysin_file(["A"], directory=str(tmp_path)) as pathname:
+        assert stat.S_ISREG(os.stat(pathname).st_mode)
+        with open(pathname, "rb") as sysin:
+            assert sysin.read().decode("cp1047") == "A\n"
+    assert os.listdir(tmp_path) == []
+
+
+def test_sysin_file_falls_back_without_mkfifo(tmp_path, monkeypatch):
+    monkeypatch.delattr(os, "mkfifo")
+    with sysin_file(["A"], directory=str(tmp_path)) as pathname:
+        assert stat.S_ISREG(os.stat(pathname).st_mode)
+    assert os.listdir(tmp_path) == []
+
+
+def test_sysin_file_checks_lines_first(tmp_path):
+    with pytest.raises(CardImageError):
+        with sysin_file(["Y" * 73], directory=str(tmp_path)):
+            pass
+    assert os.listdir(tmp_path) == []
@@ -0,0 +1,97 @@
+"""Code rights.
+
+Copyright IBM Corp 2026.
+test_dcat.py - check that dcat.py writes the data sets in the order of
+their names while several are read at the same time, filters and labels
+their lines, reports the ones cat cannot read, and stops the cat
+processes it no longer needs. cat is replaced by a script on PATH.
+
+Run with: python3 -m pytest testing/test_dcat.py
+"""
+import io
+import os
+import sys
+
+import pytest
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, "fakes"))
+sys.path.insert(0, os.path.dirname(HERE))
+
+import dcat  # noqa: E402
+from zoautil_py import datasets  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def fake_cat(tmp_path, monkeypatch):
+    # cat prints two lines naming the data set, after a delay for SLOW
+    # ones, nothing for EMPTY ones, a line without a newline for NOEOL
+    # ones, 100000 lines for BIG ones, and fails for MISSING ones
+    cat = tmp_path / "cat"
+    cat.write_text('#!/bin/sh\n'
+                   'case "$1" in\n'
+                   '  *MISSING*) echo "cat: EDC5129I No such file" >&2; exit 1;;\n'
+                   '  *EMPTY*) exit 0;;\n'
+                   '  *NOEOL*) printf "no newline"; exit 0;;\n'
+                   '  *BIG*) seq 100000; exit 0;;\n'
+                   '  *SLOW*) sleep 0.3;;\n'
+                   'esac\n'
+                   'printf "%s LINE1\\n%s LINE2\\n" "$1" "$1"\n')
+    cat.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{tmp_path}{os.pathsep}{os.environ['PATH']}")
+
+
+def test_order_of_names(monkeypatch):
+    monkeypatch.setitem(datasets.MEMBERS, "USER.JCL", ["SLOW1", "FAST", "SLOW2", "FAST2"])
+    out = io.StringIO()
+    assert dcat.dcat(["USER.JCL(*)"], out, workers=4) == 0
+    assert out.getvalue().split() == [
+        word for member in ("SLOW1", "FAST", "SLOW2", "FAST2")
+        for word in (f"//'USER.JCL({member})'", "LINE1", f"//'USER.JCL({member})'", "LINE2")]
+
+
+def test_header_prefix_and_grep(monkeypatch):
+    monkeypatch.setitem(datasets.MEMBERS, "USER.JCL", ["A", "EMPTY"])
+    out = io.StringIO()
+    dcat.dcat(["USER.JCL(*)"], out, header=True)
+    assert out.getvalue().splitlines() == [
+        "==> USER.JCL(A) <==", "//'USER.JCL(A)' LINE1", "//'USER.JCL(A)' LINE2",
+        "==> USER.JCL(EMPTY) <=="]
+
+    out = io.StringIO()
+    dcat.dcat(["USER.JCL(*)"], out, grep="line2", ignore_case=True, header=True, prefix=True)
+    assert out.getvalue().splitlines() == [
+        "==> USER.JCL(A) <==", "USER.JCL(A)://'USER.JCL(A)' LINE2"]
+
+
+def test_missing_data_set(monkeypatch, capsys):
+    monkeypatch.setitem(datasets.MEMBERS, "USER.JCL", ["MISSING", "A"])
+    out = io.StringIO()
+    assert dcat.dcat(["USER.JCL(*)"], out) == 1
+    assert out.getvalue().splitlines() == ["//'USER.JCL(A)' LINE1", "//'USER.JCL(A)' LINE2"]
+    assert "cat of USER.JCL(MISSING) ended with rc 1: cat: EDC5129I" in capsys.readouterr().err
+
+
+def test_text_is_copied_whole(monkeypatch):
+    monkeypatch.setitem(datasets.MEMBERS, "USER.JCL", ["BIG", "NOEOL", "A"])
+    out = io.StringIO()
+    dcat.dcat(["USER.JCL(*)"], out)
+    lines = out.getvalue().splitlines()
+    assert lines[:100000] == [str(number) for number in range(1, 100001)]
+    assert lines[100000:] == ["no newline", "//'USER.JCL(A)' LINE1", "//'USER.JCL(A)' LINE2"]
+
+
+def test_streams_are_closed_when_stopped():
+    opened = []
+
+    def opener(name):
+        opened.append(dcat.MemberStream(name))
+        return opened[-1]
+
+    streams = dcat.iter_dcat((f"USER.SLOW{number}" for number in range(10)), 3, opener)
+    first = next(streams)
+    assert list(first.lines()) == ["//'USER.SLOW0' LINE1", "//'USER.SLOW0' LINE2"]
+    # only the streams in the window were opened
+    assert len(opened) == 3
+    streams.close()
+    assert all(stream._process.returncode is not None for stream in opened)
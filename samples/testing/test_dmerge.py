@@ -0,0 +1,234 @@
+"""Code rights.
+
+Copyright IBM Corp 2026.
+test_dmerge.py - the scenarios of test_dmerge.sh for dmerge.py. The merge
+itself is checked with local FB and VB files in cp1047, the SORT run
+through the control deck and DDs it gets from the fake zoautil_py in
+testing/fakes. test_dmerge.sh still tests dmerge.sh on z/OS.
+
+Run with: python3 -m pytest testing/test_dmerge.py
+"""
+import os
+import subprocess
+import sys
+
+import pytest
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, "fakes"))
+sys.path.insert(0, os.path.dirname(HERE))
+
+import dmerge  # noqa: E402
+from zoautil_py import datasets, mvscmd  # noqa: E402
+
+INPUT_A = """Chang      Joe       278 232 6043
+DeBeer     Jo        348 132 6023
+Doe        Jack      878 222 5043
+White      Belinda   178 222 5043""".splitlines()
+
+INPUT_B = """Doe        Jane      878 222 5043
+Smith      Joe       778 232 6043
+Smyth      Jo        748 132 6023""".splitlines()
+
+ASC_EXPECTED = """Chang      Joe       278 232 6043
+DeBeer     Jo        348 132 6023
+Doe        Jack      878 222 5043
+Doe        Jane      878 222 5043
+Smith      Joe       778 232 6043
+Smyth      Jo        748 132 6023
+White      Belinda   178 222 5043""".splitlines()
+
+ASC_DSC_EXPECTED = """Chang      Joe       278 232 6043
+DeBeer     Jo        348 132 6023
+Doe        Jane      878 222 5043
+Doe        Jack      878 222 5043
+Smith      Joe       778 232 6043
+Smyth      Jo        748 132 6023
+White      Belinda   178 222 5043""".splitlines()
+
+# test number: record format, -K options, expected output, MERGE FIELDS
+SCENARIOS = {
+    1: ("FB", ["1,9,CH,A"], ASC_EXPECTED, "1,9,CH,A"),
+    3: ("FB", ["1,9,CH,A", "10,8,CH,D"], ASC_DSC_EXPECTED, "1,9,CH,A,\n  10,8,CH,D"),
+    4: ("FB", ["1,9,CH,A", "10"], ASC_EXPECTED, "1,9,CH,A,\n  10,71,CH,A"),
+    5: ("VB", ["1,9,CH,A", "10,23"], ASC_EXPECTED, "5,9,CH,A,\n  14,23,CH,A"),
+}
+
+
+def _encode(lines, recfm, lrecl=80):
+    """Return lines as FB or VB records in cp1047"""
+    records = []
+    for line in lines:
+        record = line.encode("cp1047")
+        if recfm == "FB":
+            records.append(record.ljust(lrecl, b"\x40"))
+        else:
+            records.append((len(record) + 4).to_bytes(2, "big") + b"\0\0" + record)
+    return b"".join(records)
+
+
+def _decode(data, recfm, lrecl=80):
+    """Return the lines in FB or VB records in cp1047"""
+    lines = []
+    position = 0
+    while position < len(data):
+        if recfm == "FB":
+            record, position = data[position:position + lrecl], position + lrecl
+        else:
+            length = int.from_bytes(data[position:position + 2], "big")
+            record, position = data[position + 4:position + length], position + length
+        lines.append(record.decode("cp1047").rstrip())
+    return lines
+
+
+def _write(path, data):
+    with open(path, "wb") as file:
+        file.write(data)
+    return str(path)
+
+
+@pytest.fixture(autouse=True)
+def _reset_fakes():
+    datasets.ATTRIBUTES.clear()
+    mvscmd.SORTS.clear()
+
+
+@pytest.mark.parametrize("scenario", sorted(SCENARIOS))
+def test_merge_files(tmp_path, scenario):
+    recfm, keys, expected, _ = SCENARIOS[scenario]
+    inputs = [_write(tmp_path / "a", _encode(INPUT_A, recfm)),
+              _write(tmp_path / "b", _encode(INPUT_B, recfm))]
+    output = str(tmp_path / "merged")
+    count = dmerge.merge_files(inputs, output, keys, recfm, 80)
+    with open(output, "rb") as merged:
+        assert _decode(merged.read(), recfm) == expected
+    assert count == len(expected)
+
+
+@pytest.mark.parametrize("scenario", sorted(SCENARIOS))
+def test_sort_control(scenario):
+    recfm, keys, _, fields = SCENARIOS[scenario]
+    for name in ("USER.DMERGE.IN.A", "USER.DMERGE.IN.B", "USER.DMERGE.MERGE"):
+        datasets.ATTRIBUTES[name] = {"record_format": recfm, "record_length": 80}
+    result = dmerge.dmerge(["USER.DMERGE.IN.A", "USER.DMERGE.IN.B"], "USER.DMERGE.MERGE", keys)
+    assert result["rc"] == 0
+    control, sortin, sortout = mvscmd.SORTS[-1]
+    assert control == [" OPTION EQUALS"] + f" MERGE FIELDS=({fields})".split("\n")
+    assert sortin == ["USER.DMERGE.IN.A", "USER.DMERGE.IN.B"]
+    assert sortout == "USER.DMERGE.MERGE"
+
+
+def test_sort_members():
+    # test 2: members of PDSs
+    for name in ("USER.DMERGE.IN.A", "USER.DMERGE.IN.B", "USER.DMERGE.MERGE"):
+        datasets.ATTRIBUTES[name] = {"organization": "PO"}
+    dmerge.dmerge(["USER.DMERGE.IN.A(HW)", "USER.DMERGE.IN.B(HW)"],
+                  "USER.DMERGE.MERGE(HW)", ["1,9,CH,A"])
+    _, sortin, sortout = mvscmd.SORTS[-1]
+    assert sortin == ["USER.DMERGE.IN.A(HW)", "USER.DMERGE.IN.B(HW)"]
+    assert sortout == "USER.DMERGE.MERGE(HW)"
+
+
+def test_sort_many_inputs():
+    inputs = [f"USER.EXTRACT.D{number:03d}" for number in range(40)]
+    for name in inputs + ["USER.MERGED"]:
+        datasets.ATTRIBUTES[name] = {}
+    dmerge.dmerge(inputs, "USER.MERGED")
+    control, sortin, _ = mvscmd.SORTS[-1]
+    assert sortin == inputs
+    assert control[-1] == " MERGE FIELDS=(1,80,CH,A)"
+
+
+def test_sort_errors():
+    datasets.ATTRIBUTES["USER.FB80"] = {}
+    datasets.ATTRIBUTES["USER.FB100"] = {"record_length": 100}
+    datasets.ATTRIBUTES["USER.VSAM"] = {"organization": "VS"}
+    with pytest.raises(dmerge.DmergeError, match="same record format"):
+        dmerge.dmerge(["USER.FB80", "USER.FB100"], "USER.FB80")
+    with pytest.raises(dmerge.DmergeError, match="PS"):
+        dmerge.dmerge(["USER.FB80", "USER.VSAM"], "USER.FB80")
+    with pytest.raises(dmerge.DmergeError, match="does not exist"):
+        dmerge.dmerge(["USER.FB80", "USER.NOTHERE"], "USER.FB80")
+    with pytest.raises(dmerge.DmergeError, match="at most"):
+        dmerge.dmerge(["USER.FB80"] * 100, "USER.FB80")
+    assert not mvscmd.SORTS
+
+
+@pytest.mark.parametrize("key", ["1,81", "0,5", "1,9,XX", "1,9,CH,B", "1,2,CH,A,X"])
+def test_bad_keys(key):
+    with pytest.raises(ValueError):
+        dmerge.parse_key(key, 80)
+
+
+def test_variable_key_skips_rdw():
+    assert dmerge.parse_key("1,4", 84, variable=True) == dmerge.MergeKey(5, 4, "CH", "A")
+    assert dmerge.parse_key("3", 84, variable=True) == dmerge.MergeKey(7, 78, "CH", "A")
+    with pytest.raises(ValueError):
+        dmerge.parse_key("1,81", 84, variable=True)
+
+
+def test_variable_key_offset(tmp_path):
+    # the records get shorter as their first data byte grows, so a key on
+    # the RDW would merge them in the opposite order
+    inputs = [_write(tmp_path / "a", _encode(["A" * 20, "C" * 10], "VB")),
+              _write(tmp_path / "b", _encode(["B" * 15, "D" * 5], "VB"))]
+    output = str(tmp_path / "merged")
+    dmerge.merge_files(inputs, output, ["1,1"], "VB", 84)
+    with open(output, "rb") as merged:
+        assert _decode(merged.read(), "VB") == ["A" * 20, "B" * 15, "C" * 10, "D" * 5]
+
+
+def test_many_inputs_stable(tmp_path):
+    # 25 inputs with the same keys: equal records keep the order of the inputs
+    inputs = []
+    for number in range(25):
+        lines = [f"KEY{key:03d} FROM {number:02d}" for key in range(0, 100, 3)]
+        inputs.append(_write(tmp_path / f"in{number}", _encode(lines, "FB")))
+    output = str(tmp_path / "merged")
+    dmerge.merge_files(inputs, output, ["1,6,CH,A"])
+    with open(output, "rb") as merged:
+        lines = _decode(merged.read(), "FB")
+    assert lines == sorted(lines)
+    assert len(lines) == 25 * 34
+
+
+@pytest.mark.parametrize("key_type, encode", [
+    ("ZD", lambda value: f"{abs(value):05d}".encode("cp1047")[:-1]
+        + bytes([(0xD0 if value < 0 else 0xF0) | abs(value) % 10])),
+    ("PD", lambda value: bytes.fromhex(f"{abs(value):05d}" + ("d" if value < 0 else "c"))),
+])
+@pytest.mark.parametrize("direction", ["A", "D"])
+def test_numeric_keys(tmp_path, key_type, encode, direction):
+    values = [-120, -7, 0, 3, 45, 999]
+    length = len(encode(0))
+    first = [value for value in values if value % 2 == 0]
+    second = [value for value in values if value % 2]
+    if direction == "D":
+        first, second = first[::-1], second[::-1]
+    inputs = [
+        _write(tmp_path / name, b"".join(encode(value).ljust(10, b"\x40") for value in part))
+        for name, part in (("even", first), ("odd", second))
+    ]
+    output = str(tmp_path / "merged")
+    dmerge.merge_files(inputs, output, [f"1,{length},{key_type},{direction}"], "FB", 10)
+    with open(output, "rb") as merged:
+        data = merged.read()
+    merged_values = [encode(value).ljust(10, b"\x40") for value in
+                     (sorted(values, reverse=direction == "D"))]
+    assert data == b"".join(merged_values)
+
+
+def test_text_files(tmp_path):
+    inputs = [_write(tmp_path / "a", "\n".join(INPUT_A).encode()),
+              _write(tmp_path / "b", "\n".join(INPUT_B).encode() + b"\n")]
+    output = str(tmp_path / "merged")
+    dmerge.merge_files(inputs, output, ["1,9,CH,A", "10,8,CH,D"], "TEXT")
+    with open(output) as merged:
+        assert merged.read().splitlines() == ASC_DSC_EXPECTED
+
+
+def test_help():
+    env = dict(os.environ, PYTHONPATH=os.path.join(HERE, "fakes"))
+    result = subprocess.run([sys.executable, os.path.join(HERE, "..", "dmerge.py"), "--help"],
+                            stdout=subprocess.DEVNULL, env=env)
+    assert result.returncode == 0
@@ -0,0 +1,131 @@
+"""Code rights.
+
+Copyright IBM Corp 2026.
+test_irrdbu00.py - check the filter language of irrdbu00.py: the SORT
+control statements it compiles to, and the local filter and CSV/Parquet
+output on a small unload. The Parquet test is skipped without pyarrow.
+
+Run with: python3 -m pytest testing/test_irrdbu00.py
+"""
+import csv
+import os
+import sys
+
+import pytest
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, "fakes"))
+sys.path.insert(0, os.path.dirname(HERE))
+
+import irrdbu00  # noqa: E402
+from zoautil_py import mvscmd  # noqa: E402
+
+
+def _record(record_type, **values):
+    """Return an IRRDBU00 record with its RDW, the fields not given blank"""
+    layout = irrdbu00.RECORD_TYPES[record_type]
+    data = bytearray(b"\x40" * (layout.fields[-1].end - 4))
+    data[0:4] = record_type.encode("cp1047")
+    for field in layout.fields[1:]:
+        value = values.get(field.name[len(layout.name) + 1:])
+        if value is not None:
+            data[field.start - 5:field.start - 5 + len(value)] = value.encode("cp1047")
+    return (len(data) + 4).to_bytes(2, "big") + b"\0\0" + bytes(data)
+
+
+RECORDS = [
+    _record("0200", name="SYSADM", create_date="2020-03-01"),
+    _record("0200", name="IBMUSER", create_date="2019-12-31"),
+    _record("0200", name="SYSPROG", create_date="2021-01-01"),
+    _record("0207", name="IBMUSER", cert_name="CN=IBMUSER,O=IBM"),
+    _record("0560", name="RING1", class_name="DIGTRING"),
+    _record("0560", name="CERT1", class_name="DIGTCERT"),
+    _record("0404", name="SYS1.PARMLIB", auth_id="SYSPROG", access="ALTER"),
+    # a short record of a type without a layout
+    b"\x00\x0d\x00\x00" + "0999 DATA".encode("cp1047"),
+]
+
+
+@pytest.fixture
+def unload(tmp_path):
+    path = tmp_path / "unload"
+    path.write_bytes(b"".join(RECORDS))
+    return str(path)
+
+
+def _names(records):
+    return [record[9:17].decode("cp1047").rstrip() for record in records]
+
+
+def test_default_control():
+    # the statements of dump_and_filter_racf.sh
+    assert irrdbu00.sort_control() == [
+        " SORT    FIELDS=COPY",
+        " INCLUDE COND=(5,4,CH,EQ,C'0207',OR,(5,4,CH,EQ,C'0560',AND,",
+        "              257,8,CH,EQ,C'DIGTRING'))",
+        " OPTION  VLSHRT",
+    ]
+
+
+def test_control_operators():
+    control = "".join(line.strip() for line in irrdbu00.sort_control(
+        "usbd_name^=SYS and usbd_create_date=2020-01-01..2020-12-31 or "
+        "dsacc_access!='IT''S'"))
+    assert "10,3,CH,EQ,C'SYS'" in control
+    assert "19,10,CH,GE,C'2020-01-01',AND,19,10,CH,LE,C'2020-12-31'" in control
+    assert "71,8,CH,NE,C'IT''S'" in control
+    assert all(len(line) <= 71 for line in irrdbu00.sort_control(
+        " or ".join(f"gracc_name^=PREFIX{number}" for number in range(30))))
+
+
+@pytest.mark.parametrize("filter_text", [
+    "", "foo=1", "type=0207 and", "(type=0207", "type=0207 xor type=0560",
+    "usbd_name=TOOLONGNAME",
+])
+def test_bad_filters(filter_text):
+    with pytest.raises(irrdbu00.FilterError):
+        irrdbu00.parse_filter(filter_text)
+
+
+@pytest.mark.parametrize("filter_text, names", [
+    (irrdbu00.DEFAULT_FILTER, ["IBMUSER", "RING1"]),
+    ("usbd_name^=SYS", ["SYSADM", "SYSPROG"]),
+    ("usbd_create_date=2020-01-01..2020-12-31", ["SYSADM"]),
+    ("usbd_create_date<2020-01-01 or usbd_create_date>=2021", ["IBMUSER", "SYSPROG"]),
+    ("type=0560 and grcert_class_name!=DIGTRING", ["CERT1"]),
+    ("(type=0200 or type=0207) and usbd_name=IBMUSER", ["IBMUSER"]),
+    ("dsacc_auth_id=SYSPROG and dsacc_access=ALTER", ["SYS1.PAR"]),
+    ("type=0999", ["DATA"]),
+])
+def test_filter_unload(unload, filter_text, names):
+    assert _names(irrdbu00.filter_unload(unload, filter_text)) == names
+
+
+def test_write_csv(unload, tmp_path):
+    counts = irrdbu00.write_csv(irrdbu00.filter_unload(unload, "usbd_name^=SYS or type=0999"),
+                                str(tmp_path))
+    assert counts == {"0200": 2, "0999": 1}
+    with open(tmp_path / "0200_usbd.csv", newline="") as users:
+        rows = list(csv.DictReader(users))
+    assert [(row["usbd_name"], row["usbd_create_date"]) for row in rows] == [
+        ("SYSADM", "2020-03-01"), ("SYSPROG", "2021-01-01")]
+    with open(tmp_path / "0999_other.csv", newline="") as other:
+        assert list(csv.reader(other)) == [["record_type", "data"], ["0999", "DATA"]]
+
+
+def test_write_parquet(unload, tmp_path):
+    parquet = pytest.importorskip("pyarrow.parquet")
+    counts = irrdbu00.write_parquet(irrdbu00.filter_unload(unload), str(tmp_path))
+    assert counts == {"0207": 1, "0560": 1}
+    table = parquet.read_table(str(tmp_path / "0560_grcert.parquet"))
+    assert table.column("grcert_class_name").to_pylist() == ["DIGTRING"]
+
+
+def test_sort_unload():
+    mvscmd.SORTS.clear()
+    result = irrdbu00.sort_unload("SYS1.RACF.UNLOAD", "USER.RACF.CERTS")
+    assert result["rc"] == 0
+    control, sortin, sortout = mvscmd.SORTS[-1]
+    assert control == irrdbu00.sort_control()
+    assert sortin == ["SYS1.RACF.UNLOAD"]
+    assert sortout == "USER.RACF.CERTS"
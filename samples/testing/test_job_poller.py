@@ -0,0 +1,125 @@
+"""Code rights.
+
+Copyright IBM Corp 2026.
+test_job_poller.py - check the backoff of job_poller.py, that it never
+waits past its deadline, that a poll only fetches the jobs being waited
+for and that the status queries are counted per job. The jobs are those
+of the fake zoautil_py.jobs.
+
+Run with: python3 -m pytest testing/test_job_poller.py
+"""
+import os
+import sys
+
+import pytest
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, "fakes"))
+sys.path.insert(0, os.path.dirname(HERE))
+
+import job_poller  # noqa: E402
+from job_poller import JobPoller, backoff_intervals  # noqa: E402
+from zoautil_py import jobs  # noqa: E402
+
+
+@pytest.fixture
+def long_jobs(monkeypatch):
+    """Jobs that stay active until the test ends them"""
+    monkeypatch.setattr(jobs, "LATENCY", (3600, 3600))
+    monkeypatch.setattr(jobs, "_submitted", {})
+    monkeypatch.setattr(jobs, "FETCHED", 0)
+
+
+def _end(job):
+    real = jobs._submitted[job.id]
+    real.status, real.rc = "CC", 0
+
+
+def test_backoff_grows_to_maximum():
+    intervals = backoff_intervals(initial=0.5, maximum=6, factor=2, jitter=0)
+    assert [next(intervals) for _ in range(6)] == [0.5, 1, 2, 4, 6, 6]
+
+
+def test_backoff_jitter_stays_in_bounds():
+    intervals = backoff_intervals(initial=1, maximum=1, jitter=0.1)
+    values = [next(intervals) for _ in range(200)]
+    assert all(0.9 <= value <= 1.1 for value in values)
+    assert len(set(values)) > 1
+
+
+def test_reset_starts_over():
+    poller = JobPoller(initial=1, maximum=8, jitter=0)
+    assert [next(poller._intervals) for _ in range(3)] == [1, 2, 4]
+    poller.reset()
+    assert next(poller._intervals) == 1
+
+
+def test_sleep_never_past_deadline(monkeypatch):
+    slept = []
+    monkeypatch.setattr(job_poller.time, "sleep", slept.append)
+    poller = JobPoller(initial=5, jitter=0, deadline=1)
+    poller.sleep()
+    assert 0 < slept[0] <= 1
+    monkeypatch.setattr(poller, "_started", poller._started - 2)
+    assert poller.expired()
+    poller.sleep()
+    assert slept[1] == 0
+
+
+def test_no_deadline_never_expires():
+    assert not JobPoller().expired()
+
+
+def test_wait_returns_active_jobs_at_deadline(long_jobs):
+    running = [jobs.submit("USER.JCL(RUNA)"), jobs.submit("USER.JCL(RUNB)")]
+    poller = JobPoller(initial=0.01, maximum=0.02, deadline=0.1)
+    assert poller.wait(running) == running
+
+
+def test_wait_until_jobs_end(long_jobs, monkeypatch):
+    running = [jobs.submit("USER.JCL(RUNA)"), jobs.submit("USER.JCL(RUNB)")]
+    reported = []
+    poller = JobPoller(initial=0.01, jitter=0)
+
+    def report(job):
+        reported.append(job.id)
+        if len(reported) == 2:
+            _end(running[0])
+        if len(reported) == 3:
+            _end(running[1])
+
+    assert poller.wait(running, report=report) == []
+    assert [job.status for job in running] == ["CC", "CC"]
+    assert poller.queries == {running[0].id: 1, running[1].id: 2}
+    assert poller.total_queries == 2
+    assert poller.summary() == "2 status queries, 1 to 2 per job (mean 1.5)"
+
+
+def test_poll_fetches_only_the_jobs_waited_for(long_jobs):
+    for name in ("OTHER1", "OTHER2", "BATCH"):
+        jobs.submit(f"USER.JCL({name})")
+    running = [jobs.submit("USER.JCL(RUNA)"), jobs.submit("USER.JCL(RUNB)")]
+    poller = JobPoller()
+    poller.poll(running)
+    assert jobs.FETCHED == 2
+    poller.poll(running[:1])
+    assert jobs.FETCHED == 3
+    assert poller.total_queries == 2
+
+
+def test_poll_refreshes_job_the_query_missed(long_jobs, monkeypatch):
+    running = [jobs.submit("USER.JCL(RUNA)"), jobs.submit("USER.JCL(RUNB)")]
+    _end(running[1])
+    fetch_multiple = jobs.fetch_multiple
+    monkeypatch.setattr(jobs, "fetch_multiple", lambda **kwargs: [
+        job for job in fetch_multiple(**kwargs) if job.id != running[1].id])
+    poller = JobPoller()
+    poller.poll(running)
+    assert running[1].status == "CC"
+    assert poller.total_queries == 2
+
+
+def test_name_pattern():
+    assert job_poller._name_pattern(["RUNA", "RUNA"]) == "RUNA"
+    assert job_poller._name_pattern(["RUNA", "RUNB"]) == "RUN*"
+    assert job_poller._name_pattern(["JOBA", "RUNB"]) == "*"
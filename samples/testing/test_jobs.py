@@ -0,0 +1,170 @@
+"""Code rights.
+
+Copyright IBM Corp 2026.
+test_jobs.py - check that jobs.py streams the output of a command and
+raises when the command fails, with sh standing in for pjdd, and that
+staged JCL members are reused, restaged when they are gone and not lost
+to concurrent runs. The fake datasets keep the members in MEMBERS.
+
+Run with: python3 -m pytest testing/test_jobs.py
+"""
+import json
+import multiprocessing
+import os
+import sys
+
+import pytest
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, "fakes"))
+sys.path.insert(0, os.path.dirname(HERE))
+
+import jobs  # noqa: E402
+from zoautil_py import datasets, exceptions  # noqa: E402
+from zoautil_py import jobs as zoau_jobs  # noqa: E402
+
+LIBRARY = "FAKEUSER.SAMPLE.JCLCACHE"
+
+
+@pytest.fixture
+def library(monkeypatch, tmp_path):
+    """Keep written members in the fake MEMBERS and count the writes"""
+    members = {}
+    writes = []
+
+    def write(dataset, content, append=False):
+        writes.append(dataset)
+        name, _, member = dataset.rstrip(")").partition("(")
+        members.setdefault(name, []).append(member)
+
+    def delete_members(pattern):
+        name, _, member = pattern.rstrip(")").partition("(")
+        members[name].remove(member)
+
+    monkeypatch.setattr(datasets, "MEMBERS", members)
+    monkeypatch.setattr(datasets, "write", write)
+    monkeypatch.setattr(datasets, "delete_members", delete_members)
+    monkeypatch.setattr(jobs, "JCL_CACHE_INDEX", str(tmp_path / "index.json"))
+    return writes
+
+
+def _jcl(number):
+    return f"//JOB{number} JOB\n//STEP EXEC PGM=IEFBR14\n"
+
+
+def test_stream_records():
+    records = list(jobs._stream_command(["sh", "-c", "printf 'ONE\\nTWO\\n'"]))
+    assert records == ["ONE\n", "TWO\n"]
+
+
+def test_stream_chunks():
+    chunks = list(jobs._stream_command(["sh", "-c", "printf 'ONE\\nTWO\\n'"], chunk_size=3))
+    assert "".join(chunks) == "ONE\nTWO\n"
+    assert max(len(chunk) for chunk in chunks) == 3
+
+
+def test_stream_failure_raises_with_stderr():
+    records = []
+    with pytest.raises(OSError, match="rc 8: BGYSC5201E DD not found"):
+        for record in jobs._stream_command(
+                ["sh", "-c", "echo PARTIAL; echo 'BGYSC5201E DD not found' >&2; exit 8"]):
+            records.append(record)
+    assert records == ["PARTIAL\n"]
+
+
+def test_stream_failure_without_output():
+    with pytest.raises(OSError, match="rc 1"):
+        list(jobs._stream_command(["sh", "-c", "exit 1"]))
+
+
+def test_stream_stopped_early_does_not_raise():
+    stream = jobs._stream_command(["sh", "-c", "yes RECORD"])
+    assert next(stream) == "RECORD\n"
+    stream.close()
+
+
+def test_stream_large_stderr_does_not_block():
+    command = ["sh", "-c", "i=0; while [ $i -lt 2000 ]; do echo 'ERROR LINE OF STDERR' >&2; "
+               "i=$((i+1)); done; echo DONE"]
+    assert list(jobs._stream_command(command)) == ["DONE\n"]
+
+
+def test_stage_writes_once(library, tmp_path):
+    index_file = str(tmp_path / "index.json")
+    first = jobs.stage_jcl(_jcl(1), index_file=index_file)
+    assert jobs.stage_jcl(_jcl(1), index_file=index_file) == first
+    assert library == [first]
+    assert first.startswith(LIBRARY + "(J")
+
+
+def test_stage_restages_deleted_member(library, tmp_path):
+    index_file = str(tmp_path / "index.json")
+    staged = jobs.stage_jcl(_jcl(1), index_file=index_file)
+    datasets.MEMBERS[LIBRARY].clear()
+    assert jobs.stage_jcl(_jcl(1), index_file=index_file) == staged
+    assert library == [staged, staged]
+
+
+def test_stage_restages_deleted_library(library, tmp_path, monkeypatch):
+    index_file = str(tmp_path / "index.json")
+    staged = jobs.stage_jcl(_jcl(1), index_file=index_file)
+
+    def no_library(pattern):
+        raise exceptions.ZOAUException(f"{pattern} not found")
+
+    monkeypatch.setattr(datasets, "list_members", no_library)
+    jobs.stage_jcl(_jcl(1), index_file=index_file)
+    assert library == [staged, staged]
+
+
+def test_stage_evicts_least_recently_used(library, tmp_path):
+    index_file = str(tmp_path / "index.json")
+    staged = [jobs.stage_jcl(_jcl(number), max_members=2, index_file=index_file)
+              for number in range(3)]
+    assert len(datasets.MEMBERS[LIBRARY]) == 2
+    assert staged[0].split("(")[1].rstrip(")") not in datasets.MEMBERS[LIBRARY]
+    with open(index_file) as index:
+        assert len(json.load(index)[LIBRARY]) == 2
+
+
+def test_submit_restages_when_submit_fails(library, tmp_path, monkeypatch):
+    submitted = []
+
+    def submit(dataset, **kwargs):
+        submitted.append(dataset)
+        if len(submitted) == 1:
+            raise exceptions.ZOAUException("IEFC452I JOB NOT RUN - MEMBER NOT FOUND")
+        return zoau_jobs.Job("JOB1")
+
+    monkeypatch.setattr(zoau_jobs, "submit", submit)
+    job = jobs.submit_jcl(_jcl(1), index_file=str(tmp_path / "index.json"))
+    assert job.name == "JOB1"
+    assert len(submitted) == 2
+    assert library == submitted
+
+
+def test_submit_failing_twice_raises(library, tmp_path, monkeypatch):
+    def submit(dataset, **kwargs):
+        raise exceptions.ZOAUException("JES is not available")
+
+    monkeypatch.setattr(zoau_jobs, "submit", submit)
+    with pytest.raises(exceptions.ZOAUException):
+        jobs.submit_jcl(_jcl(1), index_file=str(tmp_path / "index.json"))
+
+
+def _stage_many(index_file, first):
+    for number in range(first, first + 10):
+        jobs.stage_jcl(_jcl(number), max_members=1000, index_file=index_file)
+
+
+def test_concurrent_runs_keep_every_member(library, tmp_path):
+    index_file = str(tmp_path / "index.json")
+    context = multiprocessing.get_context("fork")
+    runs = [context.Process(target=_stage_many, args=(index_file, first))
+            for first in range(0, 80, 10)]
+    for run in runs:
+        run.start()
+    for run in runs:
+        run.join()
+    with open(index_file) as index:
+        assert len(json.load(index)[LIBRARY]) == 80
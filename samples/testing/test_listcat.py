@@ -0,0 +1,72 @@
+"""Code rights.
+
+Copyright IBM Corp 2026.
+test_listcat.py - check the entries, attributes and associations that
+catalog-utils/listcat.py reads from a LISTCAT ALL listing as IDCAMS prints
+it, and that words like CATALOG in names and totals are not taken for
+entries.
+
+Run with: python3 -m pytest testing/test_listcat.py
+"""
+import os
+import sys
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(os.path.dirname(HERE), "catalog-utils"))
+
+import listcat  # noqa: E402
+
+LISTING = os.path.join(HERE, "listcat_corpus", "listcat_all.txt")
+
+
+def _entries(attributes=True):
+    with open(LISTING) as listing:
+        return list(listcat.parse(listing, attributes))
+
+
+def test_entries():
+    assert [(entry.entry_type, entry.name, entry.volumes, entry.cluster)
+            for entry in _entries()] == [
+        ("NONVSAM", "IBMUSER.CATALOG.JCL", ("USR001", "USR002"), None),
+        ("CLUSTER", "IBMUSER.KSDS", (), None),
+        ("DATA", "IBMUSER.KSDS.DATA", ("USR003",), "IBMUSER.KSDS"),
+        ("INDEX", "IBMUSER.KSDS.INDEX", ("USR004",), "IBMUSER.KSDS"),
+        ("GDG", "IBMUSER.GDG", (), None),
+        ("ALIAS", "CATALOGS", (), None),
+    ]
+    assert {entry.catalog for entry in _entries()} == {"CATALOG.UCAT1"}
+
+
+def test_without_attributes():
+    entries = _entries(attributes=False)
+    assert [entry._replace(attributes={}, associations=()) for entry in _entries()] == entries
+    assert all(entry.attributes == {} for entry in entries)
+
+
+def test_attributes():
+    nonvsam, cluster, data, _, gdg, alias = _entries()
+    assert nonvsam.attributes["CREATION"] == "2023.123"
+    assert nonvsam.attributes["STORAGECLASS"] == "SCBASE"
+    assert nonvsam.field("volser") == "USR001"
+    assert nonvsam.field("keylen") is None
+    assert cluster.associations == (("DATA", "IBMUSER.KSDS.DATA"),
+                                    ("INDEX", "IBMUSER.KSDS.INDEX"))
+    # continued over a page break
+    assert data.attributes["REC-TOTAL"] == "5"
+    assert data.attributes["REC-DELETED"] == "0"
+    assert data.field("KEYLEN") == "8"
+    assert data.attributes["INDEXED"] is True
+    assert "IDCAMS" not in data.attributes
+    assert gdg.attributes["LIMIT"] == "5"
+    assert gdg.attributes["SCRATCH"] is True
+    assert gdg.associations == (("NONVSAM", "IBMUSER.GDG.G0001V00"),)
+    assert alias.associations == (("USERCAT", "CATALOG.UCAT2"),)
+    # the totals at the end are not attributes of the last entry
+    assert "TOTAL" not in alias.attributes
+
+
+def test_listing_without_catalog():
+    entries = list(listcat.parse(["0USERCATALOG --- CATALOG.UCAT1",
+                                  "   VOLSER------------CAT001"]))
+    assert entries == [listcat.ListcatEntry("USERCATALOG", "CATALOG.UCAT1",
+                                            volumes=("CAT001",), attributes={})]
@@ -0,0 +1,179 @@
+"""Code rights.
+
+Copyright IBM Corp 2026.
+test_member_copy.py - check how member_copy.py reads IEBCOPY SYSPRINT
+listings, and the messages of single and batched copies with the fake
+IEBCOPY in testing/fakes, including runs that never wrote a SYSPRINT.
+
+Run with: python3 -m pytest testing/test_member_copy.py
+"""
+import os
+import subprocess
+import sys
+
+import pytest
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, "fakes"))
+sys.path.insert(0, os.path.dirname(HERE))
+
+import member_copy  # noqa: E402
+from zoautil_py import mvscmd  # noqa: E402
+
+SYSPRINT = """1IEBCOPY MESSAGES AND CONTROL STATEMENTS
+  COPY OUTDD=OUT001,INDD=IN001
+IEB167I FOLLOWING MEMBER(S) COPIED FROM INPUT DATA SET REFERENCED BY IN001
+IEB154I ALPHA    HAS BEEN SUCCESSFULLY COPIED
+IEB177I GAMMA WAS SELECTED BUT NOT FOUND
+  COPY OUTDD=OUT002,INDD=IN002
+IEB124I INCONSISTENT LRECL: INPUT LRECL (80) AND OUTPUT LRECL (133).
+  REFERENCED BY
+  INDD=(
+  COPY OUTDD=OUT003,INDD=IN003
+IEB127I RECORD FORMATS ARE INCOMPATIBLE RECFM=FB AND RECFM=VB
+"""
+
+
+@pytest.fixture
+def sysprint(tmp_path):
+    path = tmp_path / "sysprt"
+    path.write_bytes(SYSPRINT.encode("cp1047"))
+    return str(path)
+
+
+@pytest.fixture(autouse=True)
+def fake_iebcopy(tmp_path, monkeypatch):
+    # member_copy writes its SYSIN and SYSPRINT in the current directory
+    monkeypatch.chdir(tmp_path)
+    for name in ("MISSING", "PDSE", "BAD_RECFM", "UNALLOCATED"):
+        monkeypatch.setattr(mvscmd, name, set())
+
+
+def test_parse_sysprint(sysprint):
+    report = member_copy.parse_sysprint(sysprint)
+    assert report.copied == {"IN001": ["ALPHA"]}
+    assert report.missing_members("IN001") == ["GAMMA"]
+    assert report.missing_members("IN002") == []
+    # the bare REFERENCED BY and INDD=( lines do not change the copy group
+    assert report.dataset_error("IN001") is None
+    assert report.dataset_error("IN002") == ("lrecl", ("80", "133"))
+    assert report.dataset_error("IN003") == ("recfm", ("FB", "VB"))
+    assert report.dataset_error() == ("recfm", ("FB", "VB"))
+    assert report.error_message("A.LIB", "B.LIB", "IN002") == (
+        "Record length incompatible: A.LIB record length is 80 B.LIB record length is 133")
+    assert report.error_message("A.LIB", "B.LIB", "IN001").startswith(
+        "z/OS Unchecked error please check out:")
+
+
+def test_no_sysprint(tmp_path):
+    missing = str(tmp_path / "never-written")
+    result = {"rc": 8, "stderr_response": ""}
+    assert member_copy._sysprint_report(result, missing) is None
+    assert member_copy._handle_return(result, "A.LIB", "B.LIB", None, "ALPHA") == {
+        "rc": 8, "message": "z/OS Error: IEBCOPY ended with rc 8 and wrote no SYSPRINT"}
+
+
+def test_copy():
+    result = member_copy.member_copy("a.lib", "b.lib", "alpha,beta")
+    assert result == {"rc": 0, "message": "Members: alpha,beta have been copied."}
+    assert os.listdir(".") == []
+
+
+def test_copy_missing_member():
+    mvscmd.MISSING.add("BETA")
+    result = member_copy.member_copy("A.LIB", "B.LIB", "ALPHA,BETA")
+    assert result == {"rc": 4, "message": "Member: BETA is not in dataset A.LIB."}
+
+
+@pytest.mark.parametrize("unallocated, message", [
+    ("A.LIB", "Dataset: A.LIB does not exist."),
+    ("B.LIB", "Dataset: B.LIB does not exist."),
+])
+def test_copy_unallocated(unallocated, message):
+    mvscmd.UNALLOCATED.add(unallocated)
+    assert member_copy.member_copy("A.LIB", "B.LIB", "ALPHA") == {"rc": 8, "message": message}
+    # there was no SYSPRINT to keep, the SYSIN is removed
+    assert os.listdir(".") == []
+
+
+def test_copy_many_unallocated():
+    mvscmd.UNALLOCATED.add("C.LIB")
+    results = member_copy.member_copy_many([("A.LIB", "B.LIB", "ALPHA"),
+                                            ("C.LIB", "D.LIB", "BETA")])
+    assert results == {
+        ("A.LIB", "B.LIB", "ALPHA"): {
+            "rc": 8, "message": "Member: ALPHA was not copied because dataset: C.LIB does not exist."},
+        ("C.LIB", "D.LIB", "BETA"): {"rc": 8, "message": "Dataset: C.LIB does not exist."},
+    }
+
+
+def test_copy_many_unallocated_target():
+    mvscmd.UNALLOCATED.add("B.LIB")
+    results = member_copy.member_copy_many([("A.LIB", "B.LIB", "ALPHA"),
+                                            ("C.LIB", "D.LIB", "BETA")])
+    assert results[("A.LIB", "B.LIB", "ALPHA")]["message"] == "Dataset: B.LIB does not exist."
+    assert results[("C.LIB", "D.LIB", "BETA")]["message"].endswith("B.LIB does not exist.")
+
+
+def test_copy_many_bad_group():
+    # the groups that IEBCOPY could copy are reported as copied
+    mvscmd.BAD_RECFM.add("C.LIB")
+    mvscmd.MISSING.add("GAMMA")
+    results = member_copy.member_copy_many([("A.LIB", "B.LIB", "ALPHA,GAMMA"),
+                                            ("C.LIB", "D.LIB", "BETA"),
+                                            ("E.LIB", "F.LIB", "DELTA")])
+    assert results == {
+        ("A.LIB", "B.LIB", "ALPHA"): {"rc": 0, "message": "Member: ALPHA has been copied."},
+        ("A.LIB", "B.LIB", "GAMMA"): {"rc": 4, "message": "Member: GAMMA is not in dataset A.LIB."},
+        ("C.LIB", "D.LIB", "BETA"): {
+            "rc": 8,
+            "message": "Record Formats incompatible: C.LIB record format is FB D.LIB record format is VB"},
+        ("E.LIB", "F.LIB", "DELTA"): {"rc": 0, "message": "Member: DELTA has been copied."},
+    }
+
+
+def test_copy_many_missing_in_other_group():
+    # with rc 4 a member that is not reported missing has been copied, also
+    # when it is not reported with IEB154I
+    mvscmd.MISSING.add("GAMMA")
+    mvscmd.PDSE.add("C.LIB")
+    results = member_copy.member_copy_many([("A.LIB", "B.LIB", "ALPHA,GAMMA"),
+                                            ("C.LIB", "D.LIB", "BETA")])
+    assert results == {
+        ("A.LIB", "B.LIB", "ALPHA"): {"rc": 0, "message": "Member: ALPHA has been copied."},
+        ("A.LIB", "B.LIB", "GAMMA"): {"rc": 4, "message": "Member: GAMMA is not in dataset A.LIB."},
+        ("C.LIB", "D.LIB", "BETA"): {"rc": 0, "message": "Member: BETA has been copied."},
+    }
+
+
+def test_copy_many_error_in_other_group():
+    # a pair without an error of its own is not given the error of another
+    mvscmd.BAD_RECFM.add("C.LIB")
+    mvscmd.PDSE.add("A.LIB")
+    results = member_copy.member_copy_many([("A.LIB", "B.LIB", "ALPHA"),
+                                            ("C.LIB", "D.LIB", "BETA")])
+    assert results[("A.LIB", "B.LIB", "ALPHA")] == {
+        "rc": 8, "message": "Member: ALPHA was not copied because IEBCOPY ended with rc 8 "
+        "in another COPY group"}
+    assert results[("C.LIB", "D.LIB", "BETA")]["message"].startswith(
+        "Record Formats incompatible: C.LIB")
+
+
+@pytest.mark.parametrize("workers", [0, -1])
+def test_copy_parallel_needs_a_worker(workers):
+    with pytest.raises(ValueError, match="workers must be at least 1"):
+        member_copy.member_copy_parallel([("A.LIB", "B.LIB", "ALPHA")], workers)
+
+
+@pytest.mark.parametrize("workers", ["0", "-2", "many"])
+def test_workers_option_needs_a_worker(tmp_path, workers):
+    manifest = tmp_path / "manifest"
+    manifest.write_text("A.LIB B.LIB ALPHA\n")
+    env = dict(os.environ, PYTHONPATH=os.path.join(HERE, "fakes"))
+    result = subprocess.run(
+        [sys.executable, os.path.join(HERE, "..", "member_copy.py"), "--manifest",
+         str(manifest), "--workers", workers],
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, env=env)
+    assert result.returncode == 1
+    assert "--workers must be followed by a number" in result.stdout
+    assert result.stderr == ""
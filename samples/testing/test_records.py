@@ -0,0 +1,134 @@
+"""Code rights.
+
+Copyright IBM Corp 2026.
+test_records.py - check the FB, VB and BDW readers and the field decoders
+of records.py. The NumPy tests are skipped if NumPy is not installed.
+
+Run with: python3 -m pytest testing/test_records.py
+"""
+import os
+import sys
+
+import pytest
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, "fakes"))
+sys.path.insert(0, os.path.dirname(HERE))
+
+import zoautil_py  # noqa: E402,F401
+import records  # noqa: E402
+
+VALUES = [-120, 5, 0, 99999, -3]
+
+LAYOUT = records.RecordLayout([
+    records.parse_field("1,8", "name"),
+    records.parse_field("9,5,ZD", "zoned"),
+    records.parse_field("14,3,PD", "packed"),
+    records.parse_field("17,4,BI", "binary"),
+    records.parse_field("79,4", "past"),
+])
+
+
+def _zoned(value, digits=5):
+    zones = f"{abs(value):0{digits}d}".encode("cp1047")
+    return zones[:-1] + bytes([(0xD0 if value < 0 else 0xF0) | abs(value) % 10])
+
+
+def _packed(value, digits=5):
+    return bytes.fromhex(f"{abs(value):0{digits}d}" + ("d" if value < 0 else "c"))
+
+
+def _rdw(record):
+    return (len(record) + 4).to_bytes(2, "big") + b"\0\0" + record
+
+
+@pytest.fixture
+def fb_file(tmp_path):
+    path = tmp_path / "fb"
+    path.write_bytes(b"".join(
+        f"NAME{number:04d}".encode("cp1047") + _zoned(value) + _packed(value)
+        + (number * 1000).to_bytes(4, "big") + b"\x40" * 60
+        for number, value in enumerate(VALUES)
+    ))
+    return str(path)
+
+
+@pytest.fixture
+def vb_file(tmp_path):
+    path = tmp_path / "vb"
+    path.write_bytes(b"".join(_rdw(record.encode("cp1047")) for record in
+                              ("0200USER1", "0207CERTIFICATE", "0560X")))
+    return str(path)
+
+
+def test_fb_records(fb_file):
+    with records.RecordFile(fb_file) as unload:
+        assert len(unload) == len(VALUES)
+        rows = [(record["name"], record["zoned"], record["packed"], record["binary"],
+                 record["past"]) for record in unload.records(LAYOUT)]
+    assert rows == [(f"NAME{number:04d}", value, value, number * 1000, None)
+                    for number, value in enumerate(VALUES)]
+
+
+def test_records_are_views(fb_file):
+    with records.RecordFile(fb_file) as unload:
+        first = next(iter(unload))
+        assert isinstance(first, memoryview)
+        assert first.obj is unload.view.obj
+        assert bytes(next(unload.record_bytes())) == bytes(first)
+
+
+def test_vb_records(vb_file):
+    record_type = records.parse_field("5,4", "type")
+    with records.RecordFile(vb_file, "VB") as unload:
+        assert unload.column(record_type) == ["0200", "0207", "0560"]
+        assert unload.column(records.parse_field("9,5")) == ["USER1", "CERTI", None]
+
+
+def test_bdw_blocks(tmp_path, vb_file):
+    with open(vb_file, "rb") as file:
+        block = file.read()
+    path = tmp_path / "bdw"
+    path.write_bytes(_rdw(block) + (len(block) + 4 | 0x80000000).to_bytes(4, "big") + block)
+    with records.RecordFile(str(path), "VB", bdw=True) as unload:
+        assert unload.column(records.parse_field("5,4")) == ["0200", "0207", "0560"] * 2
+
+
+def test_empty_file(tmp_path):
+    path = tmp_path / "empty"
+    path.write_bytes(b"")
+    with records.RecordFile(str(path), "VB") as unload:
+        assert list(unload) == []
+        assert len(unload) == 0
+
+
+@pytest.mark.parametrize("text", ["1", "1,2,3,4", "0,4", "1,4,XX"])
+def test_bad_fields(text):
+    with pytest.raises(ValueError):
+        records.parse_field(text)
+
+
+def test_arrays(fb_file):
+    numpy = pytest.importorskip("numpy")
+    with records.RecordFile(fb_file) as unload:
+        names = unload.array(LAYOUT.fields["name"])
+        assert [name.decode("cp1047") for name in names] == unload.column(LAYOUT.fields["name"])
+        assert numpy.shares_memory(names, numpy.frombuffer(unload._map, dtype=numpy.uint8))
+        for name in ("zoned", "packed", "binary"):
+            field = LAYOUT.fields[name]
+            assert unload.array(field).tolist() == unload.column(field)
+        selected = unload.array(LAYOUT.fields["zoned"], rows=numpy.array(VALUES) < 0)
+        assert selected.tolist() == [-120, -3]
+        with pytest.raises(ValueError):
+            unload.array(LAYOUT.fields["past"])
+
+
+def test_vb_arrays(vb_file):
+    pytest.importorskip("numpy")
+    with records.RecordFile(vb_file, "VB") as unload:
+        types = unload.array(records.parse_field("5,4"))
+        assert types.tolist() == [value.encode("cp1047") for value in ("0200", "0207", "0560")]
+        with pytest.raises(ValueError):
+            unload.array(records.parse_field("9,5"))
+        users = unload.array(records.parse_field("9,5"), rows=types != "0560".encode("cp1047"))
+        assert [user.decode("cp1047") for user in users] == ["USER1", "CERTI"]
@@ -0,0 +1,77 @@
+"""Code rights.
+
+Copyright IBM Corp 2026.
+test_runjcl.py - check that runjcl.runjobs runs every job with at most
+max_active in flight, keeps the results in order and stops at the
+deadline of its poller. The jobs are those of the fake zoautil_py.jobs,
+which end after a time taken from LATENCY.
+
+Run with: python3 -m pytest testing/test_runjcl.py
+"""
+import os
+import sys
+
+import pytest
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, "fakes"))
+sys.path.insert(0, os.path.dirname(HERE))
+
+import runjcl  # noqa: E402
+from job_poller import JobPoller  # noqa: E402
+from zoautil_py import datasets, jobs  # noqa: E402
+
+
+@pytest.fixture
+def submitted(monkeypatch):
+    """Record the jobs submitted and the most that were running at once"""
+    monkeypatch.setattr(jobs, "LATENCY", (0.02, 0.1))
+    record = {"jobs": [], "most_active": 0}
+    submit = jobs.submit
+
+    def counting_submit(dataset, **kwargs):
+        job = submit(dataset, **kwargs)
+        record["jobs"].append(job)
+        active = [job for job in jobs.fetch_multiple() if job.status == "AC"]
+        record["most_active"] = max(record["most_active"], len(active))
+        return job
+
+    monkeypatch.setattr(jobs, "submit", counting_submit)
+    return record
+
+
+def _datasets(count):
+    return [f"FAKEUSER.JCL(JOB{number:05d})" for number in range(count)]
+
+
+def _poller(deadline=None):
+    return JobPoller(initial=0.01, maximum=0.05, deadline=deadline)
+
+
+def test_runs_every_job_in_order(submitted):
+    results = runjcl.runjobs(_datasets(6), max_active=3, poller=_poller())
+    assert [result["NAME"] for result in results] == [f"JOB{number:05d}" for number in range(6)]
+    assert all(result["STATUS"] == "CC" and result["RC"] == 0 for result in results)
+    assert len(submitted["jobs"]) == 6
+    assert submitted["most_active"] <= 3
+
+
+def test_missing_dataset(submitted, monkeypatch):
+    monkeypatch.setattr(datasets, "exists", lambda name: not name.endswith("(JOB00001)"))
+    results = runjcl.runjobs(_datasets(3), poller=_poller())
+    assert results[1] == -1
+    assert results[0]["STATUS"] == results[2]["STATUS"] == "CC"
+
+
+@pytest.mark.parametrize("max_active", [0, -1])
+def test_rejects_max_active_below_one(max_active):
+    with pytest.raises(ValueError, match="at least 1"):
+        runjcl.runjobs(_datasets(2), max_active=max_active)
+
+
+def test_stops_at_deadline(submitted, monkeypatch):
+    monkeypatch.setattr(jobs, "LATENCY", (3600, 3600))
+    results = runjcl.runjobs(_datasets(5), max_active=2, poller=_poller(deadline=0.2))
+    assert len(submitted["jobs"]) == 2
+    assert [result["STATUS"] for result in results[:2]] == ["AC", "AC"]
+    assert results[2:] == [-1, -1, -1]
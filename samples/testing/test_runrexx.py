@@ -0,0 +1,142 @@
+"""Code rights.
+
+Copyright IBM Corp 2026.
+test_runrexx.py - check that a runrexx.RexxSession gives every exec only
+its own input, whatever the exec reads, and that split_systsprt splits
+the session output into the output and rc of each call. IKJEFT01 is
+imitated by fake_tso.py.
+
+Run with: python3 -m pytest testing/test_runrexx.py
+"""
+import os
+import sys
+
+import pytest
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, HERE)
+sys.path.insert(0, os.path.join(HERE, "fakes"))
+sys.path.insert(0, os.path.dirname(HERE))
+
+import runrexx  # noqa: E402
+from create_sysin import CardImageError  # noqa: E402
+from fake_tso import fake_ikjeft01  # noqa: E402
+from zoautil_py import datasets  # noqa: E402
+
+
+@pytest.fixture
+def session(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(datasets, "CREATES", [])
+    monkeypatch.setattr(datasets, "DELETES", [])
+    return runrexx.RexxSession(False, "USER.REXX", driver=fake_ikjeft01)
+
+
+def _output(result):
+    with open(result["systsprtfile"], "r", encoding="cp1047") as output:
+        return output.read().splitlines()
+
+
+def test_split_systsprt():
+    lines = ["READY\n", " %RXSESSN\n", "RXSESSN CALL 1\n", "one\n", "RXSESSN END 1 0\n",
+             "RXSESSN CALL 2\n", "RXSESSN CALL 1 said by the exec\n", "RXSESSN END 2 8\n",
+             "READY\n", "END\n"]
+    assert runrexx.split_systsprt(lines, 2) == [
+        (["one\n"], 0), (["RXSESSN CALL 1 said by the exec\n"], 8)]
+
+
+def test_split_systsprt_call_that_did_not_end():
+    lines = ["RXSESSN CALL 1\n", "one\n", "RXSESSN END 1 0\n", "RXSESSN CALL 2\n",
+             "IKJ56641I RXSESSN ENDED DUE TO ERROR\n", "READY\n", "END\n"]
+    segments = runrexx.split_systsprt(lines, 3)
+    assert segments[0] == (["one\n"], 0)
+    assert segments[1][1] is None
+    assert segments[1][0][0].startswith("IKJ56641I")
+    assert segments[2] == ([], None)
+
+
+def test_session_gives_each_exec_its_input(session):
+    first = session.call("HELOWRLD one", ["Line 1", "Line 2"])
+    second = session.call("HELOWRLD two")
+    results = session.flush()
+    assert _output(results[first]) == ["Argument passed in is:  one",
+                                       "Now printing data passed in via STDIN:",
+                                       "Line 1", "Line 2"]
+    assert _output(results[second])[-1] == "Now printing data passed in via STDIN:"
+    assert [result["exec_rc"] for result in results] == [0, 0]
+
+
+def test_unread_input_is_not_run(session):
+    session.call("READ 1", ["FIRST", "DELETE SOMETHING"])
+    session.call("HELOWRLD next", ["Line 1"])
+    results = session.flush()
+    assert _output(results[0]) == ["FIRST"]
+    assert _output(results[1])[0] == "Argument passed in is:  next"
+
+
+def test_exec_reading_too_far_gets_no_other_command(session):
+    session.call("READ 4", ["ONLY"])
+    session.call("HELOWRLD next", ["Line 1"])
+    results = session.flush()
+    assert _output(results[0]) == ["ONLY", "", "", ""]
+    assert _output(results[1])[-1] == "Line 1"
+
+
+def test_empty_input_line(session):
+    session.call("READ 3", ["A", "", "B"])
+    session.call("HELOWRLD next")
+    results = session.flush()
+    assert _output(results[0]) == ["A", "", "B"]
+    assert _output(results[1])[0] == "Argument passed in is:  next"
+
+
+def test_exec_rc(session):
+    session.call("FAIL")
+    session.call("HELOWRLD")
+    assert [result["exec_rc"] for result in session.flush()] == [12, 0]
+
+
+@pytest.mark.parametrize("program, inputdata", [
+    ("HELOWRLD", ["one\ntwo"]),
+    ("HELOWRLD", ["one\r"]),
+    ("HELOWRLD\nDELETE X", []),
+    ("  ", []),
+])
+def test_rejects_input_that_cannot_be_isolated(session, program, inputdata):
+    with pytest.raises(ValueError):
+        session.call(program, inputdata)
+
+
+def test_session_library_is_deleted(session):
+    with session:
+        session.call("HELOWRLD")
+    assert len(datasets.CREATES) == 1
+    assert datasets.DELETES == datasets.CREATES
+    # the session SYSTSPRT is gone, the output of the call and SYSPRINT stay
+    assert sorted(name.split(".")[0] for name in os.listdir()) == ["sysprt", "systsprt"]
+    assert os.path.exists(session.results[0]["systsprtfile"])
+
+
+@pytest.mark.parametrize("record_format, record_length", [("VB", 255), ("FB", 80)])
+def test_session_library_matches_library(session, monkeypatch, record_format, record_length):
+    monkeypatch.setitem(datasets.ATTRIBUTES, "USER.REXX",
+                        {"organization": "PO", "record_format": record_format,
+                         "record_length": record_length})
+    with session:
+        session.call("HELOWRLD")
+    options = datasets.CREATE_OPTIONS[datasets.CREATES[0]]
+    assert (options["record_format"], options["record_length"]) == (record_format,
+                                                                    record_length)
+
+
+@pytest.mark.parametrize("program, inputdata", [
+    ("HELOWRLD " + "X" * 62, []),
+    ("HELOWRLD", ["Y" * 73]),
+])
+def test_rejects_cards_that_do_not_fit(session, program, inputdata):
+    # "0 HELOWRLD " and 61 more characters fill the 72 columns
+    session.call("HELOWRLD " + "X" * 61)
+    with pytest.raises(CardImageError):
+        session.call(program, inputdata)
+    # the call queued before is still run
+    assert [result["exec_rc"] for result in session.flush()] == [0]
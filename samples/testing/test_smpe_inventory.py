@@ -0,0 +1,99 @@
+"""Code rights.
+
+Copyright IBM Corp 2026.
+test_smpe_inventory.py - check the snapshots and diffs of smpe_inventory.py,
+and that a refresh whose GIMSMP run or listing failed leaves the inventory
+and its change token alone. GIMSMP is replaced by a function that returns
+a prepared SmpeIndex.
+
+Run with: python3 -m pytest testing/test_smpe_inventory.py
+"""
+import os
+import sys
+
+import pytest
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, "fakes"))
+sys.path.insert(0, os.path.dirname(HERE))
+
+import smpe_inventory  # noqa: E402
+import smpe_list  # noqa: E402
+from zoautil_py import mvscmd  # noqa: E402
+
+CSI = "SMPE.GLOBAL.CSI"
+
+
+def _sysmod(zone, name, status="REC APP"):
+    return smpe_list.SmpeEntry(zone, "SYSMOD", name, {"TYPE": "PTF", "STATUS": status})
+
+
+@pytest.fixture
+def inventory(tmp_path):
+    with smpe_inventory.SmpeInventory(str(tmp_path / "inventory.db")) as inventory:
+        yield inventory
+
+
+@pytest.fixture
+def gimsmp(monkeypatch):
+    """Make smpe_list_zones return run["rc"] and the entries in run["entries"]"""
+    run = {"rc": 0, "entries": [], "error": None}
+
+    def smpe_list_zones(zones, list_options=None, high_level_qualifier="SYS1",
+                        pool=None, keep_output=False, csi=None):
+        if run["error"] is not None:
+            raise run["error"]
+        index = smpe_list.SmpeIndex()
+        for entry in run["entries"]:
+            index.add(entry)
+        return mvscmd._Result(run["rc"]), index
+
+    monkeypatch.setattr(smpe_list, "smpe_list_zones", smpe_list_zones)
+    monkeypatch.setattr(smpe_inventory, "csi_change_token", lambda csi: run.get("token"))
+    return run
+
+
+def test_record_and_diff(inventory):
+    inventory.record(CSI, "MVST", [_sysmod("MVST", "UJ00001"), _sysmod("MVST", "UJ00002", "REC")])
+    snapshot = inventory.record(CSI, "MVST", [_sysmod("MVST", "UJ00002"),
+                                              _sysmod("MVST", "UJ00003")])
+    diff = inventory.diff(CSI, "MVST")
+    assert diff == inventory.diff(CSI, "MVST", snapshot)
+    assert diff["added"] == [smpe_inventory.Change("UJ00003", "added", None, "REC APP")]
+    assert diff["removed"] == [smpe_inventory.Change("UJ00001", "removed", "REC APP", None)]
+    assert diff["changed"] == [smpe_inventory.Change("UJ00002", "changed", "REC", "REC APP")]
+    assert inventory.find("UJ00002", status="APP") == [(CSI, "MVST", "REC APP")]
+
+
+def test_refresh(inventory, gimsmp):
+    gimsmp.update(token="REC-TOTAL=1", entries=[_sysmod("MVST", "UJ00001")])
+    snapshots, result = smpe_inventory.refresh(inventory, CSI, ["MVST"])
+    assert list(snapshots) == ["MVST"]
+    assert inventory.last_snapshot(CSI, "MVST") == (snapshots["MVST"], "REC-TOTAL=1")
+    # the CSI has not changed, so an incremental refresh lists nothing
+    assert smpe_inventory.refresh(inventory, CSI, ["MVST"], incremental=True) == ({}, None)
+
+
+@pytest.mark.parametrize("failure", ["rc", "missing zone", "unreadable listing"])
+def test_failed_refresh_keeps_inventory(inventory, gimsmp, failure):
+    gimsmp.update(token="REC-TOTAL=1", entries=[_sysmod("MVST", "UJ00001")])
+    first, _ = smpe_inventory.refresh(inventory, CSI, ["MVST"])
+
+    gimsmp.update(token="REC-TOTAL=2", entries=[])
+    if failure == "rc":
+        gimsmp["rc"] = 12
+        assert smpe_inventory.refresh(inventory, CSI, ["MVST"])[0] == {}
+    elif failure == "missing zone":
+        gimsmp["entries"] = [_sysmod("MVSD", "UJ00001")]
+        assert smpe_inventory.refresh(inventory, CSI, ["MVST", "MVSD"])[0]["MVST"] is None
+    else:
+        gimsmp["error"] = OSError("cat failed")
+        with pytest.raises(OSError):
+            smpe_inventory.refresh(inventory, CSI, ["MVST"])
+
+    assert (CSI, "MVST", "REC APP") in inventory.find("UJ00001", status="APP")
+    assert inventory.last_snapshot(CSI, "MVST") == (first["MVST"], "REC-TOTAL=1")
+    assert inventory.diff(CSI, "MVST")["removed"] == []
+    # the zone is still listed again by the next incremental refresh
+    gimsmp.update(rc=0, error=None, entries=[_sysmod("MVST", "UJ00001")])
+    assert "MVST" in smpe_inventory.refresh(inventory, CSI, ["MVST"], incremental=True)[0]
@@ -0,0 +1,116 @@
+"""Code rights.
+
+Copyright IBM Corp 2026.
+test_smpe_list.py - check the command line of smpe_list.py, the SMPLIST
+parser on entries that are continued over a page break, and that
+read_listing reports a data set it cannot read.
+
+Run with: python3 -m pytest testing/test_smpe_list.py
+"""
+import os
+import sys
+
+import pytest
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, "fakes"))
+sys.path.insert(0, os.path.dirname(HERE))
+
+import smpe_list  # noqa: E402
+
+PAGE_HEADER = ("1 PAGE {page:04d}  - NOW SET TO TARGET ZONE   MVST      "
+               "DATE 10/17/26  TIME 08:14:03  SMP/E 37.12   SMPLIST OUTPUT\n")
+
+# UJ00001 is continued on page 2, after the repeated headers
+LISTING = [
+    PAGE_HEADER.format(page=1),
+    "0MVST      SYSMOD ENTRIES\n",
+    "0 NAME\n",
+    "0 UJ00001   TYPE           = PTF\n",
+    "             STATUS         = REC APP\n",
+    PAGE_HEADER.format(page=2),
+    "0MVST      SYSMOD ENTRIES\n",
+    "0 NAME\n",
+    "             FMID           = HBB77C0\n",
+    "             MOD            = IEAMOD1  IEAMOD2\n",
+    "                              IEAMOD3\n",
+    "0 UJ00002   TYPE           = PTF\n",
+    "             STATUS         = REC\n",
+    "1 PAGE 0003  - NOW SET TO TARGET ZONE   MVSD      "
+    "DATE 10/17/26  TIME 08:14:03  SMP/E 37.12   SMPLIST OUTPUT\n",
+    "0MVSD      SYSMOD ENTRIES\n",
+    "0 UJ00001   TYPE           = PTF\n",
+    "             STATUS         = REC\n",
+]
+
+
+@pytest.mark.parametrize("argv, zones", [
+    (["-z", "MVST", "MYHLQ"], ["MVST"]),
+    (["MYHLQ", "-z", "MVST,MVSD"], ["MVST", "MVSD"]),
+    (["-z", "MVST", "-z", "MVSD", "MYHLQ"], ["MVST", "MVSD"]),
+    (["MYHLQ"], ["GLOBAL"]),
+])
+def test_parse_args(argv, zones):
+    args = smpe_list.parse_args(argv)
+    assert args.hlq == "MYHLQ"
+    assert args.zone == zones
+
+
+def test_entry_over_page_break():
+    entries = list(smpe_list.parse_smplist(LISTING))
+    assert [(entry.zone, entry.name) for entry in entries] == [
+        ("MVST", "UJ00001"), ("MVST", "UJ00002"), ("MVSD", "UJ00001")]
+    assert entries[0].attributes == {
+        "TYPE": "PTF", "STATUS": "REC APP", "FMID": "HBB77C0",
+        "MOD": "IEAMOD1  IEAMOD2 IEAMOD3"}
+    index = smpe_list.SmpeIndex()
+    for entry in entries:
+        index.add(entry)
+    assert index.zones_with("UJ00001", status="APP") == ["MVST"]
+
+
+@pytest.fixture
+def fake_cat(tmp_path, monkeypatch):
+    # cat prints two lines, or fails for a data set whose name has MISSING in it
+    cat = tmp_path / "cat"
+    cat.write_text('#!/bin/sh\n'
+                   'case "$1" in *MISSING*) echo "cat: EDC5129I No such file" >&2; exit 1;; esac\n'
+                   'printf "0 LINE1\\n0 LINE2\\n"\n')
+    cat.chmod(0o755)
+    monkeypatch.setenv("PATH", f"{tmp_path}{os.pathsep}{os.environ['PATH']}")
+
+
+def test_read_listing(fake_cat):
+    assert list(smpe_list.read_listing("USER.SMPLIST")) == ["0 LINE1\n", "0 LINE2\n"]
+
+
+def test_read_listing_fails(fake_cat):
+    with pytest.raises(OSError, match="EDC5129I"):
+        list(smpe_list.read_listing("USER.MISSING"))
+
+
+class _Result:
+    def to_dict(self):
+        return {"rc": 0, "stderr_response": ""}
+
+
+@pytest.mark.parametrize("argv, keep_output", [
+    (["-z", "MVST,MVSD", "MYHLQ"], True),
+    (["-z", "MVST,MVSD", "-f", "UJ00001", "MYHLQ"], False),
+    (["-f", "UJ00001", "MYHLQ"], False),
+])
+def test_main_keeps_listing_without_find(monkeypatch, capsys, argv, keep_output):
+    def fake_list_zones(zones, list_options=None, high_level_qualifier="SYS1",
+                        pool=None, keep_output=False, csi=None):
+        calls.append(keep_output)
+        index = smpe_list.SmpeIndex()
+        for entry in smpe_list.parse_smplist(LISTING):
+            index.add(entry)
+        return _Result(), index
+
+    calls = []
+    monkeypatch.setattr(smpe_list, "smpe_list_zones", fake_list_zones)
+    monkeypatch.setattr(sys, "argv", ["smpe_list.py"] + argv)
+    smpe_list.main()
+    assert calls == [keep_output]
+    assert "MVST: 2 entries" in capsys.readouterr().out
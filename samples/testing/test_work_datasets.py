@@ -0,0 +1,133 @@
+"""Code rights.
+
+Copyright IBM Corp 2026.
+test_work_datasets.py - check that WorkDatasetPool allocates PDSEs, reuses
+released data sets after emptying them, adopts the data sets of a process
+that died and deletes its own when it is closed. The data sets are those of
+the fake zoautil_py.datasets, which only records what is done to them.
+
+Run with: python3 -m pytest testing/test_work_datasets.py
+"""
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, "fakes"))
+sys.path.insert(0, os.path.dirname(HERE))
+
+from work_datasets import WorkDatasetPool  # noqa: E402
+from zoautil_py import datasets  # noqa: E402
+
+
+@pytest.fixture
+def created(monkeypatch):
+    """Record the type of every data set the fake datasets.create makes"""
+    types = {}
+    monkeypatch.setattr(datasets, "create",
+                        lambda name, type=None, **kwargs: types.__setitem__(name, type))
+    monkeypatch.setattr(datasets, "DELETES", [])
+    return types
+
+
+@pytest.fixture
+def lease_file(tmp_path):
+    return str(tmp_path / "work_pool.json")
+
+
+@pytest.fixture
+def pool(created, lease_file):
+    pool = WorkDatasetPool({"primary_space": "5M"}, lease_file)
+    yield pool
+    pool.close()
+
+
+def _dead_pid():
+    child = subprocess.Popen(["true"])
+    child.wait()
+    return child.pid
+
+
+def test_allocates_pdse(pool, created):
+    name = pool.acquire("SYS1", "USRAT5")
+    assert created == {name: "PDSE"}
+    assert pool.allocated == 1
+
+
+def test_rejects_pds(created, lease_file):
+    with pytest.raises(ValueError, match="PDS"):
+        WorkDatasetPool({"type": "PDS"}, lease_file)
+
+
+def test_reuses_released_data_set(pool, created):
+    with pool.lease("SYS1", "USRAT5") as first:
+        pass
+    with pool.lease("SYS1", "USRAT5") as second:
+        pass
+    assert second == first
+    assert (pool.allocated, pool.reused) == (1, 1)
+    assert datasets.DELETES == [f"{first}(*)"]
+
+
+def test_leased_data_set_is_not_handed_out_twice(pool, created):
+    first = pool.acquire("SYS1", "USRAT5")
+    second = pool.acquire("SYS1", "USRAT5")
+    assert second != first
+    pool.release(first)
+    assert pool.acquire("SYS1", "USRAT5") == first
+    assert pool.allocated == 2
+
+
+def test_pools_per_hlq_and_volume(pool, created):
+    with pool.lease("SYS1", "USRAT5") as first:
+        pass
+    assert pool.acquire("SYS1", "USRAT6") != first
+    assert pool.acquire("SYS2", "USRAT5") != first
+    assert pool.reused == 0
+
+
+def test_forgets_data_set_deleted_elsewhere(pool, created, lease_file, monkeypatch):
+    with pool.lease("SYS1", "USRAT5") as first:
+        pass
+    monkeypatch.setattr(datasets, "exists", lambda name: name != first)
+    second = pool.acquire("SYS1", "USRAT5")
+    assert second != first
+    with open(lease_file) as leases:
+        assert set(json.load(leases)) == {second}
+
+
+def test_other_live_pool_is_left_alone(created, lease_file):
+    other = WorkDatasetPool({}, lease_file)
+    with other.lease("SYS1", "USRAT5") as first:
+        pass
+    pool = WorkDatasetPool({}, lease_file)
+    assert pool.acquire("SYS1", "USRAT5") != first
+    pool.close()
+    assert first not in datasets.DELETES
+    other.close()
+    assert first in datasets.DELETES
+
+
+def test_adopts_data_set_of_dead_process(pool, created, lease_file):
+    with open(lease_file, "w") as leases:
+        json.dump({"SYS1.T0000001": {"owner": _dead_pid(), "host": os.uname().nodename,
+                                     "hlq": "SYS1", "volume": "USRAT5", "leased": True}},
+                  leases)
+    assert pool.acquire("SYS1", "USRAT5") == "SYS1.T0000001"
+    assert pool.reused == 1
+    assert created == {}
+
+
+def test_close_deletes_own_and_orphaned_data_sets(pool, created, lease_file):
+    with open(lease_file, "w") as leases:
+        json.dump({"SYS1.T0000001": {"owner": _dead_pid(), "host": os.uname().nodename,
+                                     "hlq": "SYS2", "volume": "USRAT5", "leased": False}},
+                  leases)
+    name = pool.acquire("SYS1", "USRAT5")
+    pool.close()
+    assert sorted(datasets.DELETES) == sorted([name, "SYS1.T0000001"])
+    with open(lease_file) as leases:
+        assert json.load(leases) == {}
@@ -0,0 +1,55 @@
+"""Code rights.
+
+Copyright IBM Corp 2026.
+test_zcx_versions.py - check the GLZB022I parser of zcx_versions.py against
+the console output samples in zcx_corpus. expected.json holds the record
+each sample must produce, null for an instance that is not active.
+
+Run with: python3 -m pytest testing/test_zcx_versions.py
+"""
+import json
+import os
+import sys
+
+import pytest
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+CORPUS = os.path.join(HERE, "zcx_corpus")
+sys.path.insert(0, os.path.dirname(HERE))
+
+import zcx_versions  # noqa: E402
+
+with open(os.path.join(CORPUS, "expected.json")) as expected_file:
+    EXPECTED = json.load(expected_file)
+
+
+def _read(sample):
+    with open(os.path.join(CORPUS, sample)) as output:
+        return output.read()
+
+
+@pytest.mark.parametrize("sample", sorted(EXPECTED))
+def test_parse_version(sample):
+    expected = EXPECTED[sample]
+    name = expected["instance"] if expected else "ZCX9"
+    record = zcx_versions.parse_version(name, _read(sample))
+    if expected is None:
+        assert record is None
+    else:
+        assert record._asdict() == expected
+
+
+def test_every_sample_has_an_expected_record():
+    samples = {name for name in os.listdir(CORPUS) if name.endswith(".txt")}
+    assert samples == set(EXPECTED)
+
+
+def test_console_log():
+    # All samples one after the other, as in a captured console log
+    log = []
+    for sample in sorted(EXPECTED):
+        log.extend(_read(sample).splitlines())
+    records = list(zcx_versions.iter_version_messages(log))
+    expected = [EXPECTED[sample] for sample in sorted(EXPECTED)
+                if EXPECTED[sample] and "GLZB022I" in _read(sample)]
+    assert [record._asdict() for record in records] == expected
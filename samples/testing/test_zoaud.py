@@ -0,0 +1,120 @@
+"""Code rights.
+
+Copyright IBM Corp 2026.
+test_zoaud.py - check that zoaud.py and zoau_client.py only use a socket
+of their own user, the answers of the daemon, and the session that shell
+scripts keep open through zoau_session.sh. The daemon runs in a thread
+with the fake zoautil_py.
+
+Run with: python3 -m pytest testing/test_zoaud.py
+"""
+import io
+import os
+import subprocess
+import sys
+import threading
+
+import pytest
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+SAMPLES = os.path.dirname(HERE)
+sys.path.insert(0, os.path.join(HERE, "fakes"))
+sys.path.insert(0, SAMPLES)
+
+import zoau_client  # noqa: E402
+import zoaud  # noqa: E402
+from zoautil_py import datasets, jobs  # noqa: E402
+
+
+@pytest.fixture
+def socket_path(tmp_path):
+    directory = tmp_path / "zoaud"
+    path = str(directory / "zoaud.sock")
+    daemon = zoaud.ZoauDaemon(path)
+    threading.Thread(target=daemon.serve_forever, daemon=True).start()
+    yield path
+    daemon.shutdown()
+    daemon.server_close()
+
+
+def test_daemon_creates_private_directory(socket_path):
+    assert os.stat(os.path.dirname(socket_path)).st_mode & 0o777 == 0o700
+    assert os.stat(socket_path).st_mode & 0o777 == 0o600
+
+
+def test_daemon_refuses_open_directory(tmp_path):
+    os.chmod(tmp_path, 0o755)
+    with pytest.raises(PermissionError, match="mode 755"):
+        zoaud.ZoauDaemon(str(tmp_path / "zoaud.sock"))
+
+
+def test_client_refuses_open_socket(socket_path):
+    os.chmod(socket_path, 0o666)
+    with pytest.raises(PermissionError, match="group or others"):
+        zoau_client.ZoauClient(socket_path)
+
+
+def test_client_refuses_other_file(tmp_path):
+    os.chmod(tmp_path, 0o700)
+    path = tmp_path / "zoaud.sock"
+    path.write_text("")
+    os.chmod(path, 0o600)
+    with pytest.raises(OSError, match="not a socket"):
+        zoau_client.ZoauClient(str(path))
+
+
+def test_jls_active_and_ended(socket_path, monkeypatch):
+    monkeypatch.setattr(jobs, "LATENCY", (3600, 3600))
+    active = jobs.submit("USER.JCL(ACTIVE)")
+    ended = jobs.submit("USER.JCL(ENDED)")
+    ended.status, ended.rc = "CC", 0
+    with zoau_client.ZoauClient(socket_path) as client:
+        assert client.call("jls", active.id) == [f"FAKEUSER ACTIVE {active.id} AC ?"]
+        assert client.call("jls", ended.id) == [f"FAKEUSER ENDED {ended.id} CC 0"]
+
+
+def test_session_answers(socket_path, monkeypatch):
+    monkeypatch.setitem(datasets.MEMBERS, "USER.JCL", ["JOB1", "JOB2"])
+    requests = io.StringIO("mls\tUSER.JCL(*)\nmls\tUSER.EMPTY(*)\nnosuchop\n")
+    output = io.StringIO()
+    with zoau_client.ZoauClient(socket_path) as client:
+        zoau_client.session(client, requests, output)
+    lines = output.getvalue().splitlines()
+    assert lines[:4] == ["ok 2", "JOB1", "JOB2", "ok 0"]
+    assert lines[4] == "error 1"
+    assert "bad request" in lines[5]
+    assert len(lines) == 6
+
+
+def test_shell_session(socket_path):
+    # zoaud.py runs in this process, so the shell sees the fake dtouch and
+    # drm only as data set names in CREATES and DELETES
+    script = (f'. "{SAMPLES}/zoau_session.sh"\n'
+              "zoau_session_start || exit 9\n"
+              'name=`zoau_call mvstmp SYS1`\n'
+              'zoau_call dtouch -tSEQ "$name" || exit 8\n'
+              'zoau_call drm "$name" || exit 7\n'
+              'zoau_call opercmd "d t"\n'
+              "zoau_call nosuchop && exit 6\n"
+              'echo "$name"\n'
+              "zoau_session_end\n")
+    result = subprocess.run(["sh", "-c", script, os.path.join(SAMPLES, "test")],
+                            env=dict(os.environ, ZOAUD_SOCKET=socket_path),
+                            stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True,
+                            timeout=60)
+    assert result.returncode == 0, result.stderr
+    name = result.stdout.splitlines()[-1]
+    assert name.startswith("SYS1.T")
+    assert name in datasets.CREATES
+    assert name in datasets.DELETES
+    assert "nosuchop: " in result.stderr
+
+
+def test_shell_session_without_daemon(tmp_path):
+    script = (f'. "{SAMPLES}/zoau_session.sh"\n'
+              "zoau_session_start && exit 9\n"
+              "zoau_call echo called directly\n")
+    result = subprocess.run(["sh", "-c", script, os.path.join(SAMPLES, "test")],
+                            env=dict(os.environ, ZOAUD_SOCKET=str(tmp_path / "none")),
+                            stdout=subprocess.PIPE, text=True, timeout=60)
+    assert result.stdout == "called directly\n"
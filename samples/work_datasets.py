@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""Code rights.
+
+Copyright IBM Corp 2026.
+work_datasets.py - a pool of work data sets (like SMPWRK6) that are reused
+across program runs instead of being allocated and deleted every time.
+
+Data sets are pooled per high level qualifier and volume. A released data
+set is emptied before it is handed out again, so the pool allocates PDSEs:
+a PDS does not reclaim the space of deleted members until it is compressed
+and would end in an x37 abend after enough reuse. Every data set in the pool
+is recorded in a lease file together with the process that owns it, so
+data sets left behind by a process that died are adopted (or deleted) by
+the next pool that opens the lease file. close() deletes every data set
+the pool owns; it runs at exit unless it was called before.
+"""
+import atexit
+import fcntl
+import json
+import os
+from contextlib import contextmanager
+
+# The data sets of all pools of this user and the process that owns each.
+WORK_POOL_LEASES = os.path.expanduser("~/.zoau_work_pool.json")
+
+
+def _process_alive(entry):
+    """Return True unless the owner of a lease entry is known to be gone"""
+    if entry["host"] != os.uname().nodename:
+        # a process on another system, we cannot tell
+        return True
+    try:
+        os.kill(entry["owner"], 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        pass
+    return True
+
+
+class WorkDatasetPool:
+    """Hand out work data sets, allocating new ones only when none is free.
+
+        pool = WorkDatasetPool({"primary_space": "5M"})
+        with pool.lease("SYS1", "USRAT5") as work_dataset:
+            ...  # run the program with a DD for work_dataset
+        pool.close()
+    """
+
+    def __init__(self, create_options, lease_file=WORK_POOL_LEASES):
+        """
+        Args:
+            create_options (dict): keyword arguments for datasets.create,
+                    except the name and volumes; the type is PDSE
+            lease_file (str): the file that records the pooled data sets
+
+        Raises:
+            ValueError: if create_options asks for another type than PDSE
+        """
+        create_options = dict(create_options)
+        dataset_type = create_options.setdefault("type", "PDSE")
+        if dataset_type.upper() != "PDSE":
+            raise ValueError(
+                f"Work data sets are reused after their members are deleted, "
+                f"which only frees the space of a PDSE, not of a {dataset_type}"
+            )
+        self.create_options = create_options
+        self.lease_file = lease_file
+        self.allocated = 0  # data sets this pool had to create
+        self.reused = 0  # leases served by an existing data set
+        self._owned = set()
+        self._closed = False
+        atexit.register(self.close)
+
+    @contextmanager
+    def _leases(self):
+        """Lock the lease file and yield its entries, saving them afterwards"""
+        with open(self.lease_file + ".lock", "w") as lock:
+            fcntl.lockf(lock, fcntl.LOCK_EX)
+            try:
+                with open(self.lease_file) as lease_file:
+                    leases = json.load(lease_file)
+            except (OSError, ValueError):
+                leases = {}
+            yield leases
+            temp_file = f"{self.lease_file}.{os.getpid()}"
+            with open(temp_file, "w") as lease_file:
+                json.dump(leases, lease_file)
+            os.replace(temp_file, self.lease_file)
+
+    def _owner(self):
+        return {"owner": os.getpid(), "host": os.uname().nodename}
+
+    def acquire(self, hlq, volume):
+        """Lease an empty work data set
+
+        Args:
+            hlq (str): high level qualifier of the data set
+            volume (str): volume the data set has to be on
+
+        Returns:
+            The data set name, give it back with release()
+        """
+        from zoautil_py import datasets, exceptions
+
+        with self._leases() as leases:
+            for name, entry in list(leases.items()):
+                if entry["hlq"] != hlq or entry["volume"] != volume:
+                    continue
+                mine = entry["owner"] == os.getpid() and name in self._owned
+                if mine and entry["leased"]:
+                    continue
+                if not mine and _process_alive(entry):
+                    # another pool's data set, or its owner died while
+                    # leasing it and it can be adopted
+                    continue
+                if not datasets.exists(name):
+                    # deleted behind the pool's back
+                    del leases[name]
+                    continue
+                try:
+                    datasets.delete_members(f"{name}(*)")
+                except exceptions.ZOAUException:
+                    # nothing to delete
+                    pass
+                entry.update(self._owner(), leased=True)
+                self._owned.add(name)
+                self.reused += 1
+                return name
+
+            name = datasets.tmp_name(hlq)
+            datasets.create(name, volumes=volume, **self.create_options)
+            leases[name] = dict(self._owner(), hlq=hlq, volume=volume, leased=True)
+            self._owned.add(name)
+            self.allocated += 1
+            return name
+
+    def release(self, name):
+        """Return a data set to the pool, it is emptied when leased again"""
+        with self._leases() as leases:
+            if name in leases:
+                leases[name]["leased"] = False
+
+    @contextmanager
+    def lease(self, hlq, volume):
+        """acquire() a data set for the duration of a with block"""
+        name = self.acquire(hlq, volume)
+        try:
+            yield name
+        finally:
+            self.release(name)
+
+    def close(self):
+        """Delete the data sets of this pool and of pools whose process died"""
+        from zoautil_py import datasets, exceptions
+
+        if self._closed:
+            return
+        self._closed = True
+        with self._leases() as leases:
+            for name, entry in list(leases.items()):
+                mine = entry["owner"] == os.getpid() and name in self._owned
+                if mine or not _process_alive(entry):
+                    try:
+                        datasets.delete(name)
+                    except exceptions.ZOAUException:
+                        # already gone
+                        pass
+                    del leases[name]
+        self._owned.clear()
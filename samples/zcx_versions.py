@@ -4,7 +4,19 @@
 # about any running zCX instances.  Print a message if a given instance
 # is backlevel and can be upgraded. Requires Python and ZOAU.
 #
-# Usage: python3 zcx_versions.py -p <ZCX_REGISTRY_PATH>
+# Usage: python3 zcx_versions.py -p <ZCX_REGISTRY_PATH> [-j <CONCURRENCY>]
+#
+# With -j greater than 1 the instances are queried concurrently.
+#
+# The scan can also be used from other Python code:
+#
+#   import zcx_versions
+#   for record in zcx_versions.scan("/global/zcx/instances", concurrency=8):
+#       print(record.instance, record.current_version, record.upgradeable)
+#
+# Results are cached per instance (see --cache-ttl), and an instance is
+# queried again once the cache entry expires or its registry directory
+# changes.
 #
 # Anthony Giorgio <agiorgio@us.ibm.com>
 #
@@ -12,11 +24,35 @@
 #
 
 import argparse
+import json
 import os
+import re
 import subprocess
 import sys
+import time
+from typing import NamedTuple, Optional
+
+OPERCMD = "/usr/lpp/IBM/zoautil/bin/opercmd"
+CACHE_FILE = os.path.expanduser("~/.zcx_versions_cache.json")
+
+# Patterns for the lines of the GLZB022I message block. Lines that match
+# none of them (console prefixes, interleaved messages) are skipped.
+_MESSAGE_START = re.compile(r"GLZB022I(?:.*?\binstance\s+([A-Z0-9$#@]{1,8})\b)?", re.I)
+_APPLIANCE = re.compile(r"\b(Current|Available)\s+Appliance\b(?:.*?\b([A-Z]{2}\d{5})\b)?", re.I)
+_VERSION = re.compile(r"\bVersion:?\s+(\d+(?:\.\d+)+)", re.I)
+
+
+class ZcxVersion(NamedTuple):
+    # Version information of one running zCX instance. If the instance
+    # could not be queried, error holds the reason and the rest is None.
+    instance: str
+    current_apar: Optional[str] = None
+    current_version: Optional[str] = None
+    available_apar: Optional[str] = None
+    available_version: Optional[str] = None
+    upgradeable: bool = False
+    error: Optional[str] = None
 
-opercmd = "/usr/lpp/IBM/zoautil/bin/opercmd"
 
 def parse_args(argv=None):
     program_name = os.path.basename(sys.argv[0])
@@ -32,6 +68,16 @@ def parse_args(argv=None):
         parser.add_argument("-u", "--upgradeable-only", action='store_true',
                             help="Show only zCX instances that can be upgraded.")
         parser.add_argument("-z", "--zoau-path", help="Path to zoau install directory.")
+        parser.add_argument("-j", "--concurrency", type=int, default=1,
+                            help="Number of instances to query at the same time.")
+        parser.add_argument("-t", "--timeout", type=float, default=5,
+                            help="Seconds to wait for each instance to answer.")
+        parser.add_argument("-c", "--cache-ttl", type=float, default=0,
+                            help="Reuse results younger than this many seconds.")
+        parser.add_argument("--cache-file", default=CACHE_FILE,
+                            help="File that holds the cached results.")
+        parser.add_argument("--json", action='store_true',
+                            help="Print the results as JSON.")
 
         opts = parser.parse_args(argv)
 
@@ -44,75 +90,235 @@ def parse_args(argv=None):
         sys.exit(1)
 
 
-# Main code starts here
+def candidate_instances(registry_path):
+    # Every directory with a name of up to 8 characters may be an instance.
+    # Returns a dictionary of name to the modification time of the directory.
+    candidates = {}
+    with os.scandir(path=registry_path) as it:
+        for entry in it:
+            if entry.is_dir():
+                if len(entry.name) > 8:
+                    # It can't be an instance directory as the name is too long.
+                    continue
+                candidates[entry.name] = entry.stat().st_mtime
+    return candidates
 
-cli_opts = parse_args()
-registry_path = cli_opts.zcx_registry_path
 
-if registry_path is None:
-    print("No registry path specified.")
-    sys.exit(1)
+def version_command(name, opercmd=OPERCMD):
+    return [opercmd, "f {0},display,version".format(name)]
 
-if cli_opts.zoau_path is not None:
-    opercmd = "{0}/bin/opercmd".format(cli_opts.zoau_path)
-    print("Using opercmd at {0}".format(opercmd))
 
-if not os.path.isfile(opercmd):
-    print("Not found: {0}".format(opercmd))
-    exit(1)
+def query_instance(name, opercmd=OPERCMD, timeout=5):
+    # Returns (name, output, error), only one of output and error is set.
+    try:
+        result = subprocess.run(version_command(name, opercmd), stdout=subprocess.PIPE,
+                                stderr=subprocess.PIPE, timeout=timeout, check=True)
+        return name, result.stdout.decode(), None
+    except subprocess.CalledProcessError as e:
+        return name, None, e.stdout.decode()
+    except subprocess.TimeoutExpired:
+        return name, None, "Timeout expired"
 
-print("Looking for running zCX instances in directory {0}".format(registry_path))
 
-with os.scandir(path=registry_path) as it:
-    for entry in it:
-        if entry.is_dir():
-            if len(entry.name) > 8:
-                # It can't be an instance directory as the name is too long.
-                continue
+async def query_instance_async(name, semaphore, opercmd=OPERCMD, timeout=5):
+    # Same as query_instance, but at most as many run as the semaphore allows.
+    import asyncio
 
-            try:
-                # See if the directory name corresponds to a running zCX instance.
-                result = subprocess.check_output("{0} 'f {1},display,version'".format(opercmd, entry.name),
-                                                  shell=True, stderr=subprocess.PIPE, timeout=5)
+    async with semaphore:
+        process = await asyncio.create_subprocess_exec(
+            *version_command(name, opercmd), stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE)
+        try:
+            stdout, _ = await asyncio.wait_for(process.communicate(), timeout)
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+            return name, None, "Timeout expired"
+    if process.returncode != 0:
+        return name, None, stdout.decode()
+    return name, stdout.decode(), None
 
-                if ("NOT ACTIVE" in result.decode()):
-                    continue
 
-                # If it's running, parse out the version information.
-                lines = result.decode().splitlines()
+async def scan_async(names, concurrency, opercmd=OPERCMD, timeout=5):
+    # Query all instances, collecting the results as they complete.
+    import asyncio
 
-                msg_start_idx = None
-                for i in range(0,len(lines)):
-                    if "GLZB022I" in lines[i]:
-                        msg_start_idx = i
+    semaphore = asyncio.Semaphore(concurrency)
+    queries = [query_instance_async(name, semaphore, opercmd, timeout) for name in names]
+    results = []
+    for finished in asyncio.as_completed(queries):
+        results.append(await finished)
+    return results
 
-                if msg_start_idx is None:
-                    print("Unable to parse version message.")
-                    continue
 
-                apar_offset = 3
-                version_offset = 1
-
-                if "Current Appliance" in lines[msg_start_idx + 3]:
-                    current_apar = lines[msg_start_idx + 3].split()[apar_offset]
-                    current_version = lines[msg_start_idx + 4].split()[version_offset]
-                    available_apar = lines[msg_start_idx + 6].split()[apar_offset]
-                    available_version = lines[msg_start_idx + 7].split()[version_offset]
-
-                    if (current_version != available_version):
-                        print("Instance {0} is version {1} ({2}) and can be upgraded to {3} ({4})"
-                              .format(entry.name.ljust(8), current_version, current_apar,
-                                      available_version, available_apar))
-                    else:
-                        if not cli_opts.upgradeable_only:
-                            print("Instance {0} is version {1} ({2})".format(entry.name.ljust(8),
-                                                                             current_version, current_apar))
-
-                else:
-                    print("Unable to find current instance version.")
-                    continue
+def iter_version_messages(lines, name=None):
+    # Find GLZB022I message blocks in console output and yield a ZcxVersion
+    # for each, in one pass. The APAR of an appliance is on its Current or
+    # Available Appliance line, the version is on that line or on the next
+    # Version line. A block ends once both versions have been found, or
+    # when the next GLZB022I starts. name is used when the message does not
+    # name the instance.
+    block = None
+    pending = None  # the appliance ("current" or "available") awaiting a version
+    for line in lines:
+        if "GLZB022I" in line:
+            if block is not None:
+                yield _block_version(block)
+            match = _MESSAGE_START.search(line)
+            block = {"instance": match.group(1) or name}
+            pending = None
+            continue
+        if block is None:
+            continue
+
+        # The substring tests skip the regex on most other lines
+        appliance = _APPLIANCE.search(line) if "ppliance" in line else None
+        if appliance is not None:
+            pending = appliance.group(1).lower()
+            if appliance.group(2):
+                block[pending + "_apar"] = appliance.group(2)
+        if pending is None or "ersion" not in line:
+            continue
+        version = _VERSION.search(line)
+        if version is not None:
+            block[pending + "_version"] = version.group(1)
+            pending = None
+            if "current_version" in block and "available_version" in block:
+                yield _block_version(block)
+                block = None
+
+    if block is not None:
+        yield _block_version(block)
+
+
+def _block_version(block):
+    if "current_version" not in block:
+        return ZcxVersion(block["instance"], error="Unable to find current instance version.")
+    available_version = block.get("available_version")
+    return ZcxVersion(block["instance"], block.get("current_apar"), block["current_version"],
+                      block.get("available_apar"), available_version,
+                      available_version is not None
+                      and available_version != block["current_version"])
+
+
+def parse_version(name, output):
+    # Turn the output of the display version command into a ZcxVersion.
+    # Returns None if the instance is not active.
+    if ("NOT ACTIVE" in output):
+        return None
+
+    for record in iter_version_messages(output.splitlines(), name):
+        return record._replace(instance=name)
+    return ZcxVersion(name, error="Unable to parse version message.")
+
+
+def _load_cache(cache_file):
+    try:
+        with open(cache_file) as cache:
+            return json.load(cache)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_cache(cache_file, cache):
+    temp_file = "{0}.{1}".format(cache_file, os.getpid())
+    with open(temp_file, "w") as out:
+        json.dump(cache, out)
+    os.replace(temp_file, cache_file)
+
+
+def scan(registry_path, opercmd=OPERCMD, concurrency=1, timeout=5,
+         cache_ttl=0, cache_file=CACHE_FILE):
+    # Return a ZcxVersion for every running instance in the registry,
+    # sorted by instance name.
+    #
+    # With cache_ttl greater than 0 results are cached per instance in
+    # cache_file. A cached result is used while it is younger than cache_ttl
+    # seconds and the registry directory of the instance has not changed.
+    candidates = candidate_instances(registry_path)
+    now = time.time()
+    cache = _load_cache(cache_file) if cache_ttl > 0 else {}
+
+    records = {}
+    to_query = []
+    for name, mtime in candidates.items():
+        entry = cache.get(name)
+        if entry is not None and entry["mtime"] == mtime and now - entry["time"] < cache_ttl:
+            records[name] = ZcxVersion(**entry["record"]) if entry["record"] else None
+        else:
+            to_query.append(name)
+
+    if concurrency > 1:
+        import asyncio
+
+        results = asyncio.run(scan_async(to_query, concurrency, opercmd, timeout))
+    else:
+        # See if each directory name corresponds to a running zCX instance.
+        results = [query_instance(name, opercmd, timeout) for name in sorted(to_query)]
+
+    for name, output, error in results:
+        if error is not None:
+            records[name] = ZcxVersion(name, error=error)
+            continue
+        records[name] = parse_version(name, output)
+        if records[name] is None or records[name].error is None:
+            record = records[name]._asdict() if records[name] else None
+            cache[name] = {"mtime": candidates[name], "time": now, "record": record}
+
+    if cache_ttl > 0:
+        # forget instances that are gone from the registry
+        _save_cache(cache_file, {name: entry for name, entry in cache.items()
+                                 if name in candidates})
+
+    return [records[name] for name in sorted(records) if records[name] is not None]
+
+
+def report_instance(record, upgradeable_only):
+    if record.error is not None:
+        print(record.error)
+    elif record.upgradeable:
+        print("Instance {0} is version {1} ({2}) and can be upgraded to {3} ({4})"
+              .format(record.instance.ljust(8), record.current_version, record.current_apar,
+                      record.available_version, record.available_apar))
+    elif not upgradeable_only:
+        print("Instance {0} is version {1} ({2})".format(record.instance.ljust(8),
+                                                         record.current_version,
+                                                         record.current_apar))
+
+
+def main():
+    cli_opts = parse_args()
+    registry_path = cli_opts.zcx_registry_path
+
+    if registry_path is None:
+        print("No registry path specified.")
+        sys.exit(1)
+
+    opercmd = OPERCMD
+    if cli_opts.zoau_path is not None:
+        opercmd = "{0}/bin/opercmd".format(cli_opts.zoau_path)
+        if not cli_opts.json:
+            print("Using opercmd at {0}".format(opercmd))
+
+    if not os.path.isfile(opercmd):
+        print("Not found: {0}".format(opercmd))
+        exit(1)
+
+    if not cli_opts.json:
+        print("Looking for running zCX instances in directory {0}".format(registry_path))
+
+    records = scan(registry_path, opercmd, cli_opts.concurrency, cli_opts.timeout,
+                   cli_opts.cache_ttl, cli_opts.cache_file)
+
+    if cli_opts.json:
+        if cli_opts.upgradeable_only:
+            records = [record for record in records if record.upgradeable]
+        print(json.dumps([record._asdict() for record in records], indent=2))
+        return
+
+    for record in records:
+        report_instance(record, cli_opts.upgradeable_only)
+
 
-            except subprocess.CalledProcessError as e:
-                print(e.stdout.decode())
-            except subprocess.TimeoutExpired as e:
-                print("Timeout expired")
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""Code rights.
+
+Copyright IBM Corp 2026.
+zoau_client.py - talk to a running zoaud.py daemon, from Python or from a
+shell script.
+
+From Python, a ZoauClient keeps one connection open and can send many
+requests before reading the answers:
+
+    with ZoauClient() as client:
+        members = client.call("mls", "USER.JCL(*)")
+        counts = client.pipeline([("mls", [f"{ds}(*)"]) for ds in libraries])
+
+From a shell, run a single operation, or give "-" and write one operation
+per line to stdin to have all of them sent over one connection:
+
+    zoau_client.py jls JOB00042
+    printf 'mls USER.JCL(*)\\nmls USER.PROCLIB(*)\\n' | zoau_client.py -
+
+Results are printed in request order, a list one item per line. The exit
+code is 1 if any operation failed, 2 if the daemon cannot be reached.
+
+Every run of zoau_client.py starts Python, which costs more than the
+utility it replaces, so a shell script that makes many calls keeps one
+client running in --session mode instead (see zoau_session.sh). It reads
+one operation per line, with the op and its arguments separated by tabs,
+and answers each with a line "ok COUNT" or "error COUNT" followed by COUNT
+lines of output. The first line it writes is "ready", or the reason the
+daemon cannot be reached.
+"""
+import json
+import os
+import shlex
+import socket
+import stat
+import sys
+
+from zoaud import SOCKET_PATH, check_owner
+
+
+class ZoauDaemonError(Exception):
+    """An operation failed in the daemon"""
+
+
+class ZoauClient:
+    """A connection to zoaud.py"""
+
+    def __init__(self, path=SOCKET_PATH):
+        """
+        Raises:
+            PermissionError: the socket or its directory belongs to another
+                user or is open to others, see zoaud.check_owner
+            OSError: the daemon cannot be reached
+        """
+        check_owner(os.path.dirname(os.path.abspath(path)))
+        check_owner(path)
+        if not stat.S_ISSOCK(os.stat(path).st_mode):
+            raise OSError(f"{path} is not a socket")
+        self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self._socket.connect(path)
+        self._file = self._socket.makefile("rwb")
+        self._next_id = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        self._file.close()
+        self._socket.close()
+
+    def _send(self, op, args):
+        self._next_id += 1
+        request = {"id": self._next_id, "op": op, "args": list(args)}
+        self._file.write(json.dumps(request).encode() + b"\n")
+
+    def _receive(self):
+        line = self._file.readline()
+        if not line:
+            raise ConnectionError("zoaud closed the connection")
+        return json.loads(line)
+
+    def pipeline(self, requests, window=64):
+        """Send (op, args) requests without waiting for each answer
+
+        At most window requests are outstanding at a time, so neither
+        side blocks on a full socket buffer.
+
+        Returns:
+            A response dictionary per request, in order, with "ok" and
+            either "result" or "error"
+        """
+        responses = []
+        outstanding = 0
+        for op, args in requests:
+            self._send(op, args)
+            outstanding += 1
+            if outstanding >= window:
+                self._file.flush()
+                responses.append(self._receive())
+                outstanding -= 1
+        self._file.flush()
+        for _ in range(outstanding):
+            responses.append(self._receive())
+        return responses
+
+    def call(self, op, *args):
+        """Run one operation and return its result
+
+        Raises:
+            ZoauDaemonError: the operation failed
+        """
+        response = self.pipeline([(op, args)])[0]
+        if not response["ok"]:
+            raise ZoauDaemonError(response["error"])
+        return response["result"]
+
+
+def _result_lines(result):
+    """Return the lines a result is printed as"""
+    if result is None:
+        return []
+    if isinstance(result, list):
+        return [str(item) for item in result]
+    if isinstance(result, str):
+        return result.rstrip("\n").split("\n")
+    return [json.dumps(result)]
+
+
+def _print_result(result):
+    for line in _result_lines(result):
+        print(line)
+
+
+def session(client, requests, output):
+    """Answer the tab separated operations in requests one at a time
+
+    Each answer is flushed before the next request is read, so a shell
+    script can write a request and read its answer from a pair of FIFOs.
+    """
+    for line in requests:
+        op, *args = line.rstrip("\n").split("\t")
+        if not op:
+            continue
+        response = client.pipeline([(op, args)])[0]
+        if response["ok"]:
+            lines = _result_lines(response["result"])
+            output.write(f"ok {len(lines)}\n")
+        else:
+            lines = [response["error"]]
+            output.write("error 1\n")
+        output.writelines(f"{item}\n" for item in lines)
+        output.flush()
+
+
+def main():
+    if len(sys.argv) < 2:
+        sys.exit("Usage: zoau_client.py <op> [args...] | zoau_client.py - | "
+                 "zoau_client.py --session")
+    if sys.argv[1] == "--session":
+        try:
+            client = ZoauClient(os.environ.get("ZOAUD_SOCKET") or SOCKET_PATH)
+        except OSError as error:
+            print(f"cannot reach zoaud: {error}", flush=True)
+            sys.exit(2)
+        with client:
+            print("ready", flush=True)
+            session(client, sys.stdin, sys.stdout)
+        sys.exit(0)
+    if sys.argv[1] == "-":
+        requests = [shlex.split(line) for line in sys.stdin if line.strip()]
+    else:
+        requests = [sys.argv[1:]]
+
+    try:
+        client = ZoauClient(os.environ.get("ZOAUD_SOCKET") or SOCKET_PATH)
+    except OSError as error:
+        sys.stderr.write(f"zoau_client.py: cannot reach zoaud: {error}\n")
+        sys.exit(2)
+
+    failed = False
+    with client:
+        responses = client.pipeline((request[0], request[1:]) for request in requests)
+    for response in responses:
+        if response["ok"]:
+            _print_result(response["result"])
+        else:
+            failed = True
+            sys.stderr.write(f"zoau_client.py: {response['error']}\n")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+#!/bin/sh
+#
+# Functions for shell scripts that make many ZOAU calls, to be sourced:
+#
+#     . "$(dirname "$0")/zoau_session.sh"
+#     zoau_session_start
+#     members=`zoau_call mls "USER.JCL(*)"`
+#     zoau_session_end
+#
+# If ZOAUD_SOCKET names the socket of a running zoaud.py, zoau_session_start
+# starts one zoau_client.py --session in the background and zoau_call sends
+# every operation through it, so no process is started per call. Otherwise
+# zoau_call runs the ZOAU utility itself, so scripts work without the daemon.
+# zoau_call supports the operations of zoaud.py: dls, mls, jls, opercmd,
+# mvstmp, dtouch (with an optional -tTYPE before the name) and drm.
+#
+# Copyright IBM Corp 2026.
+#
+
+zoau_session_mydir=$(cd "$(dirname "$0")" && pwd)
+zoau_session=''
+
+zoau_session_start() {
+	if [ ! -S "${ZOAUD_SOCKET}" ]; then
+		return 1
+	fi
+	zoau_session_dir="${TMPDIR:-/tmp}/zoau_session.$$"
+	mkdir -m 700 "${zoau_session_dir}" || return 1
+	mkfifo "${zoau_session_dir}/requests" "${zoau_session_dir}/responses" || return 1
+	python3 "${zoau_session_mydir}/zoau_client.py" --session \
+		<"${zoau_session_dir}/requests" >"${zoau_session_dir}/responses" &
+	exec 3>"${zoau_session_dir}/requests" 4<"${zoau_session_dir}/responses"
+	# both ends are open, the FIFOs are not needed any more
+	rm -r "${zoau_session_dir}"
+	read -r zoau_ready <&4
+	if [ "${zoau_ready}" != 'ready' ]; then
+		echo "zoau_session.sh: ${zoau_ready:-zoau_client.py did not start}" >&2
+		exec 3>&- 4<&-
+		return 1
+	fi
+	zoau_session=1
+	return 0
+}
+
+zoau_session_end() {
+	if [ "${zoau_session}" != '' ]; then
+		exec 3>&- 4<&-
+		zoau_session=''
+		wait
+	fi
+}
+
+zoau_call() {
+	if [ "${zoau_session}" = '' ]; then
+		"$@"
+		return $?
+	fi
+	zoau_op="$1"
+	shift
+	if [ "${zoau_op}" = 'dtouch' ] && [ "${1#-t}" != "$1" ]; then
+		# dtouch -tSEQ NAME is dtouch NAME SEQ for the daemon
+		zoau_type="${1#-t}"
+		shift
+		set -- "$@" "${zoau_type}"
+	fi
+	# one request per line, the op and its arguments separated by tabs
+	if [ $# -eq 0 ]; then
+		printf '%s\n' "${zoau_op}" >&3
+	else
+		(IFS='	'; printf '%s\n' "${zoau_op}	$*") >&3
+	fi
+	if ! read -r zoau_status zoau_count <&4; then
+		echo "zoau_session.sh: zoau_client.py ended" >&2
+		return 2
+	fi
+	while [ "${zoau_count}" -gt 0 ]; do
+		IFS= read -r zoau_line <&4
+		if [ "${zoau_status}" = 'ok' ]; then
+			printf '%s\n' "${zoau_line}"
+		else
+			printf '%s: %s\n' "${zoau_op}" "${zoau_line}" >&2
+		fi
+		zoau_count=$((zoau_count-1))
+	done
+	[ "${zoau_status}" = 'ok' ]
+}
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""Code rights.
+
+Copyright IBM Corp 2026.
+zoaud.py - a long lived process that runs ZOAU operations for shell scripts
+and other programs, so that they do not start a new dls, mls, jls,
+opercmd, mvstmp, dtouch or drm process for every item.
+
+The daemon listens on a Unix socket in a directory that only its user can
+use, ~/.zoaud unless ZOAUD_SOCKET or --socket names another socket. Each line
+a client sends is a JSON request, and the daemon answers each one with a
+JSON line in the same order:
+
+    {"id": 1, "op": "mls", "args": ["USER.JCL(*)"]}
+    {"id": 1, "ok": true, "result": ["JOB1", "JOB2"]}
+
+A connection stays open for as many requests as the client sends, and a
+client may send further requests before the answers to earlier ones have
+arrived (pipelining). Use zoau_client.py to talk to it.
+
+Usage: zoaud.py [--socket PATH] &
+"""
+import argparse
+import json
+import os
+import signal
+import socket
+import socketserver
+import stat
+import sys
+
+# The socket clients connect to, unless ZOAUD_SOCKET names another one
+SOCKET_PATH = os.environ.get("ZOAUD_SOCKET") or os.path.expanduser("~/.zoaud/zoaud.sock")
+
+
+def check_owner(path):
+    """Make sure path belongs to this user and is closed to everybody else
+
+    A socket that someone else could have put there, or that others can
+    connect to, would hand them the operations of this user.
+
+    Raises:
+        PermissionError: path is owned by another user or open to the
+            group or others
+    """
+    status = os.stat(path)
+    if status.st_uid != os.getuid():
+        raise PermissionError(f"{path} is owned by uid {status.st_uid}, not by this user")
+    if stat.S_IMODE(status.st_mode) & 0o077:
+        raise PermissionError(
+            f"{path} has mode {stat.S_IMODE(status.st_mode):o}, it must not be "
+            "open to the group or others")
+
+
+def _dls(pattern):
+    from zoautil_py import datasets
+
+    return datasets.list_dataset_names(pattern)
+
+
+def _mls(pattern):
+    from zoautil_py import datasets
+
+    return datasets.list_members(pattern)
+
+
+def _jls(job_id=None):
+    from zoautil_py import jobs
+
+    # the columns jls prints: owner, name, id, status, rc ("?" while active)
+    return [f"{job.owner} {job.name} {job.id} {job.status} {'?' if job.rc is None else job.rc}"
+            for job in jobs.fetch_multiple(job_id=job_id)]
+
+
+def _opercmd(command):
+    from zoautil_py import opercmd
+
+    return opercmd.execute(command).to_dict()["stdout_response"]
+
+
+def _mvstmp(high_level_qualifier=None):
+    from zoautil_py import datasets
+
+    return datasets.tmp_name(high_level_qualifier)
+
+
+def _dtouch(name, dataset_type="SEQ"):
+    from zoautil_py import datasets
+
+    datasets.create(name, type=dataset_type)
+
+
+def _drm(name):
+    from zoautil_py import datasets
+
+    datasets.delete(name)
+
+
+# op -> function that runs it, named after the ZOAU utility it replaces
+OPERATIONS = {
+    "ping": lambda: "pong",
+    "dls": _dls,
+    "mls": _mls,
+    "jls": _jls,
+    "opercmd": _opercmd,
+    "mvstmp": _mvstmp,
+    "dtouch": _dtouch,
+    "drm": _drm,
+}
+
+
+def handle_request(line):
+    """Run the request in one JSON line and return the response dictionary"""
+    try:
+        request = json.loads(line)
+        operation = OPERATIONS[request["op"]]
+    except (ValueError, KeyError, TypeError) as error:
+        return {"id": None, "ok": False, "error": f"bad request: {error!r}"}
+    try:
+        result = operation(*request.get("args", []), **request.get("kwargs", {}))
+    except Exception as error:
+        return {"id": request.get("id"), "ok": False, "error": repr(error)}
+    return {"id": request.get("id"), "ok": True, "result": result}
+
+
+class _ConnectionHandler(socketserver.BaseRequestHandler):
+    """Answer the requests of one client until it disconnects
+
+    All requests that arrive together are answered with a single send, so
+    a pipelining client gets its answers in few large writes.
+    """
+
+    def handle(self):
+        pending = b""
+        while True:
+            data = self.request.recv(65536)
+            if not data:
+                break
+            *lines, pending = (pending + data).split(b"\n")
+            responses = [json.dumps(handle_request(line)).encode() + b"\n"
+                         for line in lines if line.strip()]
+            if responses:
+                self.request.sendall(b"".join(responses))
+
+
+class ZoauDaemon(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Serve every connection in its own thread"""
+
+    daemon_threads = True
+
+    def __init__(self, path=SOCKET_PATH):
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        check_owner(directory)
+        if os.path.exists(path):
+            # a socket left behind by a daemon that died; refuse to take
+            # over one that still answers
+            probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            try:
+                probe.connect(path)
+                probe.close()
+                sys.exit(f"zoaud is already running on {path}")
+            except OSError:
+                os.remove(path)
+        old_umask = os.umask(0o177)
+        try:
+            super().__init__(path, _ConnectionHandler)
+        finally:
+            os.umask(old_umask)
+        self.path = path
+
+    def server_close(self):
+        super().server_close()
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Run ZOAU operations for clients that connect to a Unix socket."
+    )
+    parser.add_argument("--socket", default=SOCKET_PATH,
+                        help=f"the socket to listen on, default {SOCKET_PATH}")
+    args = parser.parse_args()
+
+    # leave through the with block on kill, so the socket is removed
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    with ZoauDaemon(args.socket) as daemon:
+        try:
+            daemon.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()